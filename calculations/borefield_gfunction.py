@@ -92,7 +92,8 @@ class BorefieldCalculator:
         # Statistiken berechnen
         num_boreholes = len(boreField)
         total_depth = num_boreholes * borehole_depth
-        field_area = self._calculate_field_area(boreField)
+        x_coords, y_coords = self.get_coordinate_arrays(boreField)
+        field_area = self._calculate_field_area(x_coords, y_coords)
         
         print(f"✅ g-Funktion berechnet!")
         print(f"   Anzahl Bohrungen: {num_boreholes}")
@@ -101,6 +102,8 @@ class BorefieldCalculator:
         
         return {
             "boreField": boreField,
+            "x_coords": x_coords,
+            "y_coords": y_coords,
             "gFunction": gFunc,
             "time": time,
             "num_boreholes": num_boreholes,
@@ -201,45 +204,40 @@ class BorefieldCalculator:
         
         if resolution == "hourly":
             # Stündlich für erstes Jahr, dann monatlich für Rest
-            t1 = np.array([i * seconds_per_hour for i in range(1, 8760)])  # Jahr 1
-            t2 = np.array([
-                seconds_per_year + i * seconds_per_month 
-                for i in range(1, (years - 1) * 12)
-            ])
+            t1 = np.arange(1, 8760) * seconds_per_hour  # Jahr 1
+            t2 = seconds_per_year + np.arange(1, (years - 1) * 12) * seconds_per_month
             time = np.concatenate([t1, t2]) if years > 1 else t1
         
         elif resolution == "daily":
             # Täglich
-            time = np.array([i * seconds_per_day for i in range(1, int(years * 365))])
+            time = np.arange(1, int(years * 365)) * seconds_per_day
         
         else:  # monthly (Standard)
             # Monatlich
-            time = np.array([i * seconds_per_month for i in range(1, years * 12)])
+            time = np.arange(1, years * 12) * seconds_per_month
         
         return time
     
-    def _calculate_field_area(self, boreField) -> float:
+    def _calculate_field_area(self, x_coords: np.ndarray, y_coords: np.ndarray) -> float:
         """
         Berechnet Fläche des Bohrfelds (m²).
         
         Args:
-            boreField: pygfunction Bohrfeld-Objekt
+            x_coords: X-Koordinaten aller Bohrungen (m)
+            y_coords: Y-Koordinaten aller Bohrungen (m)
         
         Returns:
             Fläche in m²
         """
-        x_coords = [b.x for b in boreField]
-        y_coords = [b.y for b in boreField]
-        
-        width = max(x_coords) - min(x_coords)
-        height = max(y_coords) - min(y_coords)
+        width = np.ptp(x_coords)
+        height = np.ptp(y_coords)
         
         # Füge etwas Rand hinzu für realistischere Fläche
         margin = 3.0  # 3m Rand
         width += 2 * margin
         height += 2 * margin
         
-        return width * height if (width > 0 and height > 0) else 0.0
+        return float(width * height) if (width > 0 and height > 0) else 0.0
     
     def calculate_required_boreholes(
         self,
@@ -292,6 +290,19 @@ class BorefieldCalculator:
             "required_length": required_length
         }
     
+    def get_coordinate_arrays(self, boreField) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extrahiert X- und Y-Koordinaten aller Bohrungen als Arrays.
+        
+        Args:
+            boreField: pygfunction Bohrfeld-Objekt
+        
+        Returns:
+            Tupel (x, y) mit je einem float64-Array
+        """
+        coords = np.array([(b.x, b.y) for b in boreField], dtype=np.float64).reshape(-1, 2)
+        return coords[:, 0], coords[:, 1]
+    
     def get_borehole_coordinates(self, boreField) -> List[Tuple[float, float]]:
         """
         Extrahiert X,Y Koordinaten aller Bohrungen.
@@ -302,7 +313,8 @@ class BorefieldCalculator:
         Returns:
             Liste von (x, y) Tupeln
         """
-        return [(b.x, b.y) for b in boreField]
+        x_coords, y_coords = self.get_coordinate_arrays(boreField)
+        return list(zip(x_coords.tolist(), y_coords.tolist()))
     
     def is_available(self) -> bool:
         """Prüft ob pygfunction verfügbar ist."""
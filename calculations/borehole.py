@@ -1,15 +1,16 @@
 """Hauptberechnungsmodul für Erdwärmesonden-Dimensionierung."""
 
 import math
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from .thermal import ThermalResistanceCalculator
 from .g_functions import GFunctionCalculator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoreholeResult:
-    """Ergebnis einer Erdwärmesonden-Berechnung."""
+    """Ergebnis einer Erdwärmesonden-Berechnung (unveränderlich; Änderungen über dataclasses.replace)."""
     required_depth: float  # m
     fluid_temperature_min: float  # °C
     fluid_temperature_max: float  # °C
@@ -20,7 +21,12 @@ class BoreholeResult:
     
     def __post_init__(self):
         if self.monthly_temperatures is None:
-            self.monthly_temperatures = [0.0] * 12
+            object.__setattr__(self, 'monthly_temperatures', [0.0] * 12)
+    
+    @property
+    def monthly_temperature_array(self) -> np.ndarray:
+        """Monatliche Temperaturen als zusammenhängendes float64-Array (°C)."""
+        return np.asarray(self.monthly_temperatures, dtype=np.float64)
 
 
 class BoreholeCalculator:
@@ -36,6 +42,10 @@ class BoreholeCalculator:
         self.thermal_calc = ThermalResistanceCalculator()
         self.g_calc = GFunctionCalculator()
     
+    def warmup(self) -> None:
+        """Kompiliert JIT-Kernel vorab, damit die erste Berechnung nicht wartet."""
+        self.g_calc.warmup()
+    
     def calculate_required_depth(
         self,
         # Bodeneigenschaften
@@ -289,29 +299,23 @@ class BoreholeCalculator:
         borehole_radius: float
     ) -> List[float]:
         """Berechnet monatliche durchschnittliche Fluidtemperaturen."""
-        monthly_temps = []
-        
         # Zeit pro Monat (vereinfacht)
         seconds_per_month = 30.44 * 24 * 3600
         
-        for month in range(12):
-            # Monatliche Last
-            monthly_load = annual_load * (heating_factors[month] - cooling_factors[month])
-            
-            # Zeit (Mitte des Monats)
-            time = (month + 0.5) * seconds_per_month
-            
-            # g-Wert
-            g = self.g_calc.interpolate_g(time, depth, thermal_diffusivity)
-            
-            # Temperaturänderung
-            delta_T = self.g_calc.calculate_temperature_penalty(
-                monthly_load, thermal_conductivity, depth, g
-            )
-            
-            # Monatliche Temperatur
-            temp = avg_ground_temp + delta_T
-            monthly_temps.append(round(temp, 2))
+        # Monatliche Lasten
+        monthly_loads = annual_load * (np.asarray(heating_factors) - np.asarray(cooling_factors))
+        
+        # Zeit (Mitte des Monats)
+        times = (np.arange(12) + 0.5) * seconds_per_month
+        
+        # g-Werte und Temperaturänderungen für alle Monate auf einmal
+        g = self.g_calc.interpolate_g_array(times, depth, thermal_diffusivity)
+        delta_T = self.g_calc.calculate_temperature_penalty_series(
+            monthly_loads, thermal_conductivity, depth, g
+        )
+        
+        # Monatliche Temperaturen
+        monthly_temps = [round(float(temp), 2) for temp in avg_ground_temp + delta_T]
         
         return monthly_temps
 
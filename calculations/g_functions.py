@@ -1,10 +1,83 @@
 """G-Funktionen Berechnungen für Erdwärmesonden nach Eskilson."""
 
+import os
 import numpy as np
 import math
 from typing import List, Tuple
 from scipy import interpolate
 
+# Optional: Numba für JIT-kompilierte Kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Ersatz-Dekorator ohne Numba: gibt die Funktion unverändert zurück."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Optional: numexpr für große Array-Ausdrücke (mehrere Threads, blockweise)
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count() or 1)
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Ab dieser Array-Größe lohnt sich numexpr gegenüber NumPy
+NUMEXPR_THRESHOLD = 50_000
+
+
+@njit(cache=True)
+def _fls_g_kernel(times, borehole_depth, borehole_radius, thermal_diffusivity):
+    """
+    Berechnet g-Werte und ln(t/ts) für ein ganzes Zeit-Array.
+
+    Entspricht Punkt für Punkt `GFunctionCalculator.calculate_finite_line_source`,
+    läuft aber als eine Schleife, die Numba (falls installiert) kompiliert.
+    """
+    n = times.shape[0]
+    g_values = np.zeros(n)
+    ln_t_ts_values = np.zeros(n)
+    ts = borehole_depth ** 2 / (9 * thermal_diffusivity)
+
+    for i in range(n):
+        t = times[i]
+        ln_t_ts_values[i] = math.log(t / ts)
+        if t <= 0 or borehole_depth <= 0:
+            continue
+
+        Fo = thermal_diffusivity * t / (borehole_depth ** 2)
+
+        # ICS
+        g_cyl = 0.0
+        if borehole_radius > 0:
+            u = borehole_radius ** 2 / (4 * thermal_diffusivity * t)
+            if u < 0.01:
+                g_cyl = -0.5 * (math.log(u) + 0.5772156649)
+            else:
+                g_cyl = -0.5 * math.log(4 * u)
+            g_cyl = max(0.0, g_cyl)
+
+        # ILS
+        g_ils = 0.0
+        if t >= ts:
+            g_ils = 0.5 * math.log(t / ts)
+
+        if Fo < 0.01:
+            g_values[i] = g_cyl
+        elif Fo > 10:
+            g_values[i] = g_ils
+        else:
+            weight = (math.log10(Fo) + 2) / 3
+            weight = max(0.0, min(1.0, weight))
+            g_values[i] = (1 - weight) * g_cyl + weight * g_ils
+
+    return g_values, ln_t_ts_values
+
 
 class GFunctionCalculator:
     """
@@ -132,9 +205,6 @@ class GFunctionCalculator:
         Returns:
             Tuple (ln(t/ts) Werte, g-Werte)
         """
-        # Charakteristische Zeit
-        ts = borehole_depth ** 2 / (9 * thermal_diffusivity)
-        
         # Zeitpunkte logarithmisch verteilt
         # Von 1 Stunde bis simulation_years Jahre
         t_start = 3600  # 1 Stunde in Sekunden
@@ -144,24 +214,23 @@ class GFunctionCalculator:
         n_points = 50
         times = np.logspace(math.log10(t_start), math.log10(t_end), n_points)
         
-        # Berechne g-Werte
-        g_values = []
-        ln_t_ts_values = []
-        
-        for t in times:
-            g = self.calculate_finite_line_source(
-                t, borehole_depth, borehole_radius, thermal_diffusivity
-            )
-            ln_t_ts = math.log(t / ts)
-            
-            g_values.append(g)
-            ln_t_ts_values.append(ln_t_ts)
+        # Berechne g-Werte (Numba-Kernel, falls verfügbar)
+        g_arr, ln_arr = _fls_g_kernel(
+            times, float(borehole_depth), float(borehole_radius), float(thermal_diffusivity)
+        )
+        g_values = g_arr.tolist()
+        ln_t_ts_values = ln_arr.tolist()
         
         self.g_values = g_values
         self.ln_t_ts_values = ln_t_ts_values
         
         return ln_t_ts_values, g_values
     
+    @staticmethod
+    def warmup() -> None:
+        """Kompiliert den Numba-Kernel vorab mit einem Mini-Beispiel."""
+        _fls_g_kernel(np.array([3600.0, 7200.0]), 100.0, 0.076, 1e-6)
+    
     def interpolate_g(self, time: float, borehole_depth: float, thermal_diffusivity: float) -> float:
         """
         Interpoliert den g-Wert für eine gegebene Zeit aus der g-Funktions-Tabelle.
@@ -182,6 +251,25 @@ class GFunctionCalculator:
         
         return float(f(ln_t_ts))
     
+    def interpolate_g_array(self, times: np.ndarray, borehole_depth: float, thermal_diffusivity: float) -> np.ndarray:
+        """
+        Wie `interpolate_g`, aber für ein ganzes Zeit-Array in einem Aufruf.
+        """
+        times = np.asarray(times, dtype=float)
+        if not self.g_values:
+            return np.zeros_like(times)
+        
+        ts = borehole_depth ** 2 / (9 * thermal_diffusivity)
+        
+        f = interpolate.interp1d(
+            self.ln_t_ts_values,
+            self.g_values,
+            kind='linear',
+            fill_value='extrapolate'
+        )
+        
+        return f(np.log(times / ts))
+    
     @staticmethod
     def calculate_temperature_penalty(
         heat_load: float,
@@ -209,6 +297,38 @@ class GFunctionCalculator:
         delta_T = (q_per_meter * g_value) / (2 * math.pi * thermal_conductivity)
         
         return delta_T
+    
+    @staticmethod
+    def calculate_temperature_penalty_series(
+        heat_loads: np.ndarray,
+        thermal_conductivity: float,
+        borehole_depth: float,
+        g_values: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vektorisierte Variante von `calculate_temperature_penalty`.
+        
+        Lange Zeitreihen (> NUMEXPR_THRESHOLD Werte) werden mit numexpr
+        ausgewertet, sofern installiert, sonst mit NumPy.
+        
+        Returns:
+            Temperaturänderungen in K
+        """
+        q = np.asarray(heat_loads, dtype=float)
+        g = np.asarray(g_values, dtype=float)
+        if borehole_depth <= 0 or thermal_conductivity <= 0:
+            return np.zeros(np.broadcast(q, g).shape)
+        
+        H = float(borehole_depth)
+        k = float(thermal_conductivity)
+        pi = math.pi
+        if NUMEXPR_AVAILABLE and max(q.size, g.size) > NUMEXPR_THRESHOLD:
+            # Zusammenhängende Arrays, damit numexpr blockweise rechnen kann
+            q = np.ascontiguousarray(q)
+            g = np.ascontiguousarray(g)
+            return ne.evaluate("(q / H * g) / (2 * pi * k)")
+        
+        return (q / H * g) / (2 * pi * k)
 
 
 if __name__ == "__main__":
@@ -11,8 +11,47 @@ import math
 from typing import Dict, Tuple, List, Optional
 from dataclasses import dataclass
 
+from .g_functions import njit
 
-@dataclass
+
+@njit(cache=True)
+def simplified_borehole_resistance(borehole_diameter, pipe_outer_diameter, pipe_thickness,
+                                   grout_thermal_cond, pipe_thermal_cond, single_u):
+    """
+    Vereinfachter Bohrlochwiderstand für die VDI-4640-Auslegung [m·K/W].
+    
+    Summe aus Verfüllungs-, Rohr- und konvektivem Widerstand (h ≈ 500 W/m²K),
+    für Double-U um 20 % reduziert und auf mindestens 0.05 m·K/W begrenzt.
+    Alle Längen in m. Läuft als Numba-Kernel, falls Numba installiert ist.
+    """
+    borehole_radius = borehole_diameter / 2
+    pipe_outer_radius = pipe_outer_diameter / 2
+    pipe_inner_radius = (pipe_outer_diameter - 2 * pipe_thickness) / 2
+    if borehole_radius <= 0 or pipe_inner_radius <= 0:
+        raise ValueError("Ungültige Bohrloch- oder Rohrgeometrie")
+    
+    # Thermischer Widerstand Verfüllung (vereinfacht)
+    r_grout = (1 / (2 * math.pi * grout_thermal_cond)) * \
+              math.log(borehole_radius / pipe_outer_radius)
+    
+    # Thermischer Widerstand Rohr
+    r_pipe = (1 / (2 * math.pi * pipe_thermal_cond)) * \
+             math.log(pipe_outer_diameter / (2 * pipe_inner_radius))
+    
+    # Konvektiver Widerstand (vereinfacht)
+    r_conv = 1 / (2 * math.pi * pipe_inner_radius * 500)  # h ≈ 500 W/m²K typisch
+    
+    # Gesamtwiderstand (vereinfacht für Single-U oder Double-U)
+    if single_u:
+        r_borehole = r_grout + r_pipe + r_conv
+    else:  # double-u
+        r_borehole = 0.8 * (r_grout + r_pipe + r_conv)  # Reduktion durch 4 Rohre
+    
+    # Mindestens 0.05 m·K/W
+    return max(0.05, r_borehole)
+
+
+@dataclass(slots=True)
 class VDI4640Result:
     """Ergebnis einer VDI 4640 Berechnung."""
     # Sondenlänge
@@ -68,6 +107,12 @@ class VDI4640Calculator:
     - Berechnung der Wärmepumpenaustrittstemperatur
     """
     
+    @staticmethod
+    def warmup() -> None:
+        """Kompiliert den Numba-Kernel des Bohrlochwiderstands vorab."""
+        simplified_borehole_resistance(0.152, 0.032, 0.003, 1.3, 0.42, True)
+        simplified_borehole_resistance(0.152, 0.032, 0.003, 1.3, 0.42, False)
+    
     def calculate_complete(
         self,
         # Bodeneigenschaften
@@ -1,7 +1,11 @@
 """GUI-Module für das Geothermietool."""
 
-from .main_window import GeothermieGUI
-
 __all__ = ['GeothermieGUI']
 
 
+def __getattr__(name):
+    """Lädt die Basis-GUI (Matplotlib) erst beim ersten Zugriff."""
+    if name == 'GeothermieGUI':
+        from .main_window import GeothermieGUI
+        return GeothermieGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
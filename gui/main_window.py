@@ -89,10 +89,18 @@ class GeothermieGUI:
         scrollbar = ttk.Scrollbar(self.input_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Scrollregion höchstens einmal pro Idle-Zyklus neu berechnen
+        self._scroll_after_id = None
+        
+        def on_scroll_configure(event):
+            if self._scroll_after_id is None:
+                self._scroll_after_id = canvas.after_idle(update_scrollregion)
+        
+        def update_scrollregion():
+            self._scroll_after_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        scrollable_frame.bind("<Configure>", on_scroll_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -486,39 +494,45 @@ class GeothermieGUI:
         if not self.result:
             return
         
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete("1.0", tk.END)
-        
-        text = "=" * 60 + "\n"
-        text += "ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS\n"
-        text += "=" * 60 + "\n\n"
-        
-        text += f"Erforderliche Bohrtiefe:     {self.result.required_depth:>10.1f} m\n"
-        text += f"Wärmeentzugsrate:            {self.result.heat_extraction_rate:>10.2f} W/m\n\n"
-        
-        text += "TEMPERATUREN\n"
-        text += "-" * 60 + "\n"
-        text += f"Min. Fluidtemperatur:        {self.result.fluid_temperature_min:>10.2f} °C\n"
-        text += f"Max. Fluidtemperatur:        {self.result.fluid_temperature_max:>10.2f} °C\n\n"
-        
-        text += "THERMISCHE WIDERSTÄNDE\n"
-        text += "-" * 60 + "\n"
-        text += f"Bohrloch-Widerstand (R_b):   {self.result.borehole_resistance:>10.4f} m·K/W\n"
-        text += f"Effektiver Widerstand:       {self.result.effective_resistance:>10.4f} m·K/W\n\n"
-        
-        text += "MONATLICHE DURCHSCHNITTSTEMPERATUREN\n"
-        text += "-" * 60 + "\n"
+        result = self.result
+        rule, subrule = "=" * 60, "-" * 60
         months = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-        for i, (month, temp) in enumerate(zip(months, self.result.monthly_temperatures)):
-            text += f"{month}: {temp:>6.2f} °C    "
-            if (i + 1) % 3 == 0:
-                text += "\n"
         
-        text += "\n\n"
-        text += "=" * 60 + "\n"
+        # Monatswerte, je drei pro Zeile
+        monthly = "".join(
+            f"{month}: {temp:>6.2f} °C    " + ("\n" if i % 3 == 2 else "")
+            for i, (month, temp) in enumerate(zip(months, result.monthly_temperatures))
+        )
+        
+        # Bericht in einem Schritt zusammensetzen statt zeilenweise per +=
+        text = "".join([
+            f"{rule}\n",
+            "ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS\n",
+            f"{rule}\n\n",
+            
+            f"Erforderliche Bohrtiefe:     {result.required_depth:>10.1f} m\n",
+            f"Wärmeentzugsrate:            {result.heat_extraction_rate:>10.2f} W/m\n\n",
+            
+            "TEMPERATUREN\n",
+            f"{subrule}\n",
+            f"Min. Fluidtemperatur:        {result.fluid_temperature_min:>10.2f} °C\n",
+            f"Max. Fluidtemperatur:        {result.fluid_temperature_max:>10.2f} °C\n\n",
+            
+            "THERMISCHE WIDERSTÄNDE\n",
+            f"{subrule}\n",
+            f"Bohrloch-Widerstand (R_b):   {result.borehole_resistance:>10.4f} m·K/W\n",
+            f"Effektiver Widerstand:       {result.effective_resistance:>10.4f} m·K/W\n\n",
+            
+            "MONATLICHE DURCHSCHNITTSTEMPERATUREN\n",
+            f"{subrule}\n",
+            monthly,
+            "\n\n",
+            f"{rule}\n",
+        ])
         
-        self.results_text.insert("1.0", text)
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.replace("1.0", tk.END, text)
         self.results_text.config(state=tk.DISABLED)
     
     def _plot_results(self):
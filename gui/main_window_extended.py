@@ -1,28 +1,155 @@
 """Erweiterte GUI mit Projektdaten, Bohrfeld und PDF-Export."""
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 import os
+import re
+import math
+import json
+import io
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 import matplotlib
 matplotlib.use('TkAgg')
+# Linienzüge beim Rendern vereinfachen (weniger Vertices pro Draw)
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import Circle, Rectangle
+from matplotlib.collections import EllipseCollection
 import numpy as np
 
 from parsers import PipeParser, EEDParser
 from calculations import BoreholeCalculator
-from utils import PDFReportGenerator
 from gui.tooltips import InfoButton, ToolTip
 from data.soil_types import SoilTypeDB
 from data.grout_materials import GroutMaterialDB
 from utils.pvgis_api import get_climate_data
+from utils.paths import CACHE_DIR
+
+
+# Rohrpositionen im 4-Rohr-System in Einheiten des Bohrlochradius
+_PIPE_OFFSETS_UNIT = np.array([[-0.5, 0.5], [0.5, 0.5], [-0.5, -0.5], [0.5, -0.5]])
+_PIPE_COLORS = ('#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4')
+
+# Mitgelieferter Rohrkatalog
+_DEFAULT_PIPE_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "Material", "pipe.txt")
+)
+
+# Monatsnamen für Bericht und Diagrammachse, Zeilenformat im Bericht
+_MONTHS_DE = ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
+              "Jul", "Aug", "Sep", "Okt", "Nov", "Dez")
+_MONTHS_INIT = tuple("JFMAMJJASOND")
+_MONTH_ROW_FMT = "{}: {:>6.2f} °C    "
+
+# Zuletzt verwendete Eingaben, werden beim Start wiederhergestellt
+_SESSION_FILE = os.path.join(CACHE_DIR, "last_session.json")
+
+# Zahl oder Anfang einer Zahl (z.B. "-", "1.", "2e-"), leer erlaubt
+_NUMBER_INPUT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d*)?([eE][+-]?\d*)?")
 
 
 class GeothermieGUIExtended:
     """Erweiterte GUI mit Projektdaten und PDF-Export."""
     
+    # Eingabemaske: (Überschrift, Label-Style, Feld-Methode, Einträge).
+    # Einträge sind (Label, Key, Standardwert[, Info-Key]) oder der Name
+    # einer Builder-Methode für Sonder-Widgets.
+    _INPUT_SPEC = (
+        ("🏢 Projektinformationen", "Section.TLabel", "_add_project_field", (
+            ("Projektname:", "project_name", ""),
+            ("Kundenname:", "customer_name", ""),
+            ("Straße + Nr.:", "address", ""),
+            ("PLZ:", "postal_code", ""),
+            ("Ort:", "city", ""),
+        )),
+        ("🎯 Bohrfeld-Konfiguration", "Section.TLabel", "_add_borehole_field", (
+            ("Anzahl Bohrungen:", "num_boreholes", "1", "num_boreholes"),
+            ("Abstand zwischen Bohrungen [m]:", "spacing_between", "6"),
+            ("Abstand zum Grundstücksrand [m]:", "spacing_property", "3"),
+            ("Abstand zum Gebäude [m]:", "spacing_building", "3"),
+        )),
+        ("🌍 Bodeneigenschaften", "Subsection.TLabel", "_add_input_field", (
+            "_add_soil_type_combo",
+            ("Wärmeleitfähigkeit Boden [W/m·K]:", "ground_thermal_cond", "1.8", "ground_thermal_cond"),
+            ("Wärmekapazität Boden [J/m³·K]:", "ground_heat_cap", "2400000"),
+            ("Ungestörte Bodentemperatur [°C]:", "ground_temp", "10.0"),
+            ("Geothermischer Gradient [K/m]:", "geothermal_gradient", "0.03"),
+            "_add_pvgis_button",
+        )),
+        ("⚙️ Bohrloch-Konfiguration", "Subsection.TLabel", "_add_input_field", (
+            ("Bohrloch-Durchmesser [mm]:", "borehole_diameter", "152", "borehole_diameter"),
+            "_add_pipe_config_combo",
+        )),
+        ("🔧 Rohr-Eigenschaften", "Subsection.TLabel", "_add_input_field", (
+            "_add_pipe_type_combo",
+            ("Rohr Außendurchmesser [m]:", "pipe_outer_diameter", "0.032"),
+            ("Rohr Wandstärke [m]:", "pipe_thickness", "0.003"),
+            ("Rohr Wärmeleitfähigkeit [W/m·K]:", "pipe_thermal_cond", "0.42"),
+            ("Schenkelabstand [mm]:", "shank_spacing", "65", "shank_spacing"),
+        )),
+        ("🏗️ Verfüllung", "Subsection.TLabel", "_add_input_field", (
+            "_add_grout_material_combo",
+            ("Wärmeleitfähigkeit Verfüllung [W/m·K]:", "grout_thermal_cond", "1.3", "grout_thermal_cond"),
+        )),
+        ("💧 Wärmeträgerflüssigkeit", "Subsection.TLabel", "_add_input_field", (
+            ("Volumenstrom [m³/s]:", "fluid_flow_rate", "0.0005"),
+            ("Wärmeleitfähigkeit [W/m·K]:", "fluid_thermal_cond", "0.48"),
+            ("Wärmekapazität [J/kg·K]:", "fluid_heat_cap", "3800"),
+            ("Dichte [kg/m³]:", "fluid_density", "1030"),
+            ("Viskosität [Pa·s]:", "fluid_viscosity", "0.004"),
+        )),
+        ("🔥 Heiz- und Kühllast", "Subsection.TLabel", "_add_input_field", (
+            ("Jahres-Heizenergie [kWh]:", "annual_heating", "12000.0", "annual_heating"),
+            ("Jahres-Kühlenergie [kWh]:", "annual_cooling", "0.0"),
+            ("Heiz-Spitzenlast [kW]:", "peak_heating", "6.0"),
+            ("Kühl-Spitzenlast [kW]:", "peak_cooling", "0.0"),
+            ("Wärmepumpen-COP:", "heat_pump_cop", "4.0", "cop"),
+        )),
+        ("🌡️ Temperaturanforderungen", "Subsection.TLabel", "_add_input_field", (
+            ("Min. Fluidtemperatur [°C]:", "min_fluid_temp", "-2.0"),
+            ("Max. Fluidtemperatur [°C]:", "max_fluid_temp", "15.0"),
+        )),
+        ("⏱️ Simulation", "Subsection.TLabel", "_add_input_field", (
+            ("Simulationsdauer [Jahre]:", "simulation_years", "25"),
+            ("Startwert Bohrtiefe [m]:", "initial_depth", "100"),
+        )),
+    )
+    
+    # Rechner-Argument ← (Eingabe-Key, Teiler für die Einheit) für _run_calculation
+    _PARAM_TRANSFORMS = (
+        ("ground_thermal_conductivity", "ground_thermal_cond", 1),
+        ("ground_heat_capacity", "ground_heat_cap", 1),
+        ("undisturbed_ground_temp", "ground_temp", 1),
+        ("geothermal_gradient", "geothermal_gradient", 1),
+        ("borehole_diameter", "borehole_diameter", 1000),  # mm → m
+        ("pipe_outer_diameter", "pipe_outer_diameter", 1),
+        ("pipe_wall_thickness", "pipe_thickness", 1),
+        ("pipe_thermal_conductivity", "pipe_thermal_cond", 1),
+        ("shank_spacing", "shank_spacing", 1000),  # mm → m
+        ("grout_thermal_conductivity", "grout_thermal_cond", 1),
+        ("fluid_thermal_conductivity", "fluid_thermal_cond", 1),
+        ("fluid_heat_capacity", "fluid_heat_cap", 1),
+        ("fluid_density", "fluid_density", 1),
+        ("fluid_viscosity", "fluid_viscosity", 1),
+        ("fluid_flow_rate", "fluid_flow_rate", 1),
+        ("annual_heating_demand", "annual_heating", 1000),  # kWh → MWh
+        ("annual_cooling_demand", "annual_cooling", 1000),  # kWh → MWh
+        ("peak_heating_load", "peak_heating", 1),
+        ("peak_cooling_load", "peak_cooling", 1),
+        ("heat_pump_cop", "heat_pump_cop", 1),
+        ("min_fluid_temperature", "min_fluid_temp", 1),
+        ("max_fluid_temperature", "max_fluid_temp", 1),
+        ("simulation_years", "simulation_years", 1),
+        ("initial_depth", "initial_depth", 1),
+    )
+    
     def __init__(self, root):
         """Initialisiert die erweiterte GUI."""
         self.root = root
@@ -33,21 +160,34 @@ class GeothermieGUIExtended:
         self.pipe_parser = PipeParser()
         self.eed_parser = EEDParser()
         self.calculator = BoreholeCalculator()
-        self.pdf_generator = PDFReportGenerator()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._calc_future = None
+        # Eigener Pool für Netzwerk-I/O, damit Abfragen nicht hinter Berechnungen warten
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        self.pdf_generator = None  # wird beim ersten PDF-Export geladen (ReportLab)
         
         # Daten
         self.pipes = []
         self.current_config = None
         self.result = None
         self.current_params = {}
+        self._preview_pending = False
         
         # GUI aufbauen
+        self._create_styles()
         self._create_menu()
         self._create_main_layout()
         self._create_status_bar()
         
-        # Lade Standard-Rohrtypen
-        self._load_default_pipes()
+        # Eingaben der letzten Sitzung übernehmen
+        self._restored_pipe_name = None
+        self._restore_session()
+        
+        # Lade Standard-Rohrtypen im Hintergrund, sobald das Fenster steht
+        self.root.after(50, self._load_default_pipes)
+        
+        # JIT-Kernel im Rechen-Thread vorkompilieren
+        self.root.after(100, lambda: self._executor.submit(self.calculator.warmup))
     
     def _create_menu(self):
         """Erstellt die Menüleiste."""
@@ -60,11 +200,20 @@ class GeothermieGUIExtended:
         file_menu.add_command(label="Pipe.txt laden", command=self._load_pipe_file)
         file_menu.add_command(label="EED .dat laden", command=self._load_eed_file)
         file_menu.add_separator()
+        file_menu.add_command(label="Sitzung speichern...", command=self._save_session_as)
+        file_menu.add_command(label="Sitzung laden...", command=self._load_session_from)
+        file_menu.add_separator()
         file_menu.add_command(label="PDF-Bericht erstellen", command=self._export_pdf, accelerator="Ctrl+P")
         file_menu.add_command(label="Ergebnis als Text exportieren", command=self._export_results)
         file_menu.add_separator()
         file_menu.add_command(label="Beenden", command=self.root.quit)
         
+        # Optionen-Menü
+        self.show_info_var = tk.BooleanVar(value=True)
+        options_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Optionen", menu=options_menu)
+        options_menu.add_checkbutton(label="Erfolgsmeldungen anzeigen", variable=self.show_info_var)
+        
         # Hilfe-Menü
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Hilfe", menu=help_menu)
@@ -73,6 +222,26 @@ class GeothermieGUIExtended:
         # Keyboard Shortcuts
         self.root.bind('<Control-p>', lambda e: self._export_pdf())
     
+    @property
+    def _silent_mode(self):
+        """True, wenn Erfolgsmeldungen nur in der Statusleiste erscheinen sollen."""
+        return not self.show_info_var.get()
+    
+    def _notify_success(self, title, message):
+        """Zeigt eine Erfolgsmeldung, außer im stillen Modus."""
+        if not self._silent_mode:
+            messagebox.showinfo(title, message)
+    
+    def _create_styles(self):
+        """Registriert benannte Schriften und ttk-Styles einmalig."""
+        tkfont.Font(root=self.root, name="GeoH1", family="Arial", size=14, weight="bold")
+        tkfont.Font(root=self.root, name="GeoH2", family="Arial", size=12, weight="bold")
+        tkfont.Font(root=self.root, name="GeoMono", family="Courier", size=10)
+        
+        style = ttk.Style(self.root)
+        style.configure("Section.TLabel", font="GeoH1", foreground="#1f4788")
+        style.configure("Subsection.TLabel", font="GeoH2")
+    
     def _create_main_layout(self):
         """Erstellt das Hauptlayout."""
         # Hauptcontainer mit Notebook (Tabs)
@@ -93,6 +262,24 @@ class GeothermieGUIExtended:
         self.viz_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.viz_frame, text="📈 Diagramme")
         self._create_visualization_tab()
+        
+        # Grafiken in verdeckten Tabs erst beim Anzeigen neu zeichnen
+        self._preview_dirty = False
+        self._viz_dirty = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _is_tab_visible(self, frame):
+        """Prüft, ob der Tab mit dem gegebenen Frame gerade angezeigt wird."""
+        return self.notebook.select() == str(frame)
+    
+    def _on_tab_changed(self, event=None):
+        """Holt aufgeschobene Redraws nach, sobald ihr Tab sichtbar wird."""
+        if self._preview_dirty and self._is_tab_visible(self.input_frame):
+            self._preview_dirty = False
+            self._update_borehole_preview()
+        if self._viz_dirty and self._is_tab_visible(self.viz_frame):
+            self._viz_dirty = False
+            self.canvas.draw_idle()
     
     def _create_input_tab(self):
         """Erstellt den erweiterten Eingabe-Tab."""
@@ -109,10 +296,19 @@ class GeothermieGUIExtended:
         scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Scrollregion erst nach abgeschlossenem Layout einmalig neu berechnen
+        self._scroll_after_id = None
+        
+        def on_scroll_configure(event):
+            if self._scroll_after_id is not None:
+                canvas.after_cancel(self._scroll_after_id)
+            self._scroll_after_id = canvas.after_idle(update_scrollregion)
+        
+        def update_scrollregion():
+            self._scroll_after_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        scrollable_frame.bind("<Configure>", on_scroll_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -125,57 +321,64 @@ class GeothermieGUIExtended:
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(10, 0))
         
         # Eingabefelder linksseitig
-        row = 0
         self.entries = {}
         self.project_entries = {}
         self.borehole_entries = {}
+        self.entry_vars = {}
+        self._entry_getters = {}
+        self._values = {}
+        # Projekt-/Bohrfeld-Felder, die sich seit dem letzten PDF-Export geändert haben
+        self._dirty_fields = set()
+        self._project_cache = {}
+        self._borehole_cache = {}
+        self._number_vcmd = (self.root.register(self._is_number_input), "%P")
         
-        # === PROJEKTINFORMATIONEN ===
-        ttk.Label(scrollable_frame, text="🏢 Projektinformationen", 
-                 font=("Arial", 14, "bold"), foreground="#1f4788").grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(10, 5)
-        )
-        row += 1
-        
-        self._add_project_field(scrollable_frame, row, "Projektname:", "project_name", "")
-        row += 1
-        self._add_project_field(scrollable_frame, row, "Kundenname:", "customer_name", "")
-        row += 1
-        self._add_project_field(scrollable_frame, row, "Straße + Nr.:", "address", "")
-        row += 1
-        self._add_project_field(scrollable_frame, row, "PLZ:", "postal_code", "")
-        row += 1
-        self._add_project_field(scrollable_frame, row, "Ort:", "city", "")
-        row += 1
-        
-        # === BOHRFELD-KONFIGURATION ===
-        ttk.Label(scrollable_frame, text="🎯 Bohrfeld-Konfiguration", 
-                 font=("Arial", 14, "bold"), foreground="#1f4788").grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
+        row = 0
+        for title, header_style, add_field, items in self._INPUT_SPEC:
+            ttk.Label(scrollable_frame, text=title, style=header_style).grid(
+                row=row, column=0, columnspan=2, sticky="w", padx=10,
+                pady=(10 if row == 0 else 15, 5)
+            )
+            row += 1
+            
+            add_field = getattr(self, add_field)
+            for item in items:
+                if isinstance(item, str):
+                    # Sonder-Widgets (Dropdowns, Buttons) über eigene Builder
+                    row = getattr(self, item)(scrollable_frame, row)
+                else:
+                    add_field(scrollable_frame, row, *item)
+                    row += 1
+        
+        # Berechnen-Button
+        button_frame = ttk.Frame(scrollable_frame)
+        button_frame.grid(row=row, column=0, columnspan=2, pady=20, padx=10)
+        
+        self.calc_button = ttk.Button(
+            button_frame, 
+            text="🚀 Berechnung starten",
+            command=self._run_calculation,
+            width=25
         )
-        row += 1
-        
-        self._add_borehole_field(scrollable_frame, row, "Anzahl Bohrungen:", "num_boreholes", "1", "num_boreholes")
-        row += 1
-        self._add_borehole_field(scrollable_frame, row, "Abstand zwischen Bohrungen [m]:", "spacing_between", "6")
-        row += 1
-        self._add_borehole_field(scrollable_frame, row, "Abstand zum Grundstücksrand [m]:", "spacing_property", "3")
-        row += 1
-        self._add_borehole_field(scrollable_frame, row, "Abstand zum Gebäude [m]:", "spacing_building", "3")
-        row += 1
-        
-        # === BODENEIGENSCHAFTEN ===
-        ttk.Label(scrollable_frame, text="🌍 Bodeneigenschaften", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
+        self.calc_button.pack(side=tk.LEFT, padx=5)
+        
+        pdf_button = ttk.Button(
+            button_frame,
+            text="📄 PDF-Bericht erstellen",
+            command=self._export_pdf,
+            width=25
         )
-        row += 1
+        pdf_button.pack(side=tk.LEFT, padx=5)
         
-        # Bodentyp-Dropdown
-        ttk.Label(scrollable_frame, text="Bodentyp:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        # === RECHTE SPALTE: Bohrloch-Grafik ===
+        self._create_borehole_preview(right_frame)
+    
+    def _add_soil_type_combo(self, parent, row):
+        """Bodentyp-Dropdown."""
+        ttk.Label(parent, text="Bodentyp:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.soil_type_var = tk.StringVar(value="Sand")
         self.soil_type_combo = ttk.Combobox(
-            scrollable_frame,
+            parent,
             textvariable=self.soil_type_var,
             values=SoilTypeDB.get_all_names(),
             state="readonly",
@@ -183,88 +386,52 @@ class GeothermieGUIExtended:
         )
         self.soil_type_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.soil_type_combo.bind("<<ComboboxSelected>>", self._on_soil_type_selected)
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Wärmeleitfähigkeit Boden [W/m·K]:", "ground_thermal_cond", "1.8", "ground_thermal_cond")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Wärmekapazität Boden [J/m³·K]:", "ground_heat_cap", "2400000")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Ungestörte Bodentemperatur [°C]:", "ground_temp", "10.0")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Geothermischer Gradient [K/m]:", "geothermal_gradient", "0.03")
-        row += 1
-        
-        # PVGIS-Button für Klimadaten
+        return row + 1
+    
+    def _add_pvgis_button(self, parent, row):
+        """PVGIS-Button für Klimadaten."""
         pvgis_button = ttk.Button(
-            scrollable_frame,
+            parent,
             text="🌐 Klimadaten von PVGIS laden",
             command=self._load_climate_data
         )
         pvgis_button.grid(row=row, column=0, columnspan=2, padx=10, pady=10)
-        row += 1
-        
-        # === BOHRLOCH-KONFIGURATION ===
-        ttk.Label(scrollable_frame, text="⚙️ Bohrloch-Konfiguration", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Bohrloch-Durchmesser [mm]:", "borehole_diameter", "152", "borehole_diameter")
-        row += 1
-        
-        ttk.Label(scrollable_frame, text="Rohrkonfiguration:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        return row + 1
+    
+    def _add_pipe_config_combo(self, parent, row):
+        """Rohrkonfigurations-Dropdown."""
+        ttk.Label(parent, text="Rohrkonfiguration:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.pipe_config_var = tk.StringVar(value="4-rohr-dual")
         pipe_config_combo = ttk.Combobox(
-            scrollable_frame, 
+            parent, 
             textvariable=self.pipe_config_var,
             values=["single-u", "double-u", "4-rohr-dual", "4-rohr-4verbinder", "coaxial"],
             state="readonly",
             width=30
         )
         pipe_config_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
-        row += 1
-        
-        # === ROHR-EIGENSCHAFTEN ===
-        ttk.Label(scrollable_frame, text="🔧 Rohr-Eigenschaften", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        ttk.Label(scrollable_frame, text="Rohrtyp:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        return row + 1
+    
+    def _add_pipe_type_combo(self, parent, row):
+        """Rohrtyp-Dropdown."""
+        ttk.Label(parent, text="Rohrtyp:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.pipe_type_var = tk.StringVar()
         self.pipe_type_combo = ttk.Combobox(
-            scrollable_frame, 
+            parent, 
             textvariable=self.pipe_type_var,
             state="readonly",
             width=30
         )
         self.pipe_type_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.pipe_type_combo.bind("<<ComboboxSelected>>", self._on_pipe_selected)
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Rohr Außendurchmesser [m]:", "pipe_outer_diameter", "0.032")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Rohr Wandstärke [m]:", "pipe_thickness", "0.003")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Rohr Wärmeleitfähigkeit [W/m·K]:", "pipe_thermal_cond", "0.42")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Schenkelabstand [mm]:", "shank_spacing", "65", "shank_spacing")
-        row += 1
-        
-        # === VERFÜLLUNG ===
-        ttk.Label(scrollable_frame, text="🏗️ Verfüllung", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        # Verfüllmaterial-Dropdown
-        ttk.Label(scrollable_frame, text="Verfüllmaterial:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        return row + 1
+    
+    def _add_grout_material_combo(self, parent, row):
+        """Verfüllmaterial-Dropdown."""
+        ttk.Label(parent, text="Verfüllmaterial:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.grout_material_var = tk.StringVar(value="Zement-Bentonit verbessert")
         self.grout_material_combo = ttk.Combobox(
-            scrollable_frame,
+            parent,
             textvariable=self.grout_material_var,
             values=GroutMaterialDB.get_all_names(),
             state="readonly",
@@ -272,169 +439,130 @@ class GeothermieGUIExtended:
         )
         self.grout_material_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.grout_material_combo.bind("<<ComboboxSelected>>", self._on_grout_material_selected)
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Wärmeleitfähigkeit Verfüllung [W/m·K]:", "grout_thermal_cond", "1.3", "grout_thermal_cond")
-        row += 1
-        
-        # === WÄRMETRÄGERFLÜSSIGKEIT ===
-        ttk.Label(scrollable_frame, text="💧 Wärmeträgerflüssigkeit", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Volumenstrom [m³/s]:", "fluid_flow_rate", "0.0005")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Wärmeleitfähigkeit [W/m·K]:", "fluid_thermal_cond", "0.48")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Wärmekapazität [J/kg·K]:", "fluid_heat_cap", "3800")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Dichte [kg/m³]:", "fluid_density", "1030")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Viskosität [Pa·s]:", "fluid_viscosity", "0.004")
-        row += 1
-        
-        # === LASTEN ===
-        ttk.Label(scrollable_frame, text="🔥 Heiz- und Kühllast", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Jahres-Heizenergie [kWh]:", "annual_heating", "12000.0", "annual_heating")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Jahres-Kühlenergie [kWh]:", "annual_cooling", "0.0")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Heiz-Spitzenlast [kW]:", "peak_heating", "6.0")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Kühl-Spitzenlast [kW]:", "peak_cooling", "0.0")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Wärmepumpen-COP:", "heat_pump_cop", "4.0", "cop")
-        row += 1
-        
-        # === TEMPERATURANFORDERUNGEN ===
-        ttk.Label(scrollable_frame, text="🌡️ Temperaturanforderungen", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Min. Fluidtemperatur [°C]:", "min_fluid_temp", "-2.0")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Max. Fluidtemperatur [°C]:", "max_fluid_temp", "15.0")
-        row += 1
-        
-        # === SIMULATION ===
-        ttk.Label(scrollable_frame, text="⏱️ Simulation", 
-                 font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(15, 5)
-        )
-        row += 1
-        
-        self._add_input_field(scrollable_frame, row, "Simulationsdauer [Jahre]:", "simulation_years", "25")
-        row += 1
-        self._add_input_field(scrollable_frame, row, "Startwert Bohrtiefe [m]:", "initial_depth", "100")
-        row += 1
-        
-        # Berechnen-Button
-        button_frame = ttk.Frame(scrollable_frame)
-        button_frame.grid(row=row, column=0, columnspan=2, pady=20, padx=10)
-        
-        calc_button = ttk.Button(
-            button_frame, 
-            text="🚀 Berechnung starten",
-            command=self._run_calculation,
-            width=25
-        )
-        calc_button.pack(side=tk.LEFT, padx=5)
-        
-        pdf_button = ttk.Button(
-            button_frame,
-            text="📄 PDF-Bericht erstellen",
-            command=self._export_pdf,
-            width=25
-        )
-        pdf_button.pack(side=tk.LEFT, padx=5)
-        
-        # === RECHTE SPALTE: Bohrloch-Grafik ===
-        self._create_borehole_preview(right_frame)
+        return row + 1
     
     def _create_borehole_preview(self, parent):
         """Erstellt die Bohrloch-Vorschau-Grafik."""
         ttk.Label(parent, text="Bohrloch-Schema", 
-                 font=("Arial", 12, "bold")).pack(pady=10)
+                 style="Subsection.TLabel").pack(pady=10)
         
-        # Matplotlib Figure für Vorschau
+        # Matplotlib Figure für Vorschau, offscreen gerendert und als Bild
+        # angezeigt (jede Geometrie wird nur einmal gezeichnet)
         self.preview_fig = Figure(figsize=(5, 7))
         self.preview_ax = self.preview_fig.add_subplot(111)
-        self.preview_canvas = FigureCanvasTkAgg(self.preview_fig, master=parent)
-        self.preview_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Initial-Grafik
-        self._update_borehole_preview()
-    
-    def _update_borehole_preview(self):
-        """Aktualisiert die Bohrloch-Vorschau."""
-        self.preview_ax.clear()
+        self.preview_canvas = FigureCanvasAgg(self.preview_fig)
+        self.preview_label = ttk.Label(parent)
+        self.preview_label.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Standard-Werte
-        bh_diameter = 0.152
-        pipe_diameter = 0.032
-        
-        # Skalierung
-        scale = 100
-        bh_radius = (bh_diameter / 2) * scale
-        pipe_radius = (pipe_diameter / 2) * scale
-        
-        # Bohrloch
-        borehole = Circle((0, 0), bh_radius, facecolor='#d9d9d9', 
-                         edgecolor='black', linewidth=2)
-        self.preview_ax.add_patch(borehole)
-        
-        # 4 Rohre
-        positions = [
-            (-bh_radius*0.5, bh_radius*0.5),
-            (bh_radius*0.5, bh_radius*0.5),
-            (-bh_radius*0.5, -bh_radius*0.5),
-            (bh_radius*0.5, -bh_radius*0.5)
-        ]
+        # Koordinaten in Einheiten des Bohrlochradius -> Achsen bleiben fix
+        self.preview_ax.set_xlim(-2, 2)
+        self.preview_ax.set_ylim(-2, 2.5)
+        self.preview_ax.set_aspect('equal')
+        self.preview_ax.axis('off')
         
-        colors = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
+        # Artists einmalig anlegen, Updates ändern nur deren Attribute
+        self._preview_bh_patch = Circle((0, 0), 1.0, facecolor='#d9d9d9',
+                                        edgecolor='black', linewidth=2)
+        self.preview_ax.add_patch(self._preview_bh_patch)
         
-        for (x, y), color in zip(positions, colors):
-            pipe = Circle((x, y), pipe_radius*1.5, facecolor=color, 
-                         edgecolor='black', linewidth=1, alpha=0.8)
+        self._preview_pipe_patches = []
+        for i, color in enumerate(_PIPE_COLORS):
+            pipe = Circle(_PIPE_OFFSETS_UNIT[i], 0.1, facecolor=color, edgecolor='black',
+                          linewidth=1, alpha=0.8)
             self.preview_ax.add_patch(pipe)
+            self._preview_pipe_patches.append(pipe)
         
-        # Beschriftungen
-        self.preview_ax.text(0, -bh_radius*1.5, f'Ø {bh_diameter*1000:.0f} mm',
-                           ha='center', fontsize=10, fontweight='bold')
-        self.preview_ax.text(0, bh_radius*1.8, '4-Rohr-System',
-                           ha='center', fontsize=11, fontweight='bold')
+        # Beschriftungen (leer angelegt, Inhalt und Lage setzt der Renderer)
+        self._preview_title_text = self.preview_ax.text(0, 0, '', ha='center', fontsize=11,
+                                                        fontweight='bold')
+        self._preview_dia_text = self.preview_ax.text(0, 0, '', ha='center', fontsize=10,
+                                                      fontweight='bold')
         
-        self.preview_ax.set_xlim(-bh_radius*2, bh_radius*2)
-        self.preview_ax.set_ylim(-bh_radius*2, bh_radius*2.5)
-        self.preview_ax.set_aspect('equal')
-        self.preview_ax.axis('off')
+        # Gerenderte Vorschaubilder je (Bohrloch-Ø, Rohr-Ø) in mm
+        self._preview_image = lru_cache(maxsize=32)(self._render_preview_image)
+        
+        # Vorschau folgt den Eingaben (auch programmatischen), mehrere
+        # Änderungen werden zu einem Redraw im nächsten Idle zusammengefasst
+        for key in ("borehole_diameter", "pipe_outer_diameter"):
+            self.entry_vars[key].trace_add("write", lambda *args: self._schedule_preview_refresh())
         
-        self.preview_canvas.draw()
+        # Initial-Grafik
+        self._update_borehole_preview()
+    
+    def _schedule_preview_refresh(self):
+        """Plant eine Vorschau-Aktualisierung, sofern noch keine aussteht."""
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        self.root.after_idle(self._do_preview_refresh)
+    
+    def _do_preview_refresh(self):
+        """Führt die geplante Vorschau-Aktualisierung aus."""
+        self._preview_pending = False
+        if not self._is_tab_visible(self.input_frame):
+            self._preview_dirty = True
+            return
+        self._update_borehole_preview()
+    
+    def _render_preview_image(self, bh_diameter_mm, pipe_diameter_mm):
+        """Zeichnet die Vorschau für die gegebenen Durchmesser als PhotoImage."""
+        # Rohrradius relativ zum Bohrlochradius
+        pipe_radius = (pipe_diameter_mm / bh_diameter_mm) if bh_diameter_mm > 0 else 0.0
+        for pipe in self._preview_pipe_patches:
+            pipe.set_radius(pipe_radius * 1.5)
+        bh_radius = self._preview_bh_patch.get_radius()
+        self._preview_title_text.set_text('4-Rohr-System')
+        self._preview_title_text.set_position((0, bh_radius * 1.8))
+        self._preview_dia_text.set_text(f'Ø {bh_diameter_mm:.0f} mm')
+        self._preview_dia_text.set_position((0, -bh_radius * 1.5))
+        
+        buffer = io.BytesIO()
+        self.preview_canvas.print_png(buffer)
+        return tk.PhotoImage(master=self.root, data=base64.b64encode(buffer.getvalue()))
+    
+    def _update_borehole_preview(self):
+        """Aktualisiert die Bohrloch-Vorschau."""
+        # Aktuelle Werte, Standard-Werte bei ungültiger Eingabe
+        try:
+            bh_diameter = float(self._entry_getters["borehole_diameter"]()) / 1000  # mm → m
+        except (KeyError, ValueError):
+            bh_diameter = 0.152
+        try:
+            pipe_diameter = float(self._entry_getters["pipe_outer_diameter"]())
+        except (KeyError, ValueError):
+            pipe_diameter = 0.032
+        
+        # Gerundete Werte als Cache-Key, bekannte Zustände sind nur ein Bildtausch
+        image = self._preview_image(round(bh_diameter * 1000, 1), round(pipe_diameter * 1000, 1))
+        self.preview_label.configure(image=image)
+        self.preview_label.image = image
     
     def _add_project_field(self, parent, row, label, key, default_value):
         """Fügt ein Projektdaten-Feld hinzu."""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=10, pady=5)
-        entry = ttk.Entry(parent, width=32)
-        entry.insert(0, default_value)
+        var = tk.StringVar(value=default_value)
+        entry = ttk.Entry(parent, width=32, textvariable=var)
         entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.project_entries[key] = entry
+        self.entry_vars[key] = var
+        self._entry_getters[key] = var.get
+        self._track_dirty(key, var)
     
     def _add_borehole_field(self, parent, row, label, key, default_value, help_key=None):
         """Fügt ein Bohrfeld-Parameter-Feld mit optionalem Info-Button hinzu."""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=10, pady=5)
-        entry = ttk.Entry(parent, width=32)
-        entry.insert(0, default_value)
+        var = tk.StringVar(value=default_value)
+        entry = ttk.Entry(parent, width=32, textvariable=var,
+                          validate="key", validatecommand=self._number_vcmd)
         entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.borehole_entries[key] = entry
+        self.entry_vars[key] = var
+        self._entry_getters[key] = var.get
+        self._track_dirty(key, var)
+        
+        # Zahlenwert bei jeder Änderung einmal parsen und zwischenspeichern
+        var.trace_add("write", lambda *args, k=key: self._cache_value(k))
+        self._cache_value(key)
         
         # Info-Button hinzufügen, wenn help_key vorhanden
         if help_key:
@@ -443,15 +571,40 @@ class GeothermieGUIExtended:
     def _add_input_field(self, parent, row, label, key, default_value, help_key=None):
         """Fügt ein Eingabefeld mit optionalem Info-Button hinzu."""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=10, pady=5)
-        entry = ttk.Entry(parent, width=32)
-        entry.insert(0, default_value)
+        var = tk.StringVar(value=default_value)
+        entry = ttk.Entry(parent, width=32, textvariable=var,
+                          validate="key", validatecommand=self._number_vcmd)
         entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         self.entries[key] = entry
+        self.entry_vars[key] = var
+        self._entry_getters[key] = var.get
+        
+        # Zahlenwert bei jeder Änderung einmal parsen und zwischenspeichern
+        var.trace_add("write", lambda *args, k=key: self._cache_value(k))
+        self._cache_value(key)
         
         # Info-Button hinzufügen, wenn help_key vorhanden
         if help_key:
             InfoButton.create_info_button(parent, row, 2, help_key)
     
+    def _track_dirty(self, key, var):
+        """Markiert ein Feld bei jeder Änderung für den nächsten PDF-Export."""
+        self._dirty_fields.add(key)
+        var.trace_add("write", lambda *args: self._dirty_fields.add(key))
+    
+    @staticmethod
+    def _is_number_input(proposed):
+        """Tk-Validator: lässt nur Zahlen bzw. deren Anfang als Eingabe zu."""
+        return _NUMBER_INPUT_RE.fullmatch(proposed) is not None
+    
+    def _cache_value(self, key):
+        """Aktualisiert den zwischengespeicherten Zahlenwert eines Feldes."""
+        try:
+            self._values[key] = float(self._entry_getters[key]())
+        except ValueError:
+            # Unvollständige Eingabe - kein gültiger Wert vorhanden
+            self._values.pop(key, None)
+    
     def _create_results_tab(self):
         """Erstellt den Ergebnisse-Tab."""
         # Scrollbarer Text-Widget
@@ -464,7 +617,7 @@ class GeothermieGUIExtended:
         self.results_text = tk.Text(
             text_frame, 
             wrap=tk.WORD,
-            font=("Courier", 10),
+            font="GeoMono",
             yscrollcommand=scrollbar.set
         )
         self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -480,34 +633,123 @@ class GeothermieGUIExtended:
         self.fig = Figure(figsize=(14, 8))
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Achsen und Artists entstehen beim ersten Ergebnis
+        self._result_axes = None
     
     def _create_status_bar(self):
         """Erstellt die Statusleiste."""
         self.status_var = tk.StringVar(value="Bereit - Bitte Projektdaten und Parameter eingeben")
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
         status_bar = ttk.Label(
-            self.root, 
+            status_frame, 
             textvariable=self.status_var,
             relief=tk.SUNKEN,
             anchor=tk.W
         )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Fortschrittsanzeige für länger laufende Hintergrund-Aufgaben
+        self.status_progress = ttk.Progressbar(status_frame, mode='indeterminate', length=150)
     
     def _load_default_pipes(self):
-        """Lädt Standard-Rohrtypen."""
-        default_pipe_file = os.path.join(os.path.dirname(__file__), "..", "Material", "pipe.txt")
-        if os.path.exists(default_pipe_file):
-            try:
-                self.pipes = self.pipe_parser.parse_file(default_pipe_file)
-                self._update_pipe_combo()
-                # Setze PE 100 RC als Standard
-                for i, pipe in enumerate(self.pipes):
-                    if "PE 100 RC DN32" in pipe.name and "Dual" in pipe.name:
-                        self.pipe_type_combo.current(i)
-                        self._on_pipe_selected(None)
-                        break
-                self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen geladen (inkl. PE 100 RC)")
-            except Exception as e:
-                print(f"Fehler beim Laden der Standard-Rohre: {e}")
+        """Startet das Laden der Standard-Rohrtypen im I/O-Pool."""
+        if not os.path.exists(_DEFAULT_PIPE_PATH):
+            return
+        future = self._io_executor.submit(PipeParser.parse_file_cached, _DEFAULT_PIPE_PATH)
+        self._poll_future(future, self._apply_default_pipes, interval=20)
+    
+    def _apply_default_pipes(self, future):
+        """Übernimmt die geladenen Standard-Rohrtypen in die GUI (Tk-Hauptthread)."""
+        try:
+            # Der Datei-Cache des Parsers liefert bei jedem Aufruf neue Objekte
+            pipes = future.result()
+        except Exception as e:
+            print(f"Fehler beim Laden der Standard-Rohre: {e}")
+            return
+        self.pipes = pipes
+        # Noch nichts auswählen: das würde die Rohrfelder mit Eintrag 0 überschreiben
+        self._update_pipe_combo(select_first=False)
+        if not self.pipes:
+            return
+        # Rohrtyp der letzten Sitzung nur auswählen, Felder nicht überschreiben
+        names = [pipe.name for pipe in self.pipes]
+        if self._restored_pipe_name in names:
+            self.pipe_type_combo.current(names.index(self._restored_pipe_name))
+            self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen geladen (inkl. PE 100 RC)")
+            return
+        # Setze PE 100 RC als Standard, sonst den ersten Eintrag
+        for i, pipe in enumerate(self.pipes):
+            if "PE 100 RC DN32" in pipe.name and "Dual" in pipe.name:
+                break
+        else:
+            i = 0
+        self.pipe_type_combo.current(i)
+        self._on_pipe_selected(None)
+        self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen geladen (inkl. PE 100 RC)")
+    
+    def _save_session(self, filename=_SESSION_FILE):
+        """Speichert alle Eingabefelder als JSON."""
+        session = {
+            "fields": {key: get() for key, get in self._entry_getters.items()},
+            "pipe_configuration": self.pipe_config_var.get(),
+            "pipe_type": self.pipe_type_var.get(),
+            "show_info": self.show_info_var.get(),
+        }
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(session, f, ensure_ascii=False, indent=2)
+            return True
+        except OSError as e:
+            print(f"Sitzung konnte nicht gespeichert werden: {e}")
+            return False
+    
+    def _restore_session(self, filename=_SESSION_FILE):
+        """Lädt gespeicherte Eingabefelder; fehlende Datei ist kein Fehler."""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        for key, value in session.get("fields", {}).items():
+            if key in self.entry_vars:
+                self.entry_vars[key].set(value)
+        if session.get("pipe_configuration"):
+            self.pipe_config_var.set(session["pipe_configuration"])
+        self.show_info_var.set(session.get("show_info", True))
+        self._restored_pipe_name = session.get("pipe_type") or None
+        if self._restored_pipe_name:
+            self.pipe_type_var.set(self._restored_pipe_name)
+        return True
+    
+    def _save_session_as(self):
+        """Menü: Sitzung unter frei wählbarem Namen speichern."""
+        filename = filedialog.asksaveasfilename(
+            title="Sitzung speichern",
+            defaultextension=".json",
+            filetypes=[("JSON-Dateien", "*.json"), ("Alle Dateien", "*.*")]
+        )
+        if filename:
+            if self._save_session(filename):
+                self.status_var.set(f"✓ Sitzung gespeichert: {os.path.basename(filename)}")
+            else:
+                messagebox.showerror("Fehler", "Sitzung konnte nicht gespeichert werden.")
+    
+    def _load_session_from(self):
+        """Menü: gespeicherte Sitzung laden."""
+        filename = filedialog.askopenfilename(
+            title="Sitzung laden",
+            filetypes=[("JSON-Dateien", "*.json"), ("Alle Dateien", "*.*")]
+        )
+        if filename:
+            if self._restore_session(filename):
+                self.status_var.set(f"✓ Sitzung geladen: {os.path.basename(filename)}")
+            else:
+                messagebox.showerror("Fehler", "Sitzung konnte nicht gelesen werden.")
     
     def _load_pipe_file(self):
         """Lädt eine pipe.txt Datei."""
@@ -520,7 +762,7 @@ class GeothermieGUIExtended:
                 self.pipes = self.pipe_parser.parse_file(filename)
                 self._update_pipe_combo()
                 self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen aus {os.path.basename(filename)} geladen")
-                messagebox.showinfo("Erfolg", f"{len(self.pipes)} Rohrtypen wurden geladen.")
+                self._notify_success("Erfolg", f"{len(self.pipes)} Rohrtypen wurden geladen.")
             except Exception as e:
                 messagebox.showerror("Fehler", f"Fehler beim Laden: {str(e)}")
     
@@ -535,82 +777,61 @@ class GeothermieGUIExtended:
                 config = self.eed_parser.parse_file(filename)
                 self._populate_from_eed_config(config)
                 self.status_var.set(f"✓ EED-Konfiguration aus {os.path.basename(filename)} geladen")
-                messagebox.showinfo("Erfolg", "EED-Konfiguration wurde geladen.")
+                self._notify_success("Erfolg", "EED-Konfiguration wurde geladen.")
             except Exception as e:
                 messagebox.showerror("Fehler", f"Fehler beim Laden: {str(e)}")
     
     def _populate_from_eed_config(self, config):
         """Füllt Eingabefelder mit EED-Konfiguration."""
-        # Bodeneigenschaften
-        self.entries["ground_thermal_cond"].delete(0, tk.END)
-        self.entries["ground_thermal_cond"].insert(0, str(config.thermal_conductivity_ground))
-        
-        self.entries["ground_heat_cap"].delete(0, tk.END)
-        self.entries["ground_heat_cap"].insert(0, str(config.heat_capacity))
-        
-        self.entries["ground_temp"].delete(0, tk.END)
-        self.entries["ground_temp"].insert(0, str(config.init_ground_surface_temp))
-        
-        # Bohrloch
-        self.entries["borehole_diameter"].delete(0, tk.END)
-        self.entries["borehole_diameter"].insert(0, str(config.borehole_diameter))
+        updates = {
+            # Bodeneigenschaften
+            "ground_thermal_cond": config.thermal_conductivity_ground,
+            "ground_heat_cap": config.heat_capacity,
+            "ground_temp": config.init_ground_surface_temp,
+            # Bohrloch
+            "borehole_diameter": config.borehole_diameter,
+            # Verfüllung
+            "grout_thermal_cond": config.thermal_conductivity_fill,
+            # Lasten
+            "annual_heating": config.annual_heat_load,
+            "annual_cooling": config.annual_cool_load,
+            "heat_pump_cop": config.spf_heat,
+            # Temperaturanforderungen
+            "min_fluid_temp": config.tfluid_min_required,
+            "max_fluid_temp": config.tfluid_max_required,
+        }
         
         # Rohr
         if config.u_pipe_diameter > 0:
-            self.entries["pipe_outer_diameter"].delete(0, tk.END)
-            self.entries["pipe_outer_diameter"].insert(0, str(config.u_pipe_diameter))
-            
-            self.entries["pipe_thickness"].delete(0, tk.END)
-            self.entries["pipe_thickness"].insert(0, str(config.u_pipe_thickness))
-            
-            self.entries["pipe_thermal_cond"].delete(0, tk.END)
-            self.entries["pipe_thermal_cond"].insert(0, str(config.u_pipe_thermal_conductivity))
-            
-            self.entries["shank_spacing"].delete(0, tk.END)
-            self.entries["shank_spacing"].insert(0, str(config.u_pipe_shank_space))
-        
-        # Verfüllung
-        self.entries["grout_thermal_cond"].delete(0, tk.END)
-        self.entries["grout_thermal_cond"].insert(0, str(config.thermal_conductivity_fill))
+            updates.update({
+                "pipe_outer_diameter": config.u_pipe_diameter,
+                "pipe_thickness": config.u_pipe_thickness,
+                "pipe_thermal_cond": config.u_pipe_thermal_conductivity,
+                "shank_spacing": config.u_pipe_shank_space,
+            })
         
         # Fluid
         if config.hc_thermal_conductivity > 0:
-            self.entries["fluid_thermal_cond"].delete(0, tk.END)
-            self.entries["fluid_thermal_cond"].insert(0, str(config.hc_thermal_conductivity))
-            
-            self.entries["fluid_heat_cap"].delete(0, tk.END)
-            self.entries["fluid_heat_cap"].insert(0, str(config.hc_heat_capacity))
-            
-            self.entries["fluid_density"].delete(0, tk.END)
-            self.entries["fluid_density"].insert(0, str(config.hc_density))
-            
-            self.entries["fluid_viscosity"].delete(0, tk.END)
-            self.entries["fluid_viscosity"].insert(0, str(abs(config.hc_viscosity)))
-        
-        # Lasten
-        self.entries["annual_heating"].delete(0, tk.END)
-        self.entries["annual_heating"].insert(0, str(config.annual_heat_load))
-        
-        self.entries["annual_cooling"].delete(0, tk.END)
-        self.entries["annual_cooling"].insert(0, str(config.annual_cool_load))
-        
-        self.entries["heat_pump_cop"].delete(0, tk.END)
-        self.entries["heat_pump_cop"].insert(0, str(config.spf_heat))
-        
-        # Temperaturanforderungen
-        self.entries["min_fluid_temp"].delete(0, tk.END)
-        self.entries["min_fluid_temp"].insert(0, str(config.tfluid_min_required))
-        
-        self.entries["max_fluid_temp"].delete(0, tk.END)
-        self.entries["max_fluid_temp"].insert(0, str(config.tfluid_max_required))
+            updates.update({
+                "fluid_thermal_cond": config.hc_thermal_conductivity,
+                "fluid_heat_cap": config.hc_heat_capacity,
+                "fluid_density": config.hc_density,
+                "fluid_viscosity": abs(config.hc_viscosity),
+            })
+        
+        # Ein var.set() pro Feld, danach ein gemeinsamer Redraw
+        for key, value in updates.items():
+            self.entry_vars[key].set(str(value))
+        self.root.update_idletasks()
     
-    def _update_pipe_combo(self):
-        """Aktualisiert die Rohrtyp-Combobox."""
+    def _update_pipe_combo(self, select_first=True):
+        """Aktualisiert die Rohrtyp-Combobox (optional ohne Auswahl des ersten Eintrags)."""
         if self.pipes:
             pipe_names = [pipe.name for pipe in self.pipes]
             self.pipe_type_combo['values'] = pipe_names
-            self.pipe_type_combo.current(0)
-            self._on_pipe_selected(None)
+            if select_first:
+                self.pipe_type_combo.current(0)
+                self._on_pipe_selected(None)
     
     def _on_pipe_selected(self, event):
         """Callback wenn ein Rohrtyp ausgewählt wird."""
@@ -621,14 +842,9 @@ class GeothermieGUIExtended:
         for pipe in self.pipes:
             if pipe.name == selected_name:
                 # Aktualisiere Eingabefelder
-                self.entries["pipe_outer_diameter"].delete(0, tk.END)
-                self.entries["pipe_outer_diameter"].insert(0, f"{pipe.diameter_m:.4f}")
-                
-                self.entries["pipe_thickness"].delete(0, tk.END)
-                self.entries["pipe_thickness"].insert(0, f"{pipe.thickness_m:.4f}")
-                
-                self.entries["pipe_thermal_cond"].delete(0, tk.END)
-                self.entries["pipe_thermal_cond"].insert(0, str(pipe.thermal_conductivity))
+                self.entry_vars["pipe_outer_diameter"].set(f"{pipe.diameter_m:.4f}")
+                self.entry_vars["pipe_thickness"].set(f"{pipe.thickness_m:.4f}")
+                self.entry_vars["pipe_thermal_cond"].set(str(pipe.thermal_conductivity))
                 break
     
     def _on_soil_type_selected(self, event):
@@ -638,13 +854,11 @@ class GeothermieGUIExtended:
         
         if soil:
             # Aktualisiere Wärmeleitfähigkeit
-            self.entries["ground_thermal_cond"].delete(0, tk.END)
-            self.entries["ground_thermal_cond"].insert(0, f"{soil.thermal_conductivity_typical:.1f}")
+            self.entry_vars["ground_thermal_cond"].set(f"{soil.thermal_conductivity_typical:.1f}")
             
             # Aktualisiere Wärmekapazität (MJ/m³·K → J/m³·K)
             heat_cap_j = soil.heat_capacity_typical * 1_000_000
-            self.entries["ground_heat_cap"].delete(0, tk.END)
-            self.entries["ground_heat_cap"].insert(0, f"{heat_cap_j:.0f}")
+            self.entry_vars["ground_heat_cap"].set(f"{heat_cap_j:.0f}")
             
             self.status_var.set(f"✓ Bodentyp '{selected_name}' ausgewählt: λ={soil.thermal_conductivity_typical} W/m·K")
     
@@ -655,8 +869,7 @@ class GeothermieGUIExtended:
         
         if material:
             # Aktualisiere Wärmeleitfähigkeit
-            self.entries["grout_thermal_cond"].delete(0, tk.END)
-            self.entries["grout_thermal_cond"].insert(0, f"{material.thermal_conductivity:.1f}")
+            self.entry_vars["grout_thermal_cond"].set(f"{material.thermal_conductivity:.1f}")
             
             self.status_var.set(f"✓ Verfüllmaterial '{selected_name}' ausgewählt: λ={material.thermal_conductivity} W/m·K")
     
@@ -665,7 +878,7 @@ class GeothermieGUIExtended:
         # Dialog für Standorteingabe
         dialog = tk.Toplevel(self.root)
         dialog.title("PVGIS Klimadaten")
-        dialog.geometry("400x150")
+        dialog.geometry("400x180")
         dialog.transient(self.root)
         dialog.grab_set()
         
@@ -684,111 +897,145 @@ class GeothermieGUIExtended:
         lon_entry.insert(0, "13.40")  # Berlin als Beispiel
         lon_entry.grid(row=1, column=1, padx=5, pady=5)
         
+        progress = ttk.Progressbar(dialog, mode='indeterminate', length=200)
+        
         def fetch_data():
             try:
                 lat = float(lat_entry.get())
                 lon = float(lon_entry.get())
-                
-                self.status_var.set("⏳ Lade Klimadaten von PVGIS...")
-                self.root.update()
-                
-                climate_data = get_climate_data(lat, lon)
-                
-                if climate_data:
-                    # Aktualisiere Bodentemperatur
-                    ground_temp = SoilTypeDB.estimate_ground_temperature(
-                        climate_data['avg_temp'],
-                        climate_data['coldest_month_temp']
-                    )
-                    
-                    self.entries["ground_temp"].delete(0, tk.END)
-                    self.entries["ground_temp"].insert(0, f"{ground_temp:.1f}")
-                    
-                    self.status_var.set(
-                        f"✓ Klimadaten geladen: Ø {climate_data['avg_temp']:.1f}°C, "
-                        f"Boden geschätzt: {ground_temp:.1f}°C"
-                    )
-                    
-                    messagebox.showinfo(
-                        "Klimadaten geladen",
-                        f"Durchschnittstemperatur: {climate_data['avg_temp']:.1f}°C\n"
-                        f"Kältester Monat: {climate_data['coldest_month_temp']:.1f}°C\n"
-                        f"Geschätzte Bodentemperatur: {ground_temp:.1f}°C"
-                    )
-                    
-                    dialog.destroy()
-                else:
-                    messagebox.showerror("Fehler", "Keine Daten von PVGIS erhalten.")
-                    self.status_var.set("❌ PVGIS-Abfrage fehlgeschlagen")
-                    
             except ValueError:
                 messagebox.showerror("Eingabefehler", "Ungültige Koordinaten!")
-            except Exception as e:
-                messagebox.showerror("Fehler", f"Fehler beim Laden: {str(e)}")
-                self.status_var.set("❌ PVGIS-Fehler")
+                return
+            
+            self.status_var.set("⏳ Lade Klimadaten von PVGIS...")
+            load_button.config(state=tk.DISABLED)
+            progress.pack(pady=5)
+            progress.start(10)
+            
+            # HTTP-Abfrage im Hintergrund, Ergebnis per Polling im Tk-Thread
+            future = self._io_executor.submit(get_climate_data, lat, lon)
+            self._poll_future(
+                future,
+                lambda fut: self._apply_pvgis(fut, dialog, load_button, progress),
+                interval=50
+            )
+        
+        load_button = ttk.Button(dialog, text="Laden", command=fetch_data)
+        load_button.pack(pady=10)
+    
+    def _apply_pvgis(self, future, dialog, load_button, progress):
+        """Übernimmt das PVGIS-Ergebnis im Tk-Hauptthread."""
+        if dialog.winfo_exists():
+            progress.stop()
+            progress.pack_forget()
+            load_button.config(state=tk.NORMAL)
+        
+        try:
+            climate_data = future.result()
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim Laden: {str(e)}")
+            self.status_var.set("❌ PVGIS-Fehler")
+            return
+        
+        if not climate_data:
+            messagebox.showerror("Fehler", "Keine Daten von PVGIS erhalten.")
+            self.status_var.set("❌ PVGIS-Abfrage fehlgeschlagen")
+            return
+        
+        # Aktualisiere Bodentemperatur
+        ground_temp = SoilTypeDB.estimate_ground_temperature(
+            climate_data['avg_temp'],
+            climate_data['coldest_month_temp']
+        )
+        
+        self.entry_vars["ground_temp"].set(f"{ground_temp:.1f}")
+        
+        self.status_var.set(
+            f"✓ Klimadaten geladen: Ø {climate_data['avg_temp']:.1f}°C, "
+            f"Boden geschätzt: {ground_temp:.1f}°C"
+        )
+        
+        self._notify_success(
+            "Klimadaten geladen",
+            f"Durchschnittstemperatur: {climate_data['avg_temp']:.1f}°C\n"
+            f"Kältester Monat: {climate_data['coldest_month_temp']:.1f}°C\n"
+            f"Geschätzte Bodentemperatur: {ground_temp:.1f}°C"
+        )
         
-        ttk.Button(dialog, text="Laden", command=fetch_data).pack(pady=10)
+        if dialog.winfo_exists():
+            dialog.destroy()
     
     def _run_calculation(self):
-        """Führt die Berechnung durch."""
+        """Startet die Berechnung im Hintergrund-Thread."""
+        if self._calc_future is not None and not self._calc_future.done():
+            return
         try:
-            # Sammle Eingabewerte
-            params = {}
-            for key, entry in self.entries.items():
-                params[key] = float(entry.get())
+            # Eingabewerte sind bereits beim Tippen geparst worden
+            invalid = [key for key in (*self.entries, *self.borehole_entries)
+                       if key not in self._values]
+            if invalid:
+                raise ValueError(f"Kein gültiger Zahlenwert für: {', '.join(invalid)}")
+            params = dict(self._values)
             
-            # Status aktualisieren
-            self.status_var.set("⏳ Berechnung läuft...")
-            self.root.update()
+            # Angezeigte Eingaben mit in den Schnappschuss aufnehmen
+            for key in self.project_entries:
+                params[key] = self._entry_getters[key]()
+            params['pipe_configuration'] = self.pipe_config_var.get()
             
             # Konvertiere Rohrkonfiguration
-            pipe_config = self.pipe_config_var.get()
+            pipe_config = params['pipe_configuration']
             if "4-rohr" in pipe_config:
                 # Behandle 4-Rohr wie Double-U
                 pipe_config = "double-u"
             
-            # Berechnung durchführen (mit Einheiten-Umrechnung)
-            self.result = self.calculator.calculate_required_depth(
-                ground_thermal_conductivity=params["ground_thermal_cond"],
-                ground_heat_capacity=params["ground_heat_cap"],
-                undisturbed_ground_temp=params["ground_temp"],
-                geothermal_gradient=params["geothermal_gradient"],
-                borehole_diameter=params["borehole_diameter"] / 1000,  # mm → m
-                pipe_configuration=pipe_config,
-                pipe_outer_diameter=params["pipe_outer_diameter"],
-                pipe_wall_thickness=params["pipe_thickness"],
-                pipe_thermal_conductivity=params["pipe_thermal_cond"],
-                shank_spacing=params["shank_spacing"] / 1000,  # mm → m
-                grout_thermal_conductivity=params["grout_thermal_cond"],
-                fluid_thermal_conductivity=params["fluid_thermal_cond"],
-                fluid_heat_capacity=params["fluid_heat_cap"],
-                fluid_density=params["fluid_density"],
-                fluid_viscosity=params["fluid_viscosity"],
-                fluid_flow_rate=params["fluid_flow_rate"],
-                annual_heating_demand=params["annual_heating"] / 1000,  # kWh → MWh
-                annual_cooling_demand=params["annual_cooling"] / 1000,  # kWh → MWh
-                peak_heating_load=params["peak_heating"],
-                peak_cooling_load=params["peak_cooling"],
-                heat_pump_cop=params["heat_pump_cop"],
-                min_fluid_temperature=params["min_fluid_temp"],
-                max_fluid_temperature=params["max_fluid_temp"],
-                simulation_years=int(params["simulation_years"]),
-                initial_depth=params["initial_depth"]
-            )
+            # Berechnungsparameter (Einheiten-Umrechnung über die Tabelle)
+            calc_kwargs = {
+                arg: params[key] / divisor
+                for arg, key, divisor in self._PARAM_TRANSFORMS
+            }
+            calc_kwargs["pipe_configuration"] = pipe_config
+            calc_kwargs["simulation_years"] = int(calc_kwargs["simulation_years"])
+        except ValueError as e:
+            messagebox.showerror("Eingabefehler", f"Ungültige Eingabe: {str(e)}")
+            self.status_var.set("❌ Berechnung fehlgeschlagen - Eingabefehler")
+            return
+        
+        # Status aktualisieren, Button sperren bis das Ergebnis da ist
+        self.status_var.set("⏳ Berechnung läuft...")
+        self.calc_button.state(['disabled'])
+        self.root.update_idletasks()
+        
+        # Berechnung im Worker, Ergebnis per Polling im Tk-Hauptthread abholen
+        self._calc_future = self._executor.submit(
+            self.calculator.calculate_required_depth, **calc_kwargs
+        )
+        self._poll_future(
+            self._calc_future,
+            lambda future: self._on_calculation_done(future, params)
+        )
+    
+    def _on_calculation_done(self, future, params):
+        """Übernimmt das Berechnungsergebnis im Tk-Hauptthread."""
+        self.calc_button.state(['!disabled'])
+        try:
+            result = future.result()
+            self.result = result
             
             # Speichere Parameter für PDF
             self.current_params = params
-            self.current_params['pipe_configuration'] = self.pipe_config_var.get()
+            
+            # Eingaben für den nächsten Start merken
+            self._save_session()
             
             # Ergebnisse anzeigen
-            self._display_results()
+            self._display_results(params)
             self._plot_results()
             
             # Status aktualisieren
-            num_boreholes = int(self.borehole_entries["num_boreholes"].get())
-            total_depth = self.result.required_depth * num_boreholes
+            num_boreholes = int(params["num_boreholes"])
+            total_depth = result.required_depth * num_boreholes
             self.status_var.set(
-                f"✓ Berechnung erfolgreich! Tiefe: {self.result.required_depth:.1f}m pro Bohrung "
+                f"✓ Berechnung erfolgreich! Tiefe: {result.required_depth:.1f}m pro Bohrung "
                 f"({num_boreholes} Bohrungen = {total_depth:.1f}m gesamt)"
             )
             
@@ -802,182 +1049,233 @@ class GeothermieGUIExtended:
             messagebox.showerror("Fehler", f"Fehler bei der Berechnung: {str(e)}")
             self.status_var.set("❌ Berechnung fehlgeschlagen")
     
-    def _display_results(self):
-        """Zeigt die Ergebnisse im Text-Widget an."""
-        if not self.result:
+    def _display_results(self, params):
+        """Zeigt die Ergebnisse im Text-Widget an (Eingaben aus dem Berechnungs-Schnappschuss)."""
+        result = self.result
+        if not result:
             return
         
-        num_boreholes = int(self.borehole_entries["num_boreholes"].get())
-        total_depth = self.result.required_depth * num_boreholes
+        num_boreholes = int(params["num_boreholes"])
+        total_depth = result.required_depth * num_boreholes
         
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete("1.0", tk.END)
+        rule = "=" * 70
+        sep = "-" * 70
+        total_power = result.heat_extraction_rate * total_depth / 1000
         
-        text = "=" * 70 + "\n"
-        text += "         ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS\n"
-        text += "=" * 70 + "\n\n"
+        # Bericht als Liste von Blöcken aufbauen, am Ende ein einziges join
+        parts = [f"{rule}\n         ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS\n{rule}\n\n"]
         
         # Projekt-Info
-        proj_name = self.project_entries["project_name"].get()
+        proj_name = params.get("project_name")
         if proj_name:
-            text += f"Projekt: {proj_name}\n"
-            text += f"Kunde:   {self.project_entries['customer_name'].get()}\n\n"
-        
-        text += "BOHRFELD-KONFIGURATION\n"
-        text += "-" * 70 + "\n"
-        text += f"Anzahl Bohrungen:              {num_boreholes:>10}\n"
-        text += f"Tiefe pro Bohrung:             {self.result.required_depth:>10.1f} m\n"
-        text += f"Gesamte Bohrmeter:             {total_depth:>10.1f} m\n"
-        text += f"Abstand zwischen Bohrungen:    {self.borehole_entries['spacing_between'].get():>10} m\n"
-        text += f"Abstand zum Grundstück:        {self.borehole_entries['spacing_property'].get():>10} m\n"
-        text += f"Abstand zum Gebäude:           {self.borehole_entries['spacing_building'].get():>10} m\n\n"
-        
-        text += "LEISTUNGSDATEN\n"
-        text += "-" * 70 + "\n"
-        text += f"Wärmeentzugsrate:              {self.result.heat_extraction_rate:>10.2f} W/m\n"
-        total_power = self.result.heat_extraction_rate * total_depth / 1000
-        text += f"Gesamtleistung Bohrfeld:       {total_power:>10.2f} kW\n\n"
-        
-        text += "TEMPERATUREN\n"
-        text += "-" * 70 + "\n"
-        text += f"Min. Fluidtemperatur:          {self.result.fluid_temperature_min:>10.2f} °C\n"
-        text += f"Max. Fluidtemperatur:          {self.result.fluid_temperature_max:>10.2f} °C\n\n"
-        
-        text += "THERMISCHE WIDERSTÄNDE\n"
-        text += "-" * 70 + "\n"
-        text += f"Bohrloch-Widerstand (Rb):      {self.result.borehole_resistance:>10.4f} m·K/W\n"
-        text += f"Effektiver Widerstand:         {self.result.effective_resistance:>10.4f} m·K/W\n\n"
-        
-        text += "MONATLICHE DURCHSCHNITTSTEMPERATUREN\n"
-        text += "-" * 70 + "\n"
-        months = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
-                  "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-        for i, (month, temp) in enumerate(zip(months, self.result.monthly_temperatures)):
-            text += f"{month}: {temp:>6.2f} °C    "
-            if (i + 1) % 3 == 0:
-                text += "\n"
-        
-        text += "\n\n"
-        text += "=" * 70 + "\n"
-        text += "Berechnungsmethode: G-Funktionen (Eskilson), VDI 4640\n"
-        text += "=" * 70 + "\n"
-        
-        self.results_text.insert("1.0", text)
+            parts.append(
+                f"Projekt: {proj_name}\n"
+                f"Kunde:   {params.get('customer_name', '')}\n\n"
+            )
+        
+        parts.append(
+            f"BOHRFELD-KONFIGURATION\n{sep}\n"
+            f"Anzahl Bohrungen:              {num_boreholes:>10}\n"
+            f"Tiefe pro Bohrung:             {result.required_depth:>10.1f} m\n"
+            f"Gesamte Bohrmeter:             {total_depth:>10.1f} m\n"
+            f"Abstand zwischen Bohrungen:    {params['spacing_between']:>10g} m\n"
+            f"Abstand zum Grundstück:        {params['spacing_property']:>10g} m\n"
+            f"Abstand zum Gebäude:           {params['spacing_building']:>10g} m\n\n"
+            
+            f"LEISTUNGSDATEN\n{sep}\n"
+            f"Wärmeentzugsrate:              {result.heat_extraction_rate:>10.2f} W/m\n"
+            f"Gesamtleistung Bohrfeld:       {total_power:>10.2f} kW\n\n"
+            
+            f"TEMPERATUREN\n{sep}\n"
+            f"Min. Fluidtemperatur:          {result.fluid_temperature_min:>10.2f} °C\n"
+            f"Max. Fluidtemperatur:          {result.fluid_temperature_max:>10.2f} °C\n\n"
+            
+            f"THERMISCHE WIDERSTÄNDE\n{sep}\n"
+            f"Bohrloch-Widerstand (Rb):      {result.borehole_resistance:>10.4f} m·K/W\n"
+            f"Effektiver Widerstand:         {result.effective_resistance:>10.4f} m·K/W\n\n"
+            
+            f"MONATLICHE DURCHSCHNITTSTEMPERATUREN\n{sep}\n"
+        )
+        parts.append("".join(
+            _MONTH_ROW_FMT.format(month, temp) + ("\n" if i % 3 == 2 else "")
+            for i, (month, temp) in enumerate(zip(_MONTHS_DE, result.monthly_temperatures))
+        ))
+        
+        parts.append(
+            f"\n\n{rule}\n"
+            "Berechnungsmethode: G-Funktionen (Eskilson), VDI 4640\n"
+            f"{rule}\n"
+        )
+        
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete("1.0", tk.END)
+        self.results_text.insert("1.0", "".join(parts))
+        self._report_parts = parts
         self.results_text.config(state=tk.DISABLED)
     
-    def _plot_results(self):
-        """Erstellt Visualisierungen der Ergebnisse."""
-        if not self.result:
-            return
-        
+    def _build_result_plots(self):
+        """Legt Achsen und wiederverwendbare Artists der Diagramme einmalig an."""
         self.fig.clear()
         
         # 3 Subplots
         ax1 = self.fig.add_subplot(1, 3, 1)
         ax2 = self.fig.add_subplot(1, 3, 2)
         ax3 = self.fig.add_subplot(1, 3, 3)
+        self._result_axes = (ax1, ax2, ax3)
         
         # Plot 1: Monatliche Temperaturen
-        months = ["J", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D"]
-        x = np.arange(len(months))
-        
-        ax1.plot(x, self.result.monthly_temperatures, 'o-', linewidth=2.5, markersize=8, color='#1f4788')
-        ax1.axhline(y=self.result.fluid_temperature_min, color='b', linestyle='--', linewidth=2,
-                    label=f'Min: {self.result.fluid_temperature_min:.1f}°C')
-        ax1.axhline(y=self.result.fluid_temperature_max, color='r', linestyle='--', linewidth=2,
-                    label=f'Max: {self.result.fluid_temperature_max:.1f}°C')
+        x = np.arange(len(_MONTHS_INIT))
+        
+        self._ax1_line, = ax1.plot(x, np.zeros(len(_MONTHS_INIT)), 'o-', linewidth=2.5,
+                                   markersize=8, color='#1f4788')
+        self._month_hlines = (
+            ax1.axhline(y=0, color='b', linestyle='--', linewidth=2),
+            ax1.axhline(y=0, color='r', linestyle='--', linewidth=2),
+        )
         ax1.set_xlabel('Monat', fontsize=11, fontweight='bold')
         ax1.set_ylabel('Temperatur [°C]', fontsize=11, fontweight='bold')
         ax1.set_title('Monatliche Temperaturen', fontsize=12, fontweight='bold')
         ax1.set_xticks(x)
-        ax1.set_xticklabels(months)
+        ax1.set_xticklabels(_MONTHS_INIT)
         ax1.grid(True, alpha=0.3)
+        
+        # Plot 2: Bohrloch-Schema (Bohrloch + 4 Rohre)
+        self._ax2_borehole = Circle((0, 0), 1.0, facecolor='#d9d9d9', 
+                                    edgecolor='black', linewidth=2)
+        ax2.add_patch(self._ax2_borehole)
+        
+        # Alle Rohre als eine EllipseCollection in Datenkoordinaten
+        n_pipes = len(_PIPE_COLORS)
+        self._ax2_pipes = EllipseCollection(
+            np.full(n_pipes, 0.2), np.full(n_pipes, 0.2), np.zeros(n_pipes),
+            units='xy', offsets=np.zeros((n_pipes, 2)), offset_transform=ax2.transData,
+            facecolors=_PIPE_COLORS, edgecolors='black', linewidths=1, alpha=0.8
+        )
+        ax2.add_collection(self._ax2_pipes)
+        self._ax2_labels = [
+            ax2.text(0, 0, str(i+1), ha='center', va='center', 
+                     fontsize=9, fontweight='bold', color='white')
+            for i in range(n_pipes)
+        ]
+        
+        ax2.set_aspect('equal')
+        ax2.axis('off')
+        
+        # Plot 3: Bohrfeld-Layout (Bohrungen werden bei Bedarf neu aufgebaut)
+        ax3.set_aspect('equal')
+        ax3.set_xlabel('Abstand [m]', fontsize=10)
+        ax3.set_ylabel('Abstand [m]', fontsize=10)
+        ax3.grid(True, alpha=0.3)
+        self._field_key = None
+        self._field_artists = []
+    
+    def _plot_results(self):
+        """Aktualisiert die Visualisierungen der Ergebnisse."""
+        result = self.result
+        if not result:
+            return
+        
+        if self._result_axes is None:
+            self._build_result_plots()
+        ax1, ax2, ax3 = self._result_axes
+        
+        # Plot 1: Monatliche Temperaturen
+        self._ax1_line.set_ydata(result.monthly_temperature_array)
+        hline_min, hline_max = self._month_hlines
+        hline_min.set_ydata([result.fluid_temperature_min] * 2)
+        hline_min.set_label(f'Min: {result.fluid_temperature_min:.1f}°C')
+        hline_max.set_ydata([result.fluid_temperature_max] * 2)
+        hline_max.set_label(f'Max: {result.fluid_temperature_max:.1f}°C')
+        ax1.relim()
+        ax1.autoscale_view()
         ax1.legend(fontsize=9)
         
+        # Werte aus dem Parametersatz der Berechnung (schon geparst)
+        params = self.current_params
+        
         # Plot 2: Bohrloch-Schema
-        bh_diameter = float(self.entries["borehole_diameter"].get())
-        pipe_diameter = float(self.entries["pipe_outer_diameter"].get())
+        bh_diameter = params["borehole_diameter"] / 1000  # mm → m
+        pipe_diameter = params["pipe_outer_diameter"]
         
         scale = 100
         bh_radius = (bh_diameter / 2) * scale
         pipe_radius = (pipe_diameter / 2) * scale
         
-        # Bohrloch
-        borehole = Circle((0, 0), bh_radius, facecolor='#d9d9d9', 
-                         edgecolor='black', linewidth=2)
-        ax2.add_patch(borehole)
-        
-        # 4 Rohre
-        positions = [
-            (-bh_radius*0.5, bh_radius*0.5),
-            (bh_radius*0.5, bh_radius*0.5),
-            (-bh_radius*0.5, -bh_radius*0.5),
-            (bh_radius*0.5, -bh_radius*0.5)
-        ]
-        
-        colors_pipes = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
-        
-        for i, ((x, y), color) in enumerate(zip(positions, colors_pipes)):
-            pipe = Circle((x, y), pipe_radius*1.5, facecolor=color, 
-                         edgecolor='black', linewidth=1, alpha=0.8)
-            ax2.add_patch(pipe)
-            ax2.text(x, y, str(i+1), ha='center', va='center', 
-                    fontsize=9, fontweight='bold', color='white')
+        self._ax2_borehole.set_radius(bh_radius)
+        offsets = _PIPE_OFFSETS_UNIT * bh_radius
+        pipe_sizes = np.full(len(offsets), 2 * pipe_radius*1.5)
+        self._ax2_pipes.set_offsets(offsets)
+        self._ax2_pipes.set_widths(pipe_sizes)
+        self._ax2_pipes.set_heights(pipe_sizes)
+        for label, (x, y) in zip(self._ax2_labels, offsets):
+            label.set_position((x, y))
         
         ax2.set_xlim(-bh_radius*1.5, bh_radius*1.5)
         ax2.set_ylim(-bh_radius*1.5, bh_radius*1.5)
-        ax2.set_aspect('equal')
         ax2.set_title(f'Bohrloch-Querschnitt\nØ {bh_diameter*1000:.0f} mm', 
                      fontsize=12, fontweight='bold')
-        ax2.axis('off')
         
-        # Plot 3: Bohrfeld-Layout
-        num_boreholes = int(self.borehole_entries["num_boreholes"].get())
-        spacing = float(self.borehole_entries["spacing_between"].get())
+        # Plot 3: Bohrfeld-Layout, nur bei geänderter Geometrie neu aufbauen
+        num_boreholes = int(params["num_boreholes"])
+        spacing = params["spacing_between"]
+        root = math.isqrt(num_boreholes)
+        boreholes_per_row = root if root * root == num_boreholes else root + 1
         
-        # Berechne Positionen (einfache Reihen-Anordnung)
-        boreholes_per_row = int(np.ceil(np.sqrt(num_boreholes)))
-        positions_field = []
+        field_key = (num_boreholes, boreholes_per_row, spacing)
+        if field_key != self._field_key:
+            self._rebuild_borefield_layout(ax3, num_boreholes, boreholes_per_row, spacing)
+            self._field_key = field_key
         
-        for i in range(num_boreholes):
-            row = i // boreholes_per_row
-            col = i % boreholes_per_row
-            positions_field.append((col * spacing, row * spacing))
+        self.fig.tight_layout()
+        if self._is_tab_visible(self.viz_frame):
+            self.canvas.draw_idle()
+        else:
+            self._viz_dirty = True
+    
+    def _rebuild_borefield_layout(self, ax3, num_boreholes, boreholes_per_row, spacing):
+        """Ersetzt die Bohrfeld-Artists für eine neue Anordnung."""
+        for artist in self._field_artists:
+            artist.remove()
+        artists = []
         
-        for i, (x, y) in enumerate(positions_field):
-            circle = Circle((x, y), 0.3, facecolor='#1f4788', 
-                           edgecolor='black', linewidth=1.5)
-            ax3.add_patch(circle)
-            ax3.text(x, y, str(i+1), ha='center', va='center', 
-                    fontsize=8, fontweight='bold', color='white')
+        # Berechne Positionen (einfache Reihen-Anordnung)
+        rows, cols = np.divmod(np.arange(num_boreholes), boreholes_per_row)
+        xs, ys = cols * spacing, rows * spacing
+        
+        # Alle Bohrungen als eine EllipseCollection in Datenkoordinaten
+        # (ein Draw-Aufruf, ohne N einzelne Circle-Objekte anzulegen)
+        diameters = np.full(num_boreholes, 0.6)
+        artists.append(ax3.add_collection(EllipseCollection(
+            diameters, diameters, np.zeros(num_boreholes), units='xy',
+            offsets=np.column_stack([xs, ys]), offset_transform=ax3.transData,
+            facecolors='#1f4788', edgecolors='black', linewidths=1.5
+        )))
+        for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            artists.append(ax3.text(x, y, str(i+1), ha='center', va='center', 
+                                    fontsize=8, fontweight='bold', color='white'))
         
         # Abstände einzeichnen
         if num_boreholes > 1:
-            ax3.plot([0, spacing], [-1, -1], 'k-', linewidth=1.5)
-            ax3.plot([0, 0], [-0.8, -1.2], 'k-', linewidth=1.5)
-            ax3.plot([spacing, spacing], [-0.8, -1.2], 'k-', linewidth=1.5)
-            ax3.text(spacing/2, -1.5, f'{spacing} m', ha='center', fontsize=9)
+            artists += ax3.plot([0, spacing], [-1, -1], 'k-', linewidth=1.5)
+            artists += ax3.plot([0, 0], [-0.8, -1.2], 'k-', linewidth=1.5)
+            artists += ax3.plot([spacing, spacing], [-0.8, -1.2], 'k-', linewidth=1.5)
+            artists.append(ax3.text(spacing/2, -1.5, f'{spacing} m', ha='center', fontsize=9))
         
         ax3.set_xlim(-2, max(spacing * boreholes_per_row, 5))
-        ax3.set_ylim(-3, max(spacing * np.ceil(num_boreholes / boreholes_per_row), 5))
-        ax3.set_aspect('equal')
+        ax3.set_ylim(-3, max(spacing * -(-num_boreholes // boreholes_per_row), 5))
         ax3.set_title(f'Bohrfeld-Layout\n{num_boreholes} Bohrungen', 
                      fontsize=12, fontweight='bold')
-        ax3.set_xlabel('Abstand [m]', fontsize=10)
-        ax3.set_ylabel('Abstand [m]', fontsize=10)
-        ax3.grid(True, alpha=0.3)
-        
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._field_artists = artists
     
     def _export_pdf(self):
         """Exportiert einen PDF-Bericht."""
-        if not self.result:
+        result = self.result
+        if not result:
             messagebox.showwarning("Keine Daten", "Bitte zuerst eine Berechnung durchführen.")
             return
         
         # Dateinamen vorschlagen
-        project_name = self.project_entries["project_name"].get() or "Projekt"
+        project_name = self._entry_getters["project_name"]() or "Projekt"
         default_filename = f"Bericht_{project_name.replace(' ', '_')}.pdf"
         
         filename = filedialog.asksaveasfilename(
@@ -987,40 +1285,73 @@ class GeothermieGUIExtended:
             filetypes=[("PDF-Dateien", "*.pdf"), ("Alle Dateien", "*.*")]
         )
         
-        if filename:
-            try:
-                self.status_var.set("📄 PDF-Bericht wird erstellt...")
-                self.root.update()
-                
-                # Sammle Projektinformationen
-                project_info = {}
-                for key, entry in self.project_entries.items():
-                    project_info[key] = entry.get()
-                
-                # Sammle Bohrfeld-Konfiguration
-                borehole_config = {}
-                for key, entry in self.borehole_entries.items():
-                    borehole_config[key] = float(entry.get()) if entry.get() else 0
-                
-                # Generiere PDF
-                self.pdf_generator.generate_report(
-                    filename,
-                    self.result,
-                    self.current_params,
-                    project_info,
-                    borehole_config
-                )
-                
-                self.status_var.set(f"✓ PDF-Bericht erfolgreich erstellt: {os.path.basename(filename)}")
-                messagebox.showinfo("Erfolg", f"PDF-Bericht wurde erstellt:\n{filename}")
-                
-            except Exception as e:
-                messagebox.showerror("Fehler", f"Fehler beim PDF-Export: {str(e)}")
-                self.status_var.set("❌ PDF-Export fehlgeschlagen")
+        if not filename:
+            return
+        
+        try:
+            getters = self._entry_getters
+            
+            # Nur seit dem letzten Export geänderte Felder neu einlesen
+            for key in list(self._dirty_fields):
+                if key in self.project_entries:
+                    self._project_cache[key] = getters[key]()
+                else:
+                    value = getters[key]()
+                    self._borehole_cache[key] = float(value) if value else 0
+                self._dirty_fields.discard(key)
+            
+            project_info = dict(self._project_cache)
+            borehole_config = dict(self._borehole_cache)
+        except ValueError as e:
+            messagebox.showerror("Fehler", f"Fehler beim PDF-Export: {str(e)}")
+            self.status_var.set("❌ PDF-Export fehlgeschlagen")
+            return
+        
+        if self.pdf_generator is None:
+            from utils import PDFReportGenerator
+            self.pdf_generator = PDFReportGenerator()
+        
+        self.status_var.set("📄 PDF-Bericht wird erstellt...")
+        self.status_progress.pack(side=tk.RIGHT, padx=5)
+        self.status_progress.start(10)
+        
+        # PDF im Worker erzeugen (Diagramme nur über Agg), GUI bleibt bedienbar
+        future = self._executor.submit(
+            self.pdf_generator.generate_report,
+            filename,
+            result,
+            dict(self.current_params),
+            project_info,
+            borehole_config
+        )
+        self._poll_future(future, lambda fut: self._pdf_done(fut, filename))
+    
+    def _poll_future(self, future, on_done, interval=100):
+        """Prüft per root.after, ob ein Future fertig ist, ohne zu blockieren."""
+        if future.done():
+            on_done(future)
+        else:
+            self.root.after(interval, self._poll_future, future, on_done, interval)
+    
+    def _pdf_done(self, future, filename):
+        """Schließt den PDF-Export im Tk-Hauptthread ab."""
+        self.status_progress.stop()
+        self.status_progress.pack_forget()
+        
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim PDF-Export: {str(e)}")
+            self.status_var.set("❌ PDF-Export fehlgeschlagen")
+            return
+        
+        self.status_var.set(f"✓ PDF-Bericht erfolgreich erstellt: {os.path.basename(filename)}")
+        self._notify_success("Erfolg", f"PDF-Bericht wurde erstellt:\n{filename}")
     
     def _export_results(self):
         """Exportiert die Ergebnisse als Textdatei."""
-        if not self.result:
+        result = self.result
+        if not result:
             messagebox.showwarning("Keine Daten", "Keine Berechnungsergebnisse zum Exportieren vorhanden.")
             return
         
@@ -1032,9 +1363,11 @@ class GeothermieGUIExtended:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.results_text.get("1.0", tk.END))
-                messagebox.showinfo("Erfolg", f"Ergebnisse wurden gespeichert.")
+                # Berichtsblöcke direkt schreiben statt den Widget-Inhalt zu kopieren
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.writelines(self._report_parts)
+                    f.write("\n")
+                self._notify_success("Erfolg", f"Ergebnisse wurden gespeichert.")
                 self.status_var.set(f"✓ Text-Export: {os.path.basename(filename)}")
             except Exception as e:
                 messagebox.showerror("Fehler", f"Fehler beim Speichern: {str(e)}")
@@ -11,30 +11,430 @@ Neue Features in V3:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
+import base64
+import functools
+import io
 import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
 from typing import Optional, Dict, Any
-import matplotlib
-matplotlib.use('TkAgg')
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Circle
 import numpy as np
-import math
 
 from parsers import PipeParser, EEDParser
 from calculations import BoreholeCalculator
 from calculations.hydraulics import HydraulicsCalculator
-from calculations.vdi4640 import VDI4640Calculator
-from utils import PDFReportGenerator
-from utils.pvgis_api import PVGISClient, FALLBACK_CLIMATE_DATA
+from calculations.vdi4640 import VDI4640Calculator, simplified_borehole_resistance
+from utils.pvgis_api import PVGISClient, FALLBACK_CLIMATE_DATA, FALLBACK_CLIMATE_KEYS
+from utils.paths import CACHE_DIR
 from data import GroutMaterialDB, SoilTypeDB
 from gui.tooltips import InfoButton
 from utils.get_file_handler import GETFileHandler
 
+# Trennlinien der Textberichte
+_RULE = "=" * 80
+_SUBRULE = "-" * 80
+_TOOL_RULE = "=" * 60
+
+# Rohrpositionen je Konfiguration in Einheiten des Schenkelabstands
+_PIPE_POSITIONS_UNIT = {
+    "single-u": np.array([[-0.5, 0.0], [0.5, 0.0]]),
+    "double-u": np.array([[-0.5, -0.5], [0.5, -0.5], [-0.5, 0.5], [0.5, 0.5]]),
+}
+_PIPE_POSITIONS_FALLBACK = np.zeros((2, 2))
+
+
+# Vorbereitete Vorlage des Hydraulik-Berichts (str.format mit Formatangaben)
+_HYDRAULICS_REPORT = (
+    f"{_TOOL_RULE}\n"
+    "HYDRAULIK-BERECHNUNG\n"
+    f"{_TOOL_RULE}\n\n"
+    "Wärmeleistung: {heat_power} kW\n"
+    "COP: {cop}\n"
+    "Kälteleistung: {cold_power:.2f} kW\n"
+    "Frostschutz: {antifreeze_conc} Vol%\n"
+    "Anzahl Kreise: {num_circuits}\n\n"
+    "Volumenstrom:\n"
+    "  Gesamt: {flow[volume_flow_m3_h]:.3f} m³/h ({flow[volume_flow_l_min]:.1f} l/min)\n"
+    "  Pro Kreis: {system[volume_flow_per_circuit_m3h]:.3f} m³/h\n"
+    "  Geschwindigkeit: {system[velocity_m_s]:.2f} m/s\n"
+    "  Reynolds: {system[reynolds]:.0f}\n\n"
+    "Druckverlust:\n"
+    "  Bohrungen: {system[pressure_drop_borehole_bar]:.2f} bar\n"
+    "  Zusatzverluste: {system[additional_losses_bar]:.2f} bar\n"
+    "  GESAMT: {system[total_pressure_drop_bar]:.2f} bar ({system[total_pressure_drop_mbar]:.0f} mbar)\n\n"
+    "Pumpe:\n"
+    "  Hydraulische Leistung: {pump[hydraulic_power_w]:.0f} W\n"
+    "  Elektrische Leistung: {pump[electric_power_w]:.0f} W ({pump[electric_power_kw]:.2f} kW)\n\n"
+    f"{_TOOL_RULE}\n"
+)
+
+
+def _format_vdi_report(vdi, params, num_bh):
+    """Formatiert den VDI-4640-Teil des Ergebnisberichts."""
+    if vdi.design_case == "heating":
+        design_case = (
+            "✓ HEIZEN ist auslegungsrelevant\n"
+            f"  Erforderliche Sondenlänge: {vdi.required_depth_heating:.1f} m\n"
+            f"  (Kühlen würde nur {vdi.required_depth_cooling:.1f} m benötigen)\n"
+        )
+    else:
+        design_case = (
+            "✓ KÜHLEN ist auslegungsrelevant (dominante Kühllast!)\n"
+            f"  Erforderliche Sondenlänge: {vdi.required_depth_cooling:.1f} m\n"
+            f"  (Heizen würde nur {vdi.required_depth_heating:.1f} m benötigen)\n"
+        )
+    return (
+        "📐 BERECHNUNGSMETHODE: VDI 4640 (Koenigsdorff)\n"
+        f"{_RULE}\n\n"
+
+        # === AUSLEGUNGSFALL ===
+        "🎯 AUSLEGUNGSFALL\n"
+        f"{_SUBRULE}\n"
+        f"{design_case}"
+        f"\n  → Ausgelegte Sondenlänge: {vdi.required_depth_final:.1f} m\n"
+        f"  → Anzahl Bohrungen: {num_bh}\n"
+        f"  → Gesamtlänge: {vdi.required_depth_final * num_bh:.1f} m\n\n"
+
+        # === WÄRMEPUMPENAUSTRITTSTEMPERATUREN ===
+        "🌡️  WÄRMEPUMPENAUSTRITTSTEMPERATUREN\n"
+        f"{_SUBRULE}\n"
+        f"Heizen (minimale WP-Austrittstemperatur): {vdi.t_wp_aus_heating_min:.2f} °C\n"
+        "  Komponenten:\n"
+        f"    T_ungestört:            {params['ground_temp']:.2f} °C\n"
+        f"    - ΔT_Grundlast:        {vdi.delta_t_grundlast_heating:.3f} K\n"
+        f"    - ΔT_Periodisch:       {vdi.delta_t_per_heating:.3f} K\n"
+        f"    - ΔT_Peak:             {vdi.delta_t_peak_heating:.3f} K\n"
+        f"    - 0.5 · ΔT_Fluid:      {vdi.delta_t_fluid_heating / 2:.2f} K\n\n"
+
+        f"Kühlen (maximale WP-Austrittstemperatur): {vdi.t_wp_aus_cooling_max:.2f} °C\n"
+        "  Komponenten:\n"
+        f"    T_ungestört:            {params['ground_temp']:.2f} °C\n"
+        f"    + ΔT_Grundlast:        {vdi.delta_t_grundlast_cooling:.3f} K\n"
+        f"    + ΔT_Periodisch:       {vdi.delta_t_per_cooling:.3f} K\n"
+        f"    + ΔT_Peak:             {vdi.delta_t_peak_cooling:.3f} K\n"
+        f"    - 0.5 · ΔT_Fluid:      {vdi.delta_t_fluid_cooling / 2:.2f} K\n\n"
+
+        # === THERMISCHE WIDERSTÄNDE ===
+        "♨️  THERMISCHE WIDERSTÄNDE\n"
+        f"{_SUBRULE}\n"
+        f"R_Grundlast (10 Jahre):     {vdi.r_grundlast:.6f} m·K/W  (g={vdi.g_grundlast:.4f})\n"
+        f"R_Periodisch (1 Monat):     {vdi.r_per:.6f} m·K/W  (g={vdi.g_per:.4f})\n"
+        f"R_Peak (6 Stunden):         {vdi.r_peak:.6f} m·K/W  (g={vdi.g_peak:.4f})\n"
+        f"R_Bohrloch:                 {vdi.r_borehole:.6f} m·K/W\n\n"
+
+        # === LASTEN ===
+        "⚡ LASTDATEN\n"
+        f"{_SUBRULE}\n"
+        "HEIZEN:\n"
+        f"  Jahresenergie:         {params['annual_heating']:.0f} kWh\n"
+        f"  Q_Nettogrundlast:      {vdi.q_nettogrundlast_heating/1000:.3f} kW  (Jahresmittel)\n"
+        f"  Q_Periodisch:          {vdi.q_per_heating/1000:.3f} kW  (kritischster Monat)\n"
+        f"  Q_Peak:                {vdi.q_peak_heating/1000:.3f} kW  (Spitzenlast)\n\n"
+
+        "KÜHLEN:\n"
+        f"  Jahresenergie:         {params['annual_cooling']:.0f} kWh\n"
+        f"  Q_Nettogrundlast:      {vdi.q_nettogrundlast_cooling/1000:.3f} kW  (Jahresmittel)\n"
+        f"  Q_Periodisch:          {vdi.q_per_cooling/1000:.3f} kW  (kritischster Monat)\n"
+        f"  Q_Peak:                {vdi.q_peak_cooling/1000:.3f} kW  (Spitzenlast)\n\n"
+    )
+
+
+def _format_iterative_report(result, num_bh):
+    """Formatiert den Teil des Ergebnisberichts für die iterative Methode."""
+    return (
+        "⚙️  BERECHNUNGSMETHODE: Iterativ (Eskilson/Hellström)\n"
+        f"{_RULE}\n\n"
+
+        "🎯 BOHRFELD\n"
+        f"{_SUBRULE}\n"
+        f"Anzahl Bohrungen:      {num_bh}\n"
+        f"Tiefe pro Bohrung:     {result.required_depth:.1f} m\n"
+        f"Gesamtlänge:           {result.required_depth * num_bh:.1f} m\n\n"
+
+        "🌡️  TEMPERATUREN\n"
+        f"{_SUBRULE}\n"
+        f"Min. Fluidtemperatur:  {result.fluid_temperature_min:.2f} °C\n"
+        f"Max. Fluidtemperatur:  {result.fluid_temperature_max:.2f} °C\n\n"
+
+        "♨️  WIDERSTÄNDE\n"
+        f"{_SUBRULE}\n"
+        f"R_Bohrloch:            {result.borehole_resistance:.6f} m·K/W\n"
+        f"R_effektiv:            {result.effective_resistance:.6f} m·K/W\n\n"
+
+        "⚡ ENTZUGSLEISTUNG\n"
+        f"{_SUBRULE}\n"
+        f"Spezifisch:            {result.heat_extraction_rate:.2f} W/m\n\n"
+    )
+
+
+def _format_report(result, vdi, params, num_bh, proj_name, customer):
+    """Formatiert den vollständigen Ergebnisbericht als einen String."""
+    if proj_name:
+        project = f"📋 Projekt: {proj_name}\n👤 Kunde: {customer}\n\n"
+    else:
+        project = ""
+    
+    if params.get('calculation_method', 'iterativ') == "vdi4640" and vdi:
+        body = _format_vdi_report(vdi, params, num_bh)
+    else:
+        body = _format_iterative_report(result, num_bh)
+    
+    return (
+        f"{_RULE}\n"
+        "ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS (Professional V3.2)\n"
+        f"{_RULE}\n\n"
+        f"{project}{body}{_RULE}\n"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _render_borehole_png():
+    """Liefert die statische Erdsonden-Grafik als PNG (Bytes).
+    
+    Das Bild wird in CACHE_DIR abgelegt und nur neu gerendert, wenn dieses
+    Modul jünger ist; matplotlib wird dann beim Programmstart nicht geladen.
+    """
+    cache_file = os.path.join(CACHE_DIR, "borehole_static.png")
+    try:
+        if os.path.getmtime(cache_file) >= os.path.getmtime(__file__):
+            with open(cache_file, 'rb') as f:
+                return f.read()
+    except OSError:
+        pass  # Kein oder veralteter Cache: neu rendern
+    
+    data = _draw_borehole_png()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Grafik-Cache konnte nicht gespeichert werden: {e}")
+    return data
+
+
+def _draw_borehole_png():
+    """Rendert die statische Erdsonden-Grafik mit matplotlib als PNG (Bytes)."""
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Arc, Circle, Rectangle
+    
+    fig = Figure(figsize=(5.5, 8), facecolor='white')
+    ax = fig.add_subplot(111)
+    
+    # === SEITLICHE ANSICHT (Schnitt durch Sonde) ===
+    # Boden (braun)
+    ground = Rectangle((0, 0), 10, 15, facecolor='#8B4513', alpha=0.3, label='Boden')
+    ax.add_patch(ground)
+    
+    # Bohrloch (hellgrau) - EIN Bohrloch mit 4 Leitungen ENGER zusammen
+    borehole_width = 1.0
+    borehole_center = 5.0
+    borehole = Rectangle((borehole_center - borehole_width/2, 0), borehole_width, 15, 
+                        facecolor='#d9d9d9', edgecolor='black', linewidth=2)
+    ax.add_patch(borehole)
+    
+    # 4 Leitungen ENGER zusammen (alle im gleichen Bohrloch)
+    # Abstand zwischen Rohren: nur 0.2 Einheiten
+    spacing = 0.2
+    center_offset = spacing * 1.5  # Gesamtbreite der 4 Rohre
+    
+    # Rohr 1 & 2 (links im Bohrloch)
+    ax.plot([borehole_center - center_offset, borehole_center - center_offset], [0, 15], 
+           color='#ff6b6b', linewidth=5, solid_capstyle='round')
+    ax.plot([borehole_center - center_offset + spacing, borehole_center - center_offset + spacing], [0, 15], 
+           color='#4ecdc4', linewidth=5, solid_capstyle='round')
+    
+    # Rohr 3 & 4 (rechts im Bohrloch)
+    ax.plot([borehole_center + center_offset - spacing, borehole_center + center_offset - spacing], [0, 15], 
+           color='#ff6b6b', linewidth=5, solid_capstyle='round')
+    ax.plot([borehole_center + center_offset, borehole_center + center_offset], [0, 15], 
+           color='#4ecdc4', linewidth=5, solid_capstyle='round')
+    
+    # U-Bogen unten (verbindet Rohr 1-2 und 3-4)
+    arc1 = Arc((borehole_center - center_offset + spacing/2, 0.3), spacing*1.5, 0.4, 
+              angle=0, theta1=180, theta2=360, color='black', linewidth=2)
+    arc2 = Arc((borehole_center + center_offset - spacing/2, 0.3), spacing*1.5, 0.4, 
+              angle=0, theta1=180, theta2=360, color='black', linewidth=2)
+    ax.add_patch(arc1)
+    ax.add_patch(arc2)
+    
+    # === BESCHRIFTUNGEN ===
+    # Durchmesser
+    bh_left = borehole_center - borehole_width/2
+    bh_right = borehole_center + borehole_width/2
+    ax.annotate('', xy=(bh_left, 16), xytext=(bh_right, 16),
+               arrowprops=dict(arrowstyle='<->', color='black', lw=2))
+    ax.text(borehole_center, 16.6, 'Bohrloch Ø 152mm', ha='center', fontsize=11, 
+           fontweight='bold', bbox=dict(boxstyle='round,pad=0.5', 
+           facecolor='yellow', edgecolor='black'))
+    
+    # Tiefe
+    ax.annotate('', xy=(0.5, 0), xytext=(0.5, 15),
+               arrowprops=dict(arrowstyle='<->', color='#2196f3', lw=2))
+    ax.text(-0.3, 7.5, 'Tiefe\nbis 100m', ha='center', fontsize=10, 
+           fontweight='bold', color='#1976d2', rotation=90,
+           bbox=dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor='#2196f3'))
+    
+    # Nummern entfernt - sind nur im Querschnitt sichtbar
+    
+    # Verfüllung
+    ax.text(borehole_center, 10, 'Verfüllung\n(Zement-Bentonit)', ha='center', fontsize=9,
+           bbox=dict(boxstyle='round,pad=0.4', facecolor='#e0e0e0', edgecolor='black'))
+    
+    # Rohrmaterial
+    ax.text(7.5, 12, 'PE 100 RC\nØ 32mm', ha='left', fontsize=9,
+           bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
+    ax.annotate('', xy=(bh_right + 0.1, 12), xytext=(7.3, 12),
+               arrowprops=dict(arrowstyle='->', color='black', lw=1.5))
+    
+    # === QUERSCHNITT (größer, ohne Text - nur Nummern) ===
+    ax_inset = fig.add_axes([0.58, 0.52, 0.38, 0.42])  # Größer: breiter und höher
+    
+    # Bohrloch-Kreis
+    bh_circle = Circle((0, 0), 1, facecolor='#d9d9d9', edgecolor='black', linewidth=2.5)
+    ax_inset.add_patch(bh_circle)
+    
+    # 4 Rohre in QUADRAT-Anordnung
+    # Links-oben, Rechts-oben, Links-unten, Rechts-unten
+    positions = [(-0.35, 0.35), (0.35, 0.35), (-0.35, -0.35), (0.35, -0.35)]
+    colors = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
+    
+    for i, ((x, y), color) in enumerate(zip(positions, colors)):
+        pipe_circle = Circle((x, y), 0.2, facecolor=color, edgecolor='black', linewidth=1.5)
+        ax_inset.add_patch(pipe_circle)
+        ax_inset.text(x, y, str(i+1), ha='center', va='center', 
+                     fontsize=11, fontweight='bold', color='white')
+    
+    ax_inset.set_xlim(-1.1, 1.1)
+    ax_inset.set_ylim(-1.1, 1.1)
+    ax_inset.set_aspect('equal')
+    ax_inset.axis('off')
+    
+    # Hauptgrafik-Einstellungen (angepasst für enge Sonde)
+    ax.set_xlim(0, 9)
+    ax.set_ylim(-1, 18)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100, facecolor='white')
+    return buf.getvalue()
+
+
+# Erlaubte Zwischenstände beim Tippen einer Zahl ("", "-", "1.", "1e-" ...)
+_NUMERIC_INPUT = re.compile(r"[+-]?(?:(?:\d+\.?\d*|\.\d*)(?:[eE][+-]?\d*)?)?")
+
+
+def _is_numeric_input(text):
+    """Validierung für Zahlenfelder: lässt nur (unvollständige) Zahlen zu."""
+    return _NUMERIC_INPUT.fullmatch(text) is not None
+
+
+# Eingabefelder der Sektionen: (Beschriftung, Schlüssel, Vorgabewert,
+# Ziel-Dictionary, optionaler Info-Schlüssel)
+_PROJECT_FIELDS = (
+    ("Projektname:", "project_name", "", "project"),
+    ("Kundenname:", "customer_name", "", "project"),
+    ("Straße + Nr.:", "address", "", "project"),
+    ("PLZ:", "postal_code", "", "project"),
+    ("Ort:", "city", "", "project"),
+)
+
+_BOREHOLE_FIELDS = (
+    ("Anzahl Bohrungen:", "num_boreholes", "1", "borehole"),
+    ("Abstand zwischen Bohrungen [m]:", "spacing_between", "6", "borehole"),
+    ("Abstand zum Grundstücksrand [m]:", "spacing_property", "3", "borehole"),
+    ("Abstand zum Gebäude [m]:", "spacing_building", "3", "borehole"),
+)
+
+_CLIMATE_FIELDS = (
+    ("Ø Temperatur Außenluft [°C]:", "avg_air_temp", "10.0", "climate"),
+    ("Ø Temperatur kältester Monat [°C]:", "coldest_month_temp", "0.5", "climate"),
+    ("Korrekturfaktor [%]:", "correction_factor", "100", "climate"),
+)
+
+_SOIL_FIELDS = (
+    ("Wärmeleitfähigkeit Boden [W/m·K]:", "ground_thermal_cond", "1.8", "entries"),
+    ("Wärmekapazität Boden [J/m³·K]:", "ground_heat_cap", "2400000", "entries"),
+    ("Ungestörte Bodentemperatur [°C]:", "ground_temp", "10.0", "entries"),
+    ("Geothermischer Gradient [K/m]:", "geothermal_gradient", "0.03", "entries"),
+)
+
+_BOREHOLE_DIAMETER_FIELDS = (
+    ("Bohrloch-Durchmesser [mm]:", "borehole_diameter", "152", "entries", "borehole_diameter"),
+)
+
+_PIPE_FIELDS = (
+    ("Rohr Außendurchmesser [mm]:", "pipe_outer_diameter", "32", "entries", "pipe_outer_diameter"),
+    ("Rohr Wandstärke [mm]:", "pipe_thickness", "3", "entries", "pipe_wall_thickness"),
+    ("Rohr Wärmeleitfähigkeit [W/m·K]:", "pipe_thermal_cond", "0.42", "entries"),
+    ("Schenkelabstand [m]:", "shank_spacing", "0.065", "entries"),
+)
+
+_GROUT_FIELDS = (
+    ("Wärmeleitfähigkeit Verfüllung [W/m·K]:", "grout_thermal_cond", "1.3", "entries"),
+)
+
+_FLUID_FIELDS = (
+    ("Anzahl Solekreise:", "num_circuits", "1", "hydraulics"),
+    ("Frostschutzkonzentration [Vol%]:", "antifreeze_concentration", "25", "hydraulics"),
+    ("Volumenstrom [m³/s]:", "fluid_flow_rate", "0.0005", "entries", "fluid_flow_rate"),
+    ("Wärmeleitfähigkeit [W/m·K]:", "fluid_thermal_cond", "0.48", "entries", "fluid_thermal_cond"),
+    ("Wärmekapazität [J/kg·K]:", "fluid_heat_cap", "3800", "entries"),
+    ("Dichte [kg/m³]:", "fluid_density", "1030", "entries"),
+    ("Viskosität [Pa·s]:", "fluid_viscosity", "0.004", "entries"),
+)
+
+_HEAT_PUMP_FIELDS = (
+    ("Wärmepumpenleistung [kW]:", "heat_pump_power", "6.0", "heat_pump"),
+    ("COP Heizen (Coefficient of Performance):", "heat_pump_cop", "4.0", "entries"),
+    ("EER Kühlen (Energy Efficiency Ratio):", "heat_pump_eer", "4.0", "entries"),
+)
+
+_LOAD_FIELDS = (
+    ("Warmwasser (Anzahl Personen):", "num_persons_dhw", "4", "heat_pump"),
+    ("Jahres-Heizenergie [kWh]:", "annual_heating", "12000.0", "entries"),
+    ("Jahres-Kühlenergie [kWh]:", "annual_cooling", "0.0", "entries"),
+    ("Heiz-Spitzenlast [kW]:", "peak_heating", "6.0", "entries"),
+    ("Kühl-Spitzenlast [kW]:", "peak_cooling", "0.0", "entries"),
+    ("Min. Fluidtemperatur [°C]:", "min_fluid_temp", "-2.0", "entries"),
+    ("Max. Fluidtemperatur [°C]:", "max_fluid_temp", "15.0", "entries"),
+    ("Temperaturdifferenz Fluid [K]:", "delta_t_fluid", "3.0", "entries"),
+)
+
+_SIMULATION_FIELDS = (
+    ("Simulationsdauer [Jahre]:", "simulation_years", "25", "entries"),
+    ("Startwert Bohrtiefe [m]:", "initial_depth", "100", "entries"),
+)
+
 
 class GeothermieGUIProfessional:
     """Professional Edition V3 GUI."""
     
+    # Eingabefelder, die als Ganzzahl gelesen werden
+    _INT_KEYS = frozenset({"num_boreholes", "num_circuits", "num_persons_dhw", "simulation_years"})
+    
+    # Eingabefelder, die die Werkzeuge Verfüllung und Hydraulik lesen
+    _GROUT_INPUTS = ("initial_depth", "borehole_diameter", "pipe_outer_diameter", "num_boreholes")
+    _HYDRAULICS_INPUTS = ("heat_pump_power", "heat_pump_cop", "antifreeze_concentration",
+                          "num_circuits", "initial_depth", "num_boreholes",
+                          "pipe_outer_diameter", "pipe_thickness")
+    
+    # Maximale Anzahl zwischengespeicherter Material-/Hydraulik-Ergebnisse
+    _MEMO_SIZE = 16
+    
+    # Konstanten der Diagramme
+    _MONTHS = ("J", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D")
+    _MONTH_X = np.arange(12)
+    _PIPE_UNIT_POSITIONS = np.array([(-0.5, 0.5), (0.5, 0.5), (-0.5, -0.5), (0.5, -0.5)])
+    _PIPE_COLORS = ('#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4')
+    
     def __init__(self, root):
         """Initialisiert die Professional GUI."""
         self.root = root
@@ -47,14 +447,21 @@ class GeothermieGUIProfessional:
         self.calculator = BoreholeCalculator()
         self.vdi4640_calc = VDI4640Calculator()
         self.hydraulics_calc = HydraulicsCalculator()
-        self.pdf_generator = PDFReportGenerator()
+        self.pdf_generator = None  # ReportLab wird erst beim PDF-Export geladen
         self.pvgis_client = PVGISClient()
         self.grout_db = GroutMaterialDB()
         self.soil_db = SoilTypeDB()
         self.get_handler = GETFileHandler()
         
+        # Auswahllisten der Comboboxen einmalig erzeugen
+        self._soil_names = tuple(self.soil_db.get_all_names())
+        self._grout_names = tuple(self.grout_db.get_all_names())
+        self._last_soil_name = None
+        self._last_grout_name = None
+        
         # Daten
         self.pipes = []
+        self.pipes_by_name = {}
         self.result = None
         self.vdi4640_result = None  # NEU: VDI 4640 Ergebnis
         self.current_params = {}
@@ -62,6 +469,28 @@ class GeothermieGUIProfessional:
         self.grout_calculation = None
         self.climate_data = None
         self.borefield_config = None
+        self._scroll_pending = set()
+        self._grout_cache = OrderedDict()
+        self._hydraulics_cache = OrderedDict()
+        self._calc_cache = OrderedDict()
+        
+        # Hintergrund-Threads: einer für Berechnungen, eigene für Netzwerkzugriffe,
+        # damit ein PVGIS-Abruf nicht hinter einer laufenden Berechnung wartet
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        # Werkzeuge (Verfüllung, Hydraulik) laufen unabhängig und parallel
+        self._tool_executor = ThreadPoolExecutor(max_workers=2)
+        self._calc_future = None
+        self._pdf_future = None
+        self._grout_future = None
+        self._hydraulics_future = None
+        self._pvgis_future = None
+        self._last_status_flush = 0.0
+        self._status_pending = None
+        self._status_scheduled = False
+        
+        # Rohrkatalog parallel zum GUI-Aufbau einlesen
+        pipe_future = self._start_default_pipe_load()
         
         # GUI aufbauen
         self._create_menu()
@@ -69,7 +498,11 @@ class GeothermieGUIProfessional:
         self._create_status_bar()
         
         # Lade Daten
-        self._load_default_pipes()
+        if pipe_future is not None:
+            self._poll_future(pipe_future, self._load_default_pipes, interval=10)
+        
+        # JIT-Kernel im Rechen-Thread vorkompilieren
+        self.root.after(100, self._warmup_kernels)
     
     def _create_menu(self):
         """Erstellt die Menüleiste."""
@@ -118,9 +551,10 @@ class GeothermieGUIProfessional:
         self.notebook.add(self.results_frame, text="📊 Ergebnisse")
         self._create_results_tab()
         
+        # Material- und Diagramm-Tab werden erst bei Bedarf aufgebaut
         self.materials_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.materials_frame, text="💧 Material & Hydraulik")
-        self._create_materials_tab()
+        self._materials_built = False
         
         self.borefield_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.borefield_frame, text="🌐 Bohrfeld-Simulation")
@@ -128,7 +562,31 @@ class GeothermieGUIProfessional:
         
         self.viz_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.viz_frame, text="📈 Diagramme")
-        self._create_visualization_tab()
+        self._viz_built = False
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _on_tab_changed(self, event):
+        """Baut Material-, Diagramm- bzw. Bohrfeld-Grafik beim ersten Öffnen auf."""
+        current = self.notebook.nametowidget(self.notebook.select())
+        if current is self.materials_frame:
+            self._ensure_materials_tab()
+        elif current is self.viz_frame:
+            self._ensure_visualization_tab()
+        elif current is self.borefield_frame:
+            self._ensure_borefield_figure()
+    
+    def _ensure_materials_tab(self):
+        """Erstellt den Material & Hydraulik Tab, falls noch nicht geschehen."""
+        if not self._materials_built:
+            self._materials_built = True
+            self._create_materials_tab()
+    
+    def _ensure_visualization_tab(self):
+        """Erstellt den Diagramm-Tab, falls noch nicht geschehen."""
+        if not self._viz_built:
+            self._viz_built = True
+            self._create_visualization_tab()
     
     def _create_input_tab(self):
         """Erstellt den Eingabe-Tab mit allen Professional Features."""
@@ -144,7 +602,7 @@ class GeothermieGUIProfessional:
         scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        scrollable_frame.bind("<Configure>", lambda e: self._schedule_scrollregion(canvas))
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -163,54 +621,54 @@ class GeothermieGUIProfessional:
         self.heat_pump_entries = {}
         self.climate_entries = {}
         self.hydraulics_entries = {}
-        
-        # === PROJEKTINFORMATIONEN ===
-        self._add_section_header(scrollable_frame, row, "🏢 PROJEKTINFORMATIONEN")
-        row += 1
-        row = self._add_project_section(scrollable_frame, row)
-        
-        # === BOHRFELD-KONFIGURATION ===
-        self._add_section_header(scrollable_frame, row, "🎯 BOHRFELD-KONFIGURATION")
-        row += 1
-        row = self._add_borehole_section(scrollable_frame, row)
-        
-        # === KLIMADATEN ===
-        self._add_section_header(scrollable_frame, row, "🌍 KLIMADATEN (PVGIS)")
-        row += 1
-        row = self._add_climate_section(scrollable_frame, row)
-        
-        # === BODENTYP ===
-        self._add_section_header(scrollable_frame, row, "🪨 BODENTYP & BODENWERTE")
-        row += 1
-        row = self._add_soil_section(scrollable_frame, row)
-        
-        # === BOHRLOCH-KONFIGURATION ===
-        self._add_section_header(scrollable_frame, row, "⚙️ BOHRLOCH-KONFIGURATION")
-        row += 1
-        row = self._add_borehole_config_section(scrollable_frame, row)
-        
-        # === VERFÜLLMATERIAL ===
-        self._add_section_header(scrollable_frame, row, "💧 VERFÜLLMATERIAL")
-        row += 1
-        row = self._add_grout_section(scrollable_frame, row)
-        
-        # === WÄRMETRÄGERFLÜSSIGKEIT ===
-        self._add_section_header(scrollable_frame, row, "🧪 WÄRMETRÄGERFLÜSSIGKEIT & HYDRAULIK")
-        row += 1
-        row = self._add_fluid_hydraulics_section(scrollable_frame, row)
-        
-        # === WÄRMEPUMPE ===
-        self._add_section_header(scrollable_frame, row, "♨️ WÄRMEPUMPE & LASTEN")
-        row += 1
-        row = self._add_heat_pump_section(scrollable_frame, row)
-        
-        # === SIMULATION ===
-        self._add_section_header(scrollable_frame, row, "⏱️ SIMULATION")
-        row += 1
-        row = self._add_simulation_section(scrollable_frame, row)
+        self.entry_vars = {}
+        self._entry_targets = {
+            "entries": self.entries,
+            "project": self.project_entries,
+            "borehole": self.borehole_entries,
+            "heat_pump": self.heat_pump_entries,
+            "climate": self.climate_entries,
+            "hydraulics": self.hydraulics_entries,
+        }
+        self._numeric_vcmd = (self.root.register(_is_numeric_input), "%P")
+        
+        # Jede Sektion wird in einem eigenen Frame aufgebaut und nur einmal
+        # in den scrollbaren Bereich eingefügt
+        sections = (
+            ("🏢 PROJEKTINFORMATIONEN", self._add_project_section),
+            ("🎯 BOHRFELD-KONFIGURATION", self._add_borehole_section),
+            ("🌍 KLIMADATEN (PVGIS)", self._add_climate_section),
+            ("🪨 BODENTYP & BODENWERTE", self._add_soil_section),
+            ("⚙️ BOHRLOCH-KONFIGURATION", self._add_borehole_config_section),
+            ("💧 VERFÜLLMATERIAL", self._add_grout_section),
+            ("🧪 WÄRMETRÄGERFLÜSSIGKEIT & HYDRAULIK", self._add_fluid_hydraulics_section),
+            ("♨️ WÄRMEPUMPE & LASTEN", self._add_heat_pump_section),
+            ("⏱️ SIMULATION", self._add_simulation_section),
+        )
+        for title, builder in sections:
+            section = ttk.Frame(scrollable_frame)
+            # Spaltenbreite vorab festlegen, damit Tk nicht nach jeder Zeile neu misst
+            section.columnconfigure(0, minsize=250)
+            self._add_section_header(section, 0, title)
+            builder(section, 1)
+            section.grid(row=row, column=0, columnspan=2, sticky="ew")
+            row += 1
         
         # === BUTTONS ===
         self._add_action_buttons(scrollable_frame, row)
+        scrollable_frame.update_idletasks()
+    
+    def _schedule_scrollregion(self, canvas):
+        """Aktualisiert die Scrollregion höchstens einmal pro Idle-Zyklus."""
+        if canvas in self._scroll_pending:
+            return
+        self._scroll_pending.add(canvas)
+        
+        def update():
+            self._scroll_pending.discard(canvas)
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        self.root.after_idle(update)
     
     def _add_section_header(self, parent, row, text):
         """Fügt eine Sections-Überschrift hinzu."""
@@ -221,62 +679,39 @@ class GeothermieGUIProfessional:
     
     def _add_project_section(self, parent, row):
         """Projektdaten-Sektion."""
-        self._add_entry(parent, row, "Projektname:", "project_name", "", self.project_entries)
-        row += 1
-        self._add_entry(parent, row, "Kundenname:", "customer_name", "", self.project_entries)
-        row += 1
-        self._add_entry(parent, row, "Straße + Nr.:", "address", "", self.project_entries)
-        row += 1
-        self._add_entry(parent, row, "PLZ:", "postal_code", "", self.project_entries)
-        row += 1
-        self._add_entry(parent, row, "Ort:", "city", "", self.project_entries)
-        row += 1
-        return row
+        return self._add_entries(parent, row, _PROJECT_FIELDS)
     
     def _add_borehole_section(self, parent, row):
         """Bohrfeld-Konfiguration."""
-        self._add_entry(parent, row, "Anzahl Bohrungen:", "num_boreholes", "1", self.borehole_entries)
-        row += 1
-        self._add_entry(parent, row, "Abstand zwischen Bohrungen [m]:", "spacing_between", "6", self.borehole_entries)
-        row += 1
-        self._add_entry(parent, row, "Abstand zum Grundstücksrand [m]:", "spacing_property", "3", self.borehole_entries)
-        row += 1
-        self._add_entry(parent, row, "Abstand zum Gebäude [m]:", "spacing_building", "3", self.borehole_entries)
-        row += 1
-        return row
+        return self._add_entries(parent, row, _BOREHOLE_FIELDS)
     
     def _add_climate_section(self, parent, row):
         """Klimadaten-Sektion."""
         # Button zum Laden
         btn_frame = ttk.Frame(parent)
         btn_frame.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=5)
-        ttk.Button(btn_frame, text="🌍 Klimadaten von PVGIS laden", 
-                  command=self._load_pvgis_data).pack(side=tk.LEFT)
+        self.pvgis_button = ttk.Button(btn_frame, text="🌍 Klimadaten von PVGIS laden", 
+                                       command=self._load_pvgis_data)
+        self.pvgis_button.pack(side=tk.LEFT)
         ttk.Label(btn_frame, text="  oder Fallback verwenden:", 
                  foreground="gray").pack(side=tk.LEFT, padx=10)
         
         self.climate_fallback_var = tk.StringVar(value="Deutschland Mitte")
         climate_combo = ttk.Combobox(btn_frame, textvariable=self.climate_fallback_var,
-                                     values=list(FALLBACK_CLIMATE_DATA.keys()),
+                                     values=FALLBACK_CLIMATE_KEYS,
                                      state="readonly", width=20)
         climate_combo.pack(side=tk.LEFT)
         climate_combo.bind("<<ComboboxSelected>>", self._on_climate_fallback_selected)
         row += 1
         
-        self._add_entry(parent, row, "Ø Temperatur Außenluft [°C]:", "avg_air_temp", "10.0", self.climate_entries)
-        row += 1
-        self._add_entry(parent, row, "Ø Temperatur kältester Monat [°C]:", "coldest_month_temp", "0.5", self.climate_entries)
-        row += 1
-        self._add_entry(parent, row, "Korrekturfaktor [%]:", "correction_factor", "100", self.climate_entries)
-        row += 1
-        return row
+        return self._add_entries(parent, row, _CLIMATE_FIELDS)
     
     def _add_soil_section(self, parent, row):
         """Bodentyp-Sektion."""
         ttk.Label(parent, text="Bodentyp:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.soil_type_var = tk.StringVar()
         soil_combo = ttk.Combobox(parent, textvariable=self.soil_type_var,
-                                  values=self.soil_db.get_all_names(),
+                                  values=self._soil_names,
                                   state="readonly", width=30)
         soil_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         soil_combo.bind("<<ComboboxSelected>>", self._on_soil_selected)
@@ -288,14 +723,7 @@ class GeothermieGUIProfessional:
         self.soil_info_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=2)
         row += 1
         
-        self._add_entry(parent, row, "Wärmeleitfähigkeit Boden [W/m·K]:", "ground_thermal_cond", "1.8", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Wärmekapazität Boden [J/m³·K]:", "ground_heat_cap", "2400000", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Ungestörte Bodentemperatur [°C]:", "ground_temp", "10.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Geothermischer Gradient [K/m]:", "geothermal_gradient", "0.03", self.entries)
-        row += 1
+        row = self._add_entries(parent, row, _SOIL_FIELDS)
         
         # Trigger initial selection
         self._on_soil_selected(None)
@@ -303,8 +731,7 @@ class GeothermieGUIProfessional:
     
     def _add_borehole_config_section(self, parent, row):
         """Bohrloch-Konfigurations-Sektion."""
-        self._add_entry(parent, row, "Bohrloch-Durchmesser [mm]:", "borehole_diameter", "152", self.entries, "borehole_diameter")
-        row += 1
+        row = self._add_entries(parent, row, _BOREHOLE_DIAMETER_FIELDS)
         
         ttk.Label(parent, text="Rohrkonfiguration:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.pipe_config_var = tk.StringVar(value="4-rohr-dual")
@@ -323,22 +750,14 @@ class GeothermieGUIProfessional:
         self.pipe_type_combo.bind("<<ComboboxSelected>>", self._on_pipe_selected)
         row += 1
         
-        self._add_entry(parent, row, "Rohr Außendurchmesser [mm]:", "pipe_outer_diameter", "32", self.entries, "pipe_outer_diameter")
-        row += 1
-        self._add_entry(parent, row, "Rohr Wandstärke [mm]:", "pipe_thickness", "3", self.entries, "pipe_wall_thickness")
-        row += 1
-        self._add_entry(parent, row, "Rohr Wärmeleitfähigkeit [W/m·K]:", "pipe_thermal_cond", "0.42", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Schenkelabstand [m]:", "shank_spacing", "0.065", self.entries)
-        row += 1
-        return row
+        return self._add_entries(parent, row, _PIPE_FIELDS)
     
     def _add_grout_section(self, parent, row):
         """Verfüllmaterial-Sektion."""
         ttk.Label(parent, text="Material:").grid(row=row, column=0, sticky="w", padx=10, pady=5)
         self.grout_material_var = tk.StringVar()
         grout_combo = ttk.Combobox(parent, textvariable=self.grout_material_var,
-                                   values=self.grout_db.get_all_names(),
+                                   values=self._grout_names,
                                    state="readonly", width=30)
         grout_combo.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         grout_combo.bind("<<ComboboxSelected>>", self._on_grout_selected)
@@ -350,12 +769,12 @@ class GeothermieGUIProfessional:
         self.grout_info_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=2)
         row += 1
         
-        self._add_entry(parent, row, "Wärmeleitfähigkeit Verfüllung [W/m·K]:", "grout_thermal_cond", "1.3", self.entries)
-        row += 1
+        row = self._add_entries(parent, row, _GROUT_FIELDS)
         
         # Button zur Mengenberechnung
-        ttk.Button(parent, text="💧 Materialmengen berechnen", 
-                  command=self._calculate_grout_materials).grid(
+        self.grout_button = ttk.Button(parent, text="💧 Materialmengen berechnen", 
+                                       command=self._calculate_grout_materials)
+        self.grout_button.grid(
             row=row, column=0, columnspan=2, pady=5, padx=10)
         row += 1
         
@@ -365,37 +784,19 @@ class GeothermieGUIProfessional:
     
     def _add_fluid_hydraulics_section(self, parent, row):
         """Fluid und Hydraulik-Sektion."""
-        self._add_entry(parent, row, "Anzahl Solekreise:", "num_circuits", "1", self.hydraulics_entries)
-        row += 1
-        self._add_entry(parent, row, "Frostschutzkonzentration [Vol%]:", "antifreeze_concentration", "25", self.hydraulics_entries)
-        row += 1
-        
-        self._add_entry(parent, row, "Volumenstrom [m³/s]:", "fluid_flow_rate", "0.0005", self.entries, "fluid_flow_rate")
-        row += 1
-        self._add_entry(parent, row, "Wärmeleitfähigkeit [W/m·K]:", "fluid_thermal_cond", "0.48", self.entries, "fluid_thermal_cond")
-        row += 1
-        self._add_entry(parent, row, "Wärmekapazität [J/kg·K]:", "fluid_heat_cap", "3800", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Dichte [kg/m³]:", "fluid_density", "1030", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Viskosität [Pa·s]:", "fluid_viscosity", "0.004", self.entries)
-        row += 1
+        row = self._add_entries(parent, row, _FLUID_FIELDS)
         
         # Hydraulik-Button
-        ttk.Button(parent, text="💨 Hydraulik berechnen", 
-                  command=self._calculate_hydraulics).grid(
+        self.hydraulics_button = ttk.Button(parent, text="💨 Hydraulik berechnen", 
+                                            command=self._calculate_hydraulics)
+        self.hydraulics_button.grid(
             row=row, column=0, columnspan=2, pady=5, padx=10)
         row += 1
         return row
     
     def _add_heat_pump_section(self, parent, row):
         """Wärmepumpen-Sektion."""
-        self._add_entry(parent, row, "Wärmepumpenleistung [kW]:", "heat_pump_power", "6.0", self.heat_pump_entries)
-        row += 1
-        self._add_entry(parent, row, "COP Heizen (Coefficient of Performance):", "heat_pump_cop", "4.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "EER Kühlen (Energy Efficiency Ratio):", "heat_pump_eer", "4.0", self.entries)
-        row += 1
+        row = self._add_entries(parent, row, _HEAT_PUMP_FIELDS)
         
         # Kälteleistung wird automatisch berechnet
         ttk.Label(parent, text="Kälteleistung [kW]:", foreground="gray").grid(
@@ -404,32 +805,11 @@ class GeothermieGUIProfessional:
         self.cold_power_label.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         row += 1
         
-        self._add_entry(parent, row, "Warmwasser (Anzahl Personen):", "num_persons_dhw", "4", self.heat_pump_entries)
-        row += 1
-        
-        self._add_entry(parent, row, "Jahres-Heizenergie [kWh]:", "annual_heating", "12000.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Jahres-Kühlenergie [kWh]:", "annual_cooling", "0.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Heiz-Spitzenlast [kW]:", "peak_heating", "6.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Kühl-Spitzenlast [kW]:", "peak_cooling", "0.0", self.entries)
-        row += 1
-        
-        self._add_entry(parent, row, "Min. Fluidtemperatur [°C]:", "min_fluid_temp", "-2.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Max. Fluidtemperatur [°C]:", "max_fluid_temp", "15.0", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Temperaturdifferenz Fluid [K]:", "delta_t_fluid", "3.0", self.entries)
-        row += 1
-        return row
+        return self._add_entries(parent, row, _LOAD_FIELDS)
     
     def _add_simulation_section(self, parent, row):
         """Simulations-Sektion."""
-        self._add_entry(parent, row, "Simulationsdauer [Jahre]:", "simulation_years", "25", self.entries)
-        row += 1
-        self._add_entry(parent, row, "Startwert Bohrtiefe [m]:", "initial_depth", "100", self.entries)
-        row += 1
+        row = self._add_entries(parent, row, _SIMULATION_FIELDS)
         
         # === BERECHNUNGSMETHODE ===
         ttk.Separator(parent, orient="horizontal").grid(
@@ -481,18 +861,37 @@ class GeothermieGUIProfessional:
         button_frame = ttk.Frame(parent)
         button_frame.grid(row=row, column=0, columnspan=2, pady=20, padx=10)
         
-        ttk.Button(button_frame, text="🚀 Berechnung starten", 
-                  command=self._run_calculation, width=25).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="📄 PDF-Bericht erstellen", 
-                  command=self._export_pdf, width=25).pack(side=tk.LEFT, padx=5)
+        self.calc_button = ttk.Button(button_frame, text="🚀 Berechnung starten", 
+                                      command=self._run_calculation, width=25)
+        self.calc_button.pack(side=tk.LEFT, padx=5)
+        self.pdf_button = ttk.Button(button_frame, text="📄 PDF-Bericht erstellen", 
+                                     command=self._export_pdf, width=25)
+        self.pdf_button.pack(side=tk.LEFT, padx=5)
+    
+    def _add_entries(self, parent, row, fields):
+        """Legt die Eingabefelder einer Feldtabelle an und gibt die nächste Zeile zurück."""
+        targets = self._entry_targets
+        for label, key, default, target, *info in fields:
+            self._add_entry(parent, row, label, key, default, targets[target], *info)
+            row += 1
+        return row
     
     def _add_entry(self, parent, row, label, key, default, dict_target, info_key=None):
         """Fügt ein Eingabefeld hinzu, optional mit Info-Button."""
-        ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=10, pady=5)
-        entry = ttk.Entry(parent, width=32)
-        entry.insert(0, default)
+        # Feste Breite, damit die Eingabefelder sektionsübergreifend fluchten
+        ttk.Label(parent, text=label, width=40).grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        var = tk.StringVar(value=default)
+        entry = ttk.Entry(parent, width=32, textvariable=var)
+        try:
+            float(default)
+        except ValueError:
+            pass  # Textfeld (Projektdaten)
+        else:
+            # Zahlenfeld: ungültige Zeichen schon beim Tippen abweisen
+            entry.configure(validate="key", validatecommand=self._numeric_vcmd)
         entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
         dict_target[key] = entry
+        self.entry_vars[key] = var
         
         # Optional: Info-Button
         if info_key:
@@ -521,7 +920,7 @@ class GeothermieGUIProfessional:
         scrollbar = ttk.Scrollbar(self.materials_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        scrollable_frame.bind("<Configure>", lambda e: self._schedule_scrollregion(canvas))
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -546,9 +945,81 @@ class GeothermieGUIProfessional:
     
     def _create_visualization_tab(self):
         """Erstellt den Visualisierungs-Tab."""
-        self.fig = Figure(figsize=(18, 6))  # Breiter für 3 Subplots
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
+        # Figure in der tatsächlichen Bildschirmauflösung, Achsen bleiben bestehen
+        dpi = self.root.winfo_fpixels('1i')
+        self.fig = Figure(figsize=(18, 6), dpi=dpi, layout="constrained")  # Breiter für 3 Subplots
+        self.ax_temps = self.fig.add_subplot(1, 3, 1)
+        self.ax_field = self.fig.add_subplot(1, 3, 2)
+        self.ax_borehole = self.fig.add_subplot(1, 3, 3)
+        self._init_plot_artists()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.canvas.mpl_connect('draw_event', self._on_viz_draw)
+    
+    def _on_viz_draw(self, event):
+        """Sichert nach jedem vollständigen Zeichnen den Hintergrund des
+        Temperaturdiagramms und zeichnet die (animierte) Monatslinie darüber."""
+        if self.canvas.is_saving():
+            return
+        self._temps_background = self.canvas.copy_from_bbox(self.ax_temps.bbox)
+        self.ax_temps.draw_artist(self._plot_artists["temps"])
+    
+    def _init_plot_artists(self):
+        """Legt die wiederverwendeten Artists für Temperatur- und Querschnittsdiagramm an."""
+        from matplotlib.patches import Circle
+        from matplotlib.collections import EllipseCollection
+        
+        ax1, ax3 = self.ax_temps, self.ax_borehole
+        zeros = np.zeros(12)
+        
+        # Temperaturen
+        # Die Monatslinie wird per Blitting über den gesicherten Hintergrund gezeichnet
+        line, = ax1.plot(self._MONTH_X, zeros, 'o-', linewidth=2.5, markersize=8, color='#1f4788',
+                         animated=True)
+        line_min = ax1.axhline(y=0, color='b', linestyle='--', linewidth=2)
+        line_max = ax1.axhline(y=0, color='r', linestyle='--', linewidth=2)
+        ax1.set_xlabel('Monat', fontsize=11, fontweight='bold')
+        ax1.set_ylabel('Temperatur [°C]', fontsize=11, fontweight='bold')
+        ax1.set_title('Monatliche Temperaturen', fontsize=12, fontweight='bold')
+        ax1.set_xticks(self._MONTH_X)
+        ax1.set_xticklabels(self._MONTHS)
+        ax1.grid(True, alpha=0.3)
+        
+        # Bohrloch-Querschnitt
+        borehole = Circle((0, 0), 1, facecolor='#d9d9d9', edgecolor='black', linewidth=2)
+        ax3.add_patch(borehole)
+        # Alle vier Rohre als eine Collection mit Durchmessern in Datenkoordinaten
+        n_pipes = len(self._PIPE_COLORS)
+        pipes = EllipseCollection(np.ones(n_pipes), np.ones(n_pipes), np.zeros(n_pipes), units='xy',
+                                  offsets=np.zeros((n_pipes, 2)), offset_transform=ax3.transData,
+                                  facecolors=self._PIPE_COLORS, edgecolors='black',
+                                  linewidths=1, alpha=0.8)
+        ax3.add_collection(pipes, autolim=False)
+        pipe_labels = [ax3.text(0, 0, str(i+1), ha='center', va='center', fontsize=9,
+                                fontweight='bold', color='white')
+                       for i in range(n_pipes)]
+        diameter_line, = ax3.plot([-1, 1], [0, 0], 'k--', linewidth=1, alpha=0.5)
+        diameter_label = ax3.text(0, 0, '', ha='center', fontsize=11, fontweight='bold',
+                                  bbox=dict(boxstyle='round,pad=0.4', facecolor='#ffeb3b', edgecolor='black'))
+        ax3.set_aspect('equal')
+        ax3.set_title('Bohrloch-Querschnitt', fontsize=12, fontweight='bold')
+        ax3.axis('off')
+        
+        self._plot_artists = {
+            "temps": line,
+            "temp_min": line_min,
+            "temp_max": line_max,
+            "borehole": borehole,
+            "pipes": pipes,
+            "pipe_labels": pipe_labels,
+            "diameter_line": diameter_line,
+            "diameter_label": diameter_label,
+        }
+        self._temps_background = None
+        self._plot_static_key = None
     
     def _create_static_borehole_graphic(self, parent):
         """Erstellt eine statische Erklärungsgrafik einer Erdsonde mit 4 Leitungen."""
@@ -557,116 +1028,9 @@ class GeothermieGUIProfessional:
                                font=("Arial", 14, "bold"))
         title_label.pack(pady=(10, 5))
         
-        # Erstelle Figure für statische Grafik
-        from matplotlib.figure import Figure
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-        from matplotlib.patches import Circle, Rectangle, FancyArrow
-        
-        fig = Figure(figsize=(5.5, 8), facecolor='white')
-        ax = fig.add_subplot(111)
-        
-        # === SEITLICHE ANSICHT (Schnitt durch Sonde) ===
-        # Boden (braun)
-        ground = Rectangle((0, 0), 10, 15, facecolor='#8B4513', alpha=0.3, label='Boden')
-        ax.add_patch(ground)
-        
-        # Bohrloch (hellgrau) - EIN Bohrloch mit 4 Leitungen ENGER zusammen
-        borehole_width = 1.0
-        borehole_center = 5.0
-        borehole = Rectangle((borehole_center - borehole_width/2, 0), borehole_width, 15, 
-                            facecolor='#d9d9d9', edgecolor='black', linewidth=2)
-        ax.add_patch(borehole)
-        
-        # 4 Leitungen ENGER zusammen (alle im gleichen Bohrloch)
-        # Abstand zwischen Rohren: nur 0.2 Einheiten
-        spacing = 0.2
-        center_offset = spacing * 1.5  # Gesamtbreite der 4 Rohre
-        
-        # Rohr 1 & 2 (links im Bohrloch)
-        ax.plot([borehole_center - center_offset, borehole_center - center_offset], [0, 15], 
-               color='#ff6b6b', linewidth=5, solid_capstyle='round')
-        ax.plot([borehole_center - center_offset + spacing, borehole_center - center_offset + spacing], [0, 15], 
-               color='#4ecdc4', linewidth=5, solid_capstyle='round')
-        
-        # Rohr 3 & 4 (rechts im Bohrloch)
-        ax.plot([borehole_center + center_offset - spacing, borehole_center + center_offset - spacing], [0, 15], 
-               color='#ff6b6b', linewidth=5, solid_capstyle='round')
-        ax.plot([borehole_center + center_offset, borehole_center + center_offset], [0, 15], 
-               color='#4ecdc4', linewidth=5, solid_capstyle='round')
-        
-        # U-Bogen unten (verbindet Rohr 1-2 und 3-4)
-        from matplotlib.patches import Arc
-        arc1 = Arc((borehole_center - center_offset + spacing/2, 0.3), spacing*1.5, 0.4, 
-                  angle=0, theta1=180, theta2=360, color='black', linewidth=2)
-        arc2 = Arc((borehole_center + center_offset - spacing/2, 0.3), spacing*1.5, 0.4, 
-                  angle=0, theta1=180, theta2=360, color='black', linewidth=2)
-        ax.add_patch(arc1)
-        ax.add_patch(arc2)
-        
-        # === BESCHRIFTUNGEN ===
-        # Durchmesser
-        bh_left = borehole_center - borehole_width/2
-        bh_right = borehole_center + borehole_width/2
-        ax.annotate('', xy=(bh_left, 16), xytext=(bh_right, 16),
-                   arrowprops=dict(arrowstyle='<->', color='black', lw=2))
-        ax.text(borehole_center, 16.6, 'Bohrloch Ø 152mm', ha='center', fontsize=11, 
-               fontweight='bold', bbox=dict(boxstyle='round,pad=0.5', 
-               facecolor='yellow', edgecolor='black'))
-        
-        # Tiefe
-        ax.annotate('', xy=(0.5, 0), xytext=(0.5, 15),
-                   arrowprops=dict(arrowstyle='<->', color='#2196f3', lw=2))
-        ax.text(-0.3, 7.5, 'Tiefe\nbis 100m', ha='center', fontsize=10, 
-               fontweight='bold', color='#1976d2', rotation=90,
-               bbox=dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor='#2196f3'))
-        
-        # Nummern entfernt - sind nur im Querschnitt sichtbar
-        
-        # Verfüllung
-        ax.text(borehole_center, 10, 'Verfüllung\n(Zement-Bentonit)', ha='center', fontsize=9,
-               bbox=dict(boxstyle='round,pad=0.4', facecolor='#e0e0e0', edgecolor='black'))
-        
-        # Rohrmaterial
-        ax.text(7.5, 12, 'PE 100 RC\nØ 32mm', ha='left', fontsize=9,
-               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
-        ax.annotate('', xy=(bh_right + 0.1, 12), xytext=(7.3, 12),
-                   arrowprops=dict(arrowstyle='->', color='black', lw=1.5))
-        
-        # === QUERSCHNITT (größer, ohne Text - nur Nummern) ===
-        ax_inset = fig.add_axes([0.58, 0.52, 0.38, 0.42])  # Größer: breiter und höher
-        
-        # Bohrloch-Kreis
-        bh_circle = Circle((0, 0), 1, facecolor='#d9d9d9', edgecolor='black', linewidth=2.5)
-        ax_inset.add_patch(bh_circle)
-        
-        # 4 Rohre in QUADRAT-Anordnung
-        # Links-oben, Rechts-oben, Links-unten, Rechts-unten
-        positions = [(-0.35, 0.35), (0.35, 0.35), (-0.35, -0.35), (0.35, -0.35)]
-        colors = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
-        
-        for i, ((x, y), color) in enumerate(zip(positions, colors)):
-            pipe_circle = Circle((x, y), 0.2, facecolor=color, edgecolor='black', linewidth=1.5)
-            ax_inset.add_patch(pipe_circle)
-            ax_inset.text(x, y, str(i+1), ha='center', va='center', 
-                         fontsize=11, fontweight='bold', color='white')
-        
-        ax_inset.set_xlim(-1.1, 1.1)
-        ax_inset.set_ylim(-1.1, 1.1)
-        ax_inset.set_aspect('equal')
-        ax_inset.axis('off')
-        
-        # Hauptgrafik-Einstellungen (angepasst für enge Sonde)
-        ax.set_xlim(0, 9)
-        ax.set_ylim(-1, 18)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        fig.tight_layout()
-        
-        # Canvas in Frame einbetten
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Vorgerenderte Grafik (matplotlib läuft nur beim ersten Aufruf)
+        self._borehole_image = tk.PhotoImage(data=base64.b64encode(_render_borehole_png()))
+        ttk.Label(parent, image=self._borehole_image).pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Erklärungstext
         info_text = ttk.Label(parent, text=
@@ -678,6 +1042,36 @@ class GeothermieGUIProfessional:
             font=("Arial", 9), justify=tk.LEFT, foreground='#424242')
         info_text.pack(pady=(0, 10))
     
+    def _flush_status(self):
+        """Zeichnet ausstehende Widget-Änderungen (z.B. Statustext) höchstens alle 50 ms.
+        
+        Verwendet update_idletasks statt update, damit keine Benutzereingaben
+        verarbeitet werden und Handler nicht erneut auslösen können.
+        """
+        now = time.monotonic()
+        if now - self._last_status_flush > 0.05:
+            self._last_status_flush = now
+            self.root.update_idletasks()
+    
+    def _set_status(self, msg, immediate=False):
+        """Setzt den Statustext gebündelt: schnelle Folgeaufrufe innerhalb von
+        50 ms lösen nur ein Neuzeichnen der Statusleiste aus.
+        
+        Mit immediate=True wird der Text sofort gesetzt, z.B. vor einer
+        blockierenden Operation.
+        """
+        self._status_pending = msg
+        if immediate:
+            self.status_var.set(msg)
+        elif not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after(50, self._apply_status)
+    
+    def _apply_status(self):
+        """Überträgt den zuletzt gesetzten Statustext in die Statusleiste."""
+        self._status_scheduled = False
+        self.status_var.set(self._status_pending)
+    
     def _create_status_bar(self):
         """Erstellt die Statusleiste."""
         self.status_var = tk.StringVar(value="Bereit - Professional Edition V3.0")
@@ -693,14 +1087,14 @@ class GeothermieGUIProfessional:
         soil = self.soil_db.get_soil_type(soil_name)
         
         if soil:
-            # Update Werte
-            self.entries["ground_thermal_cond"].delete(0, tk.END)
-            self.entries["ground_thermal_cond"].insert(0, str(soil.thermal_conductivity_typical))
-            
-            self.entries["ground_heat_cap"].delete(0, tk.END)
-            self.entries["ground_heat_cap"].insert(0, str(soil.heat_capacity_typical * 1e6))
+            # Update Werte (auch bei erneuter Auswahl, um Eingaben zurückzusetzen)
+            self._set_entry("ground_thermal_cond", soil.thermal_conductivity_typical)
+            self._set_entry("ground_heat_cap", soil.heat_capacity_typical * 1e6)
             
-            # Info anzeigen
+            # Info nur bei geändertem Bodentyp neu setzen
+            if soil_name == self._last_soil_name:
+                return
+            self._last_soil_name = soil_name
             info = f"{soil.description}\nλ: {soil.thermal_conductivity_min}-{soil.thermal_conductivity_max} W/m·K (typ: {soil.thermal_conductivity_typical})\nWärmeentzug: {soil.heat_extraction_rate_min}-{soil.heat_extraction_rate_max} W/m"
             self.soil_info_label.config(text=info)
     
@@ -711,31 +1105,25 @@ class GeothermieGUIProfessional:
         
         if material:
             # Update Wert
-            self.entries["grout_thermal_cond"].delete(0, tk.END)
-            self.entries["grout_thermal_cond"].insert(0, str(material.thermal_conductivity))
+            self._set_entry("grout_thermal_cond", material.thermal_conductivity)
             
-            # Info anzeigen
+            # Info nur bei geändertem Material neu setzen
+            if material_name == self._last_grout_name:
+                return
+            self._last_grout_name = material_name
             info = f"{material.description}\nλ: {material.thermal_conductivity} W/m·K, ρ: {material.density} kg/m³, Preis: {material.price_per_kg} EUR/kg\n{material.typical_application}"
             self.grout_info_label.config(text=info)
     
     def _on_pipe_selected(self, event):
         """Wenn ein Rohrtyp ausgewählt wird."""
-        if not self.pipes:
+        pipe = self.pipes_by_name.get(self.pipe_type_var.get())
+        if pipe is None:
             return
         
-        selected_name = self.pipe_type_var.get()
-        for pipe in self.pipes:
-            if pipe.name == selected_name:
-                # Konvertiere m → mm für Anzeige
-                self.entries["pipe_outer_diameter"].delete(0, tk.END)
-                self.entries["pipe_outer_diameter"].insert(0, f"{pipe.diameter_m * 1000:.1f}")
-                
-                self.entries["pipe_thickness"].delete(0, tk.END)
-                self.entries["pipe_thickness"].insert(0, f"{pipe.thickness_m * 1000:.1f}")
-                
-                self.entries["pipe_thermal_cond"].delete(0, tk.END)
-                self.entries["pipe_thermal_cond"].insert(0, str(pipe.thermal_conductivity))
-                break
+        # Konvertiere m → mm für Anzeige
+        self._set_entry("pipe_outer_diameter", f"{pipe.diameter_m * 1000:.1f}")
+        self._set_entry("pipe_thickness", f"{pipe.thickness_m * 1000:.1f}")
+        self._set_entry("pipe_thermal_cond", pipe.thermal_conductivity)
     
     def _on_climate_fallback_selected(self, event):
         """Wenn Fallback-Klimadaten ausgewählt werden."""
@@ -743,158 +1131,264 @@ class GeothermieGUIProfessional:
         data = FALLBACK_CLIMATE_DATA.get(region)
         
         if data:
-            self.climate_entries["avg_air_temp"].delete(0, tk.END)
-            self.climate_entries["avg_air_temp"].insert(0, str(data['yearly_avg_temp']))
+            self._set_entry("avg_air_temp", data['yearly_avg_temp'])
+            self._set_entry("coldest_month_temp", data['coldest_month_temp'])
             
-            self.climate_entries["coldest_month_temp"].delete(0, tk.END)
-            self.climate_entries["coldest_month_temp"].insert(0, str(data['coldest_month_temp']))
-            
-            self.status_var.set(f"✓ Klimadaten geladen: {region}")
+            self._set_status(f"✓ Klimadaten geladen: {region}")
     
     # =========== BERECHNUNGEN ===========
     
+    @staticmethod
+    def _parse_numeric(entries: Dict[str, Any]) -> Dict[str, float]:
+        """Liest Eingabefelder und wandelt sie in einem NumPy-Aufruf in Floats um."""
+        keys = tuple(entries)
+        raw = [entries[key].get() for key in keys]
+        try:
+            values = np.array(raw, dtype=np.float64)
+        except ValueError:
+            # Fehlerhaftes Feld für eine verständliche Meldung suchen
+            for key, text in zip(keys, raw):
+                try:
+                    float(text)
+                except ValueError:
+                    raise ValueError(f"Ungültiger Zahlenwert für '{key}': '{text}'") from None
+            raise
+        return dict(zip(keys, values.tolist()))
+    
+    def _snapshot_inputs(self, keys) -> Dict[str, Any]:
+        """Liest die angegebenen numerischen Eingabefelder einmalig in ein Dict.
+        
+        Nur die benötigten Felder werden geparst, damit ein ungültiger Wert in
+        einer anderen Sektion das Werkzeug nicht blockiert.
+        """
+        entries = {**self.entries, **self.borehole_entries,
+                   **self.heat_pump_entries, **self.hydraulics_entries}
+        values = self._parse_numeric({key: entries[key] for key in keys})
+        for key in self._INT_KEYS & values.keys():
+            if not values[key].is_integer():
+                raise ValueError(f"Ungültiger Ganzzahlwert für '{key}': '{values[key]}'")
+            values[key] = int(values[key])
+        return values
+    
+    def _memo_get(self, cache, key):
+        """Liefert einen zwischengespeicherten Wert und markiert ihn als zuletzt benutzt."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _memo_put(self, cache, key, value):
+        """Speichert einen Wert und verwirft bei Überlauf den ältesten Eintrag."""
+        cache[key] = value
+        if len(cache) > self._MEMO_SIZE:
+            cache.popitem(last=False)
+    
     def _calculate_grout_materials(self):
-        """Berechnet Verfüllmaterial-Mengen."""
+        """Berechnet Verfüllmaterial-Mengen im Hintergrund."""
+        if self._grout_future is not None and not self._grout_future.done():
+            return
         try:
-            # Hole Parameter
-            depth = float(self.entries["initial_depth"].get())
-            bh_diameter = float(self.entries["borehole_diameter"].get()) / 1000.0  # mm → m
-            pipe_diameter = float(self.entries["pipe_outer_diameter"].get()) / 1000.0  # mm → m
-            num_boreholes = int(self.borehole_entries["num_boreholes"].get())
-            
-            # Anzahl Rohre basierend auf Konfiguration
+            values = self._snapshot_inputs(self._GROUT_INPUTS)
             config = self.pipe_config_var.get()
-            if "4-rohr" in config or "double" in config:
-                num_pipes = 4
-            else:
-                num_pipes = 2
-            
-            # Volumen berechnen
-            volume_per_bh = self.grout_db.calculate_volume(depth, bh_diameter, pipe_diameter, num_pipes)
-            total_volume = volume_per_bh * num_boreholes
-            
-            # Material-Eigenschaften
             material_name = self.grout_material_var.get()
-            material = self.grout_db.get_material(material_name)
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler bei Materialberechnung: {str(e)}")
+            return
+        
+        # Unveränderte Eingaben: Ergebnis aus dem Cache übernehmen
+        key = (tuple(sorted(values.items())), config, material_name)
+        cached = self._memo_get(self._grout_cache, key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            self._on_grout_done(future, key)
+            return
+        
+        self.grout_button.state(['disabled'])
+        future = self._tool_executor.submit(self._compute_grout, values, config, material_name)
+        self._grout_future = future
+        self._poll_future(future, lambda f: self._on_grout_done(f, key), interval=50)
+    
+    def _on_grout_done(self, future, key):
+        """Übernimmt die Verfüllmengen im Tk-Hauptthread."""
+        self.grout_button.state(['!disabled'])
+        try:
+            cached = future.result()
+            self._memo_put(self._grout_cache, key, cached)
+            self.grout_calculation, text, status = cached
             
-            # Mengen berechnen
-            amounts = self.grout_db.calculate_material_amount(total_volume, material)
+            self._ensure_materials_tab()
+            self.grout_result_text.replace("1.0", tk.END, text)
             
-            # Speichern
-            self.grout_calculation = {
-                'material': material,
-                'amounts': amounts,
-                'num_boreholes': num_boreholes,
-                'volume_per_bh': volume_per_bh
-            }
-            
-            # Anzeigen
-            text = "=" * 60 + "\n"
-            text += "VERFÜLLMATERIAL-BERECHNUNG\n"
-            text += "=" * 60 + "\n\n"
-            text += f"Material: {material.name}\n"
-            text += f"  λ = {material.thermal_conductivity} W/m·K\n"
-            text += f"  ρ = {material.density} kg/m³\n"
-            text += f"  Preis: {material.price_per_kg} EUR/kg\n\n"
-            text += f"Konfiguration:\n"
-            text += f"  Anzahl Bohrungen: {num_boreholes}\n"
-            text += f"  Tiefe pro Bohrung: {depth} m\n"
-            text += f"  Bohrloch-Ø: {bh_diameter*1000:.0f} mm\n"
-            text += f"  Rohre: {num_pipes} × Ø {pipe_diameter*1000:.0f} mm\n\n"
-            text += f"Benötigte Mengen:\n"
-            text += f"  Volumen pro Bohrung: {volume_per_bh:.3f} m³ ({volume_per_bh*1000:.1f} Liter)\n"
-            text += f"  Volumen gesamt: {total_volume:.3f} m³ ({total_volume*1000:.1f} Liter)\n"
-            text += f"  Masse gesamt: {amounts['mass_kg']:.1f} kg\n"
-            text += f"  Säcke (25 kg): {amounts['bags_25kg']:.1f} Stück\n\n"
-            text += f"Kosten:\n"
-            text += f"  Gesamt: {amounts['total_cost_eur']:.2f} EUR\n"
-            text += f"  Pro Meter: {amounts['cost_per_m']:.2f} EUR/m\n\n"
-            text += "=" * 60 + "\n"
-            
-            self.grout_result_text.delete("1.0", tk.END)
-            self.grout_result_text.insert("1.0", text)
-            
-            self.status_var.set(f"✓ Materialberechnung: {total_volume*1000:.0f} Liter ({amounts['bags_25kg']:.0f} Säcke), {amounts['total_cost_eur']:.2f} EUR")
+            self._set_status(status)
             
         except Exception as e:
             messagebox.showerror("Fehler", f"Fehler bei Materialberechnung: {str(e)}")
     
+    def _compute_grout(self, values, config, material_name):
+        """Berechnet Verfüllmengen samt Bericht.
+        
+        Returns:
+            Tupel (Berechnungsdaten, Berichtstext, Statustext)
+        """
+        # Hole Parameter
+        depth = values["initial_depth"]
+        bh_diameter = values["borehole_diameter"] / 1000.0  # mm → m
+        pipe_diameter = values["pipe_outer_diameter"] / 1000.0  # mm → m
+        num_boreholes = values["num_boreholes"]
+        
+        # Anzahl Rohre basierend auf Konfiguration
+        if "4-rohr" in config or "double" in config:
+            num_pipes = 4
+        else:
+            num_pipes = 2
+        
+        # Volumen berechnen
+        volume_per_bh = self.grout_db.calculate_volume(depth, bh_diameter, pipe_diameter, num_pipes)
+        total_volume = volume_per_bh * num_boreholes
+        
+        # Material-Eigenschaften
+        material = self.grout_db.get_material(material_name)
+        
+        # Mengen berechnen
+        amounts = self.grout_db.calculate_material_amount(total_volume, material)
+        
+        calculation = {
+            'material': material,
+            'amounts': amounts,
+            'num_boreholes': num_boreholes,
+            'volume_per_bh': volume_per_bh
+        }
+        
+        text = (
+            f"{_TOOL_RULE}\n"
+            "VERFÜLLMATERIAL-BERECHNUNG\n"
+            f"{_TOOL_RULE}\n\n"
+            f"Material: {material.name}\n"
+            f"  λ = {material.thermal_conductivity} W/m·K\n"
+            f"  ρ = {material.density} kg/m³\n"
+            f"  Preis: {material.price_per_kg} EUR/kg\n\n"
+            f"Konfiguration:\n"
+            f"  Anzahl Bohrungen: {num_boreholes}\n"
+            f"  Tiefe pro Bohrung: {depth} m\n"
+            f"  Bohrloch-Ø: {bh_diameter*1000:.0f} mm\n"
+            f"  Rohre: {num_pipes} × Ø {pipe_diameter*1000:.0f} mm\n\n"
+            f"Benötigte Mengen:\n"
+            f"  Volumen pro Bohrung: {volume_per_bh:.3f} m³ ({volume_per_bh*1000:.1f} Liter)\n"
+            f"  Volumen gesamt: {total_volume:.3f} m³ ({total_volume*1000:.1f} Liter)\n"
+            f"  Masse gesamt: {amounts['mass_kg']:.1f} kg\n"
+            f"  Säcke (25 kg): {amounts['bags_25kg']:.1f} Stück\n\n"
+            f"Kosten:\n"
+            f"  Gesamt: {amounts['total_cost_eur']:.2f} EUR\n"
+            f"  Pro Meter: {amounts['cost_per_m']:.2f} EUR/m\n\n"
+            f"{_TOOL_RULE}\n"
+        )
+        
+        status = f"✓ Materialberechnung: {total_volume*1000:.0f} Liter ({amounts['bags_25kg']:.0f} Säcke), {amounts['total_cost_eur']:.2f} EUR"
+        return calculation, text, status
+    
     def _calculate_hydraulics(self):
-        """Berechnet Hydraulik-Parameter."""
+        """Berechnet Hydraulik-Parameter im Hintergrund."""
+        if self._hydraulics_future is not None and not self._hydraulics_future.done():
+            return
         try:
-            # Hole Parameter
-            heat_power = float(self.heat_pump_entries["heat_pump_power"].get())
-            antifreeze_conc = float(self.hydraulics_entries["antifreeze_concentration"].get())
-            num_circuits = int(self.hydraulics_entries["num_circuits"].get())
-            depth = float(self.entries["initial_depth"].get())
-            num_boreholes = int(self.borehole_entries["num_boreholes"].get())
-            # Konvertiere mm → m für Innendurchmesser-Berechnung
-            pipe_outer_d_m = float(self.entries["pipe_outer_diameter"].get()) / 1000.0
-            pipe_thickness_m = float(self.entries["pipe_thickness"].get()) / 1000.0
-            pipe_inner_d = pipe_outer_d_m - 2 * pipe_thickness_m
-            
-            # Volumenstrom berechnen
-            flow = self.hydraulics_calc.calculate_required_flow_rate(
-                heat_power, 3.0, antifreeze_conc
-            )
-            
-            # System-Druckverlust
-            system = self.hydraulics_calc.calculate_total_system_pressure_drop(
-                depth, num_boreholes, num_circuits, pipe_inner_d,
-                flow['volume_flow_m3_h'], antifreeze_conc
-            )
+            values = self._snapshot_inputs(self._HYDRAULICS_INPUTS)
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler bei Hydraulik-Berechnung: {str(e)}")
+            return
+        
+        # Unveränderte Eingaben: Ergebnis aus dem Cache übernehmen
+        key = tuple(sorted(values.items()))
+        cached = self._memo_get(self._hydraulics_cache, key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            self._on_hydraulics_done(future, key)
+            return
+        
+        self.hydraulics_button.state(['disabled'])
+        future = self._tool_executor.submit(self._compute_hydraulics, values)
+        self._hydraulics_future = future
+        self._poll_future(future, lambda f: self._on_hydraulics_done(f, key), interval=50)
+    
+    def _on_hydraulics_done(self, future, key):
+        """Übernimmt das Hydraulik-Ergebnis im Tk-Hauptthread."""
+        self.hydraulics_button.state(['!disabled'])
+        try:
+            cached = future.result()
+            self._memo_put(self._hydraulics_cache, key, cached)
+            self.hydraulics_result, text, status = cached
             
-            # Pumpenleistung
-            pump = self.hydraulics_calc.calculate_pump_power(
-                flow['volume_flow_m3_h'], system['total_pressure_drop_bar']
-            )
+            self.cold_power_label.config(text=f"{self.hydraulics_result['cold_power']:.2f} kW",
+                                         foreground="blue")
             
-            # Kälteleistung berechnen (COP)
-            cop = float(self.entries["heat_pump_cop"].get())
-            cold_power = heat_power * (cop - 1) / cop
-            self.cold_power_label.config(text=f"{cold_power:.2f} kW", foreground="blue")
-            
-            # Speichern
-            self.hydraulics_result = {
-                'flow': flow,
-                'system': system,
-                'pump': pump,
-                'cold_power': cold_power
-            }
+            self._ensure_materials_tab()
+            self.hydraulics_result_text.replace("1.0", tk.END, text)
             
-            # Anzeigen
-            text = "=" * 60 + "\n"
-            text += "HYDRAULIK-BERECHNUNG\n"
-            text += "=" * 60 + "\n\n"
-            text += f"Wärmeleistung: {heat_power} kW\n"
-            text += f"COP: {cop}\n"
-            text += f"Kälteleistung: {cold_power:.2f} kW\n"
-            text += f"Frostschutz: {antifreeze_conc} Vol%\n"
-            text += f"Anzahl Kreise: {num_circuits}\n\n"
-            text += f"Volumenstrom:\n"
-            text += f"  Gesamt: {flow['volume_flow_m3_h']:.3f} m³/h ({flow['volume_flow_l_min']:.1f} l/min)\n"
-            text += f"  Pro Kreis: {system['volume_flow_per_circuit_m3h']:.3f} m³/h\n"
-            text += f"  Geschwindigkeit: {system['velocity_m_s']:.2f} m/s\n"
-            text += f"  Reynolds: {system['reynolds']:.0f}\n\n"
-            text += f"Druckverlust:\n"
-            text += f"  Bohrungen: {system['pressure_drop_borehole_bar']:.2f} bar\n"
-            text += f"  Zusatzverluste: {system['additional_losses_bar']:.2f} bar\n"
-            text += f"  GESAMT: {system['total_pressure_drop_bar']:.2f} bar ({system['total_pressure_drop_mbar']:.0f} mbar)\n\n"
-            text += f"Pumpe:\n"
-            text += f"  Hydraulische Leistung: {pump['hydraulic_power_w']:.0f} W\n"
-            text += f"  Elektrische Leistung: {pump['electric_power_w']:.0f} W ({pump['electric_power_kw']:.2f} kW)\n\n"
-            text += "=" * 60 + "\n"
-            
-            self.hydraulics_result_text.delete("1.0", tk.END)
-            self.hydraulics_result_text.insert("1.0", text)
-            
-            self.status_var.set(f"✓ Hydraulik: {flow['volume_flow_m3_h']:.2f} m³/h, {system['total_pressure_drop_mbar']:.0f} mbar, {pump['electric_power_w']:.0f} W")
+            self._set_status(status)
             
         except Exception as e:
             messagebox.showerror("Fehler", f"Fehler bei Hydraulik-Berechnung: {str(e)}")
     
+    def _compute_hydraulics(self, values):
+        """Berechnet Volumenstrom, Druckverlust und Pumpenleistung samt Bericht.
+        
+        Returns:
+            Tupel (Ergebnisdaten, Berichtstext, Statustext)
+        """
+        # Hole Parameter
+        heat_power = values["heat_pump_power"]
+        antifreeze_conc = values["antifreeze_concentration"]
+        num_circuits = values["num_circuits"]
+        depth = values["initial_depth"]
+        num_boreholes = values["num_boreholes"]
+        # Konvertiere mm → m für Innendurchmesser-Berechnung
+        pipe_outer_d_m = values["pipe_outer_diameter"] / 1000.0
+        pipe_thickness_m = values["pipe_thickness"] / 1000.0
+        pipe_inner_d = pipe_outer_d_m - 2 * pipe_thickness_m
+        
+        # Volumenstrom berechnen
+        flow = self.hydraulics_calc.calculate_required_flow_rate(
+            heat_power, 3.0, antifreeze_conc
+        )
+        
+        # System-Druckverlust
+        system = self.hydraulics_calc.calculate_total_system_pressure_drop(
+            depth, num_boreholes, num_circuits, pipe_inner_d,
+            flow['volume_flow_m3_h'], antifreeze_conc
+        )
+        
+        # Pumpenleistung
+        pump = self.hydraulics_calc.calculate_pump_power(
+            flow['volume_flow_m3_h'], system['total_pressure_drop_bar']
+        )
+        
+        # Kälteleistung berechnen (COP)
+        cop = values["heat_pump_cop"]
+        cold_power = heat_power * (cop - 1) / cop
+        
+        result = {
+            'flow': flow,
+            'system': system,
+            'pump': pump,
+            'cold_power': cold_power
+        }
+        
+        text = _HYDRAULICS_REPORT.format(
+            heat_power=heat_power, cop=cop, cold_power=cold_power,
+            antifreeze_conc=antifreeze_conc, num_circuits=num_circuits,
+            flow=flow, system=system, pump=pump
+        )
+        
+        status = f"✓ Hydraulik: {flow['volume_flow_m3_h']:.2f} m³/h, {system['total_pressure_drop_mbar']:.0f} mbar, {pump['electric_power_w']:.0f} W"
+        return result, text, status
+    
     def _load_pvgis_data(self):
         """Lädt Klimadaten von PVGIS."""
+        # Läuft bereits ein Abruf, keinen zweiten starten
+        if self._pvgis_future is not None and not self._pvgis_future.done():
+            return
+        
         # Benutzerdefinierten Dialog für bessere Sichtbarkeit
         dialog = tk.Toplevel(self.root)
         dialog.title("🌍 PVGIS Klimadaten laden")
@@ -968,188 +1462,217 @@ class GeothermieGUIProfessional:
         # Warte auf Dialog
         self.root.wait_window(dialog)
         
-        # Verarbeite Ergebnis
-        try:
-            if result['choice'] == 'address' and result['address']:
-                address = result['address']
-                if "z.B." not in address:
-                    self.status_var.set("⏳ Lade Klimadaten von PVGIS...")
-                    self.root.update()
-                    data = self.pvgis_client.get_climate_data_for_address(address)
-                else:
-                    return
-            elif result['choice'] == 'coords' and result['lat'] and result['lon']:
-                lat, lon = result['lat'], result['lon']
-                self.status_var.set("⏳ Lade Klimadaten von PVGIS...")
-                self.root.update()
-                data = self.pvgis_client.get_monthly_temperature_data(lat, lon)
-            else:
+        # Verarbeite Ergebnis: Abruf im Hintergrund, Übernahme im Tk-Thread
+        if result['choice'] == 'address' and result['address']:
+            address = result['address']
+            if "z.B." in address:
                 return
+            fetch = lambda: self.pvgis_client.get_climate_data_for_address(address)
+        elif result['choice'] == 'coords' and result['lat'] and result['lon']:
+            lat, lon = result['lat'], result['lon']
+            fetch = lambda: self.pvgis_client.get_monthly_temperature_data(lat, lon)
+        else:
+            return
+        
+        self._set_status("⏳ Lade Klimadaten von PVGIS...")
+        self.pvgis_button.state(['disabled'])
+        self._pvgis_future = self._io_executor.submit(fetch)
+        self._poll_future(self._pvgis_future, self._apply_pvgis, interval=50)
+    
+    def _apply_pvgis(self, future):
+        """Übernimmt abgerufene PVGIS-Daten in die Eingabefelder."""
+        self.pvgis_button.state(['!disabled'])
+        try:
+            data = future.result()
             
             if data:
                 # Übernehme Daten
-                self.climate_entries["avg_air_temp"].delete(0, tk.END)
-                self.climate_entries["avg_air_temp"].insert(0, f"{data['yearly_avg_temp']:.1f}")
-                
-                self.climate_entries["coldest_month_temp"].delete(0, tk.END)
-                self.climate_entries["coldest_month_temp"].insert(0, f"{data['coldest_month_temp']:.1f}")
+                self._set_entry("avg_air_temp", f"{data['yearly_avg_temp']:.1f}")
+                self._set_entry("coldest_month_temp", f"{data['coldest_month_temp']:.1f}")
                 
                 # Bodentemperatur schätzen
                 ground_temp = self.soil_db.estimate_ground_temperature(
                     data['yearly_avg_temp'], data['coldest_month_temp']
                 )
-                self.entries["ground_temp"].delete(0, tk.END)
-                self.entries["ground_temp"].insert(0, f"{ground_temp:.1f}")
+                self._set_entry("ground_temp", f"{ground_temp:.1f}")
                 
                 messagebox.showinfo("Erfolg", f"Klimadaten erfolgreich geladen!\n\n" +
                                    f"Jahresmittel: {data['yearly_avg_temp']:.1f}°C\n" +
                                    f"Kältester Monat: {data['coldest_month_temp']:.1f}°C\n" +
                                    f"Geschätzte Bodentemp.: {ground_temp:.1f}°C")
                 
-                self.status_var.set("✓ PVGIS Klimadaten erfolgreich geladen")
+                self._set_status("✓ PVGIS Klimadaten erfolgreich geladen")
             else:
-                messagebox.showwarning("Keine Daten", "Keine Daten von PVGIS erhalten. Verwenden Sie Fallback-Daten.")
-                self.status_var.set("❌ PVGIS nicht erreichbar - Verwende Fallback")
+                # Fallback-Region übernehmen
+                region = self.climate_fallback_var.get()
+                self._on_climate_fallback_selected(None)
+                messagebox.showwarning("Keine Daten", "Keine Daten von PVGIS erhalten.\n\n"
+                                       f"Fallback-Daten für '{region}' wurden übernommen.")
+                self._set_status("❌ PVGIS nicht erreichbar - Verwende Fallback")
                 
         except Exception as e:
             messagebox.showerror("Fehler", f"Fehler beim Laden der PVGIS-Daten: {str(e)}")
-            self.status_var.set("❌ PVGIS-Fehler")
+            self._set_status("❌ PVGIS-Fehler")
     
     def _run_calculation(self):
-        """Führt die Hauptberechnung durch."""
+        """Startet die Hauptberechnung im Hintergrund-Thread."""
+        if self._calc_future is not None and not self._calc_future.done():
+            return
         try:
             # Sammle Parameter
-            params = {}
-            for key, entry in self.entries.items():
-                params[key] = float(entry.get())
+            params = self._parse_numeric(self.entries)
             
             # Konvertiere mm → m für Rohr-Parameter und Bohrlochdurchmesser
             params["pipe_outer_diameter"] = params["pipe_outer_diameter"] / 1000.0
             params["pipe_thickness"] = params["pipe_thickness"] / 1000.0
             params["borehole_diameter"] = params["borehole_diameter"] / 1000.0
             
-            self.status_var.set("⏳ Berechnung läuft...")
-            self.root.update()
-            
-            # Pipe Config anpassen
-            pipe_config = self.pipe_config_var.get()
+            # Pipe Config anpassen (Anzeigewert für Bericht und PDF merken)
+            pipe_label = self.pipe_config_var.get()
+            pipe_config = pipe_label
             if "4-rohr" in pipe_config:
                 pipe_config = "double-u"
             
             # Anzahl Bohrungen
             num_boreholes = int(self.borehole_entries["num_boreholes"].get())
             
+            # Angezeigte Eingaben einmalig festhalten, damit Bericht und Diagramme
+            # zu den gerechneten Werten passen, auch wenn währenddessen editiert wird
+            display = {key: entry.get() for key, entry in self.project_entries.items()}
+            display.update((key, entry.get()) for key, entry in self.borehole_entries.items())
+            display["pipe_configuration"] = pipe_label
+            
             # Prüfe Berechnungsmethode
             method = self.calculation_method_var.get()
             
-            if method == "vdi4640":
-                # === VDI 4640 BERECHNUNG ===
-                
-                # Berechne Bohrlochwiderstand (vereinfachte Methode)
-                # Für eine genauere Berechnung könnte hier die Multipol-Methode verwendet werden
-                # Hier verwenden wir einen typischen Wert basierend auf der Geometrie
-                
-                # Vereinfachter Bohrlochwiderstand nach VDI 4640
-                borehole_radius = params["borehole_diameter"] / 2
-                pipe_outer_radius = params["pipe_outer_diameter"] / 2
-                
-                # Thermischer Widerstand Verfüllung (vereinfacht)
-                r_grout = (1 / (2 * math.pi * params["grout_thermal_cond"])) * \
-                          math.log(borehole_radius / pipe_outer_radius)
-                
-                # Thermischer Widerstand Rohr
-                pipe_inner_radius = (params["pipe_outer_diameter"] - 2 * params["pipe_thickness"]) / 2
-                r_pipe = (1 / (2 * math.pi * params["pipe_thermal_cond"])) * \
-                         math.log(params["pipe_outer_diameter"] / (2 * pipe_inner_radius))
-                
-                # Konvektiver Widerstand (vereinfacht)
-                r_conv = 1 / (2 * math.pi * pipe_inner_radius * 500)  # h ≈ 500 W/m²K typisch
-                
-                # Gesamtwiderstand (vereinfacht für Single-U oder Double-U)
-                if pipe_config == "single-u":
-                    r_borehole = r_grout + r_pipe + r_conv
-                else:  # double-u
-                    r_borehole = 0.8 * (r_grout + r_pipe + r_conv)  # Reduktion durch 4 Rohre
-                
-                # Mindestens 0.05 m·K/W
-                r_borehole = max(0.05, r_borehole)
-                
-                # Thermische Diffusivität
-                thermal_diffusivity = params["ground_thermal_cond"] / params["ground_heat_cap"]
-                
-                # VDI 4640 Berechnung
-                self.vdi4640_result = self.vdi4640_calc.calculate_complete(
-                    ground_thermal_conductivity=params["ground_thermal_cond"],
-                    ground_thermal_diffusivity=thermal_diffusivity,
-                    t_undisturbed=params["ground_temp"],
-                    borehole_diameter=params["borehole_diameter"] * 1000,  # zurück in mm
-                    borehole_depth_initial=params["initial_depth"],
-                    n_boreholes=num_boreholes,
-                    r_borehole=r_borehole,
-                    annual_heating_demand=params["annual_heating"],  # jetzt in kWh
-                    peak_heating_load=params["peak_heating"],
-                    annual_cooling_demand=params["annual_cooling"],  # jetzt in kWh
-                    peak_cooling_load=params["peak_cooling"],
-                    heat_pump_cop_heating=params["heat_pump_cop"],
-                    heat_pump_cop_cooling=params.get("heat_pump_eer", params["heat_pump_cop"]),
-                    t_fluid_min_required=params["min_fluid_temp"],
-                    t_fluid_max_required=params["max_fluid_temp"],
-                    delta_t_fluid=params.get("delta_t_fluid", 3.0)
-                )
-                
-                # Erstelle BoreholeResult für Kompatibilität
-                from calculations.borehole import BoreholeResult
-                self.result = BoreholeResult(
-                    required_depth=self.vdi4640_result.required_depth_final,
-                    fluid_temperature_min=self.vdi4640_result.t_wp_aus_heating_min,
-                    fluid_temperature_max=self.vdi4640_result.t_wp_aus_cooling_max,
-                    borehole_resistance=r_borehole,
-                    effective_resistance=r_borehole + self.vdi4640_result.r_grundlast,
-                    heat_extraction_rate=self.vdi4640_result.q_nettogrundlast_heating / self.vdi4640_result.required_depth_final if self.vdi4640_result.required_depth_final > 0 else 0,
-                    monthly_temperatures=[self.vdi4640_result.t_wp_aus_heating_min] * 12
-                )
-                
-                self.status_var.set(f"✓ VDI 4640 Berechnung: {self.vdi4640_result.required_depth_final:.1f}m (ausgelegt für {self.vdi4640_result.design_case.upper()})")
-                
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler bei der Berechnung: {str(e)}")
+            self._set_status("❌ Berechnung fehlgeschlagen")
+            return
+        
+        # Unveränderte Eingaben: Ergebnis aus dem Cache übernehmen
+        key = (tuple(sorted(params.items())), pipe_config, num_boreholes, method)
+        cached = self._memo_get(self._calc_cache, key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            self._on_calculation_done(future, params, method, num_boreholes, display, key)
+            return
+        
+        self._set_status("⏳ Berechnung läuft...")
+        self.calc_button.state(['disabled'])
+        
+        future = self._executor.submit(self._compute_design, params, pipe_config,
+                                       num_boreholes, method)
+        self._calc_future = future
+        self._poll_future(
+            future,
+            lambda f: self._on_calculation_done(f, params, method, num_boreholes, display, key)
+        )
+    
+    def _compute_design(self, params, pipe_config, num_boreholes, method):
+        """Rechnet die Auslegung im Worker-Thread (ohne Tk-Zugriffe).
+        
+        Returns:
+            Tupel aus BoreholeResult und VDI4640Result (oder None)
+        """
+        if method == "vdi4640":
+            # === VDI 4640 BERECHNUNG ===
+            
+            # Vereinfachter Bohrlochwiderstand nach VDI 4640 (JIT-Kernel)
+            # Für eine genauere Berechnung könnte hier die Multipol-Methode verwendet werden
+            r_borehole = simplified_borehole_resistance(
+                params["borehole_diameter"], params["pipe_outer_diameter"],
+                params["pipe_thickness"], params["grout_thermal_cond"],
+                params["pipe_thermal_cond"], pipe_config == "single-u"
+            )
+            
+            # Thermische Diffusivität
+            thermal_diffusivity = params["ground_thermal_cond"] / params["ground_heat_cap"]
+            
+            # VDI 4640 Berechnung
+            vdi4640_result = self.vdi4640_calc.calculate_complete(
+                ground_thermal_conductivity=params["ground_thermal_cond"],
+                ground_thermal_diffusivity=thermal_diffusivity,
+                t_undisturbed=params["ground_temp"],
+                borehole_diameter=params["borehole_diameter"] * 1000,  # zurück in mm
+                borehole_depth_initial=params["initial_depth"],
+                n_boreholes=num_boreholes,
+                r_borehole=r_borehole,
+                annual_heating_demand=params["annual_heating"],  # jetzt in kWh
+                peak_heating_load=params["peak_heating"],
+                annual_cooling_demand=params["annual_cooling"],  # jetzt in kWh
+                peak_cooling_load=params["peak_cooling"],
+                heat_pump_cop_heating=params["heat_pump_cop"],
+                heat_pump_cop_cooling=params.get("heat_pump_eer", params["heat_pump_cop"]),
+                t_fluid_min_required=params["min_fluid_temp"],
+                t_fluid_max_required=params["max_fluid_temp"],
+                delta_t_fluid=params.get("delta_t_fluid", 3.0)
+            )
+            
+            # Erstelle BoreholeResult für Kompatibilität
+            from calculations.borehole import BoreholeResult
+            result = BoreholeResult(
+                required_depth=vdi4640_result.required_depth_final,
+                fluid_temperature_min=vdi4640_result.t_wp_aus_heating_min,
+                fluid_temperature_max=vdi4640_result.t_wp_aus_cooling_max,
+                borehole_resistance=r_borehole,
+                effective_resistance=r_borehole + vdi4640_result.r_grundlast,
+                heat_extraction_rate=vdi4640_result.q_nettogrundlast_heating / vdi4640_result.required_depth_final if vdi4640_result.required_depth_final > 0 else 0,
+                monthly_temperatures=[vdi4640_result.t_wp_aus_heating_min] * 12
+            )
+            
+            return result, vdi4640_result
+            
+        else:
+            # === ITERATIVE BERECHNUNG (Original) ===
+            result = self.calculator.calculate_required_depth(
+                ground_thermal_conductivity=params["ground_thermal_cond"],
+                ground_heat_capacity=params["ground_heat_cap"],
+                undisturbed_ground_temp=params["ground_temp"],
+                geothermal_gradient=params["geothermal_gradient"],
+                borehole_diameter=params["borehole_diameter"],
+                pipe_configuration=pipe_config,
+                pipe_outer_diameter=params["pipe_outer_diameter"],
+                pipe_wall_thickness=params["pipe_thickness"],
+                pipe_thermal_conductivity=params["pipe_thermal_cond"],
+                shank_spacing=params["shank_spacing"],
+                grout_thermal_conductivity=params["grout_thermal_cond"],
+                fluid_thermal_conductivity=params["fluid_thermal_cond"],
+                fluid_heat_capacity=params["fluid_heat_cap"],
+                fluid_density=params["fluid_density"],
+                fluid_viscosity=params["fluid_viscosity"],
+                fluid_flow_rate=params["fluid_flow_rate"],
+                annual_heating_demand=params["annual_heating"] / 1000,  # kWh → MWh
+                annual_cooling_demand=params["annual_cooling"] / 1000,  # kWh → MWh
+                peak_heating_load=params["peak_heating"],
+                peak_cooling_load=params["peak_cooling"],
+                heat_pump_cop=params["heat_pump_cop"],
+                min_fluid_temperature=params["min_fluid_temp"],
+                max_fluid_temperature=params["max_fluid_temp"],
+                simulation_years=int(params["simulation_years"]),
+                initial_depth=params["initial_depth"]
+            )
+            
+            return result, None
+    
+    def _on_calculation_done(self, future, params, method, num_boreholes, display, key):
+        """Übernimmt das Berechnungsergebnis im Tk-Hauptthread."""
+        self.calc_button.state(['!disabled'])
+        try:
+            self.result, self.vdi4640_result = future.result()
+            self._memo_put(self._calc_cache, key, (self.result, self.vdi4640_result))
+            
+            if self.vdi4640_result is not None:
+                self._set_status(f"✓ VDI 4640 Berechnung: {self.vdi4640_result.required_depth_final:.1f}m (ausgelegt für {self.vdi4640_result.design_case.upper()})")
             else:
-                # === ITERATIVE BERECHNUNG (Original) ===
-                self.result = self.calculator.calculate_required_depth(
-                    ground_thermal_conductivity=params["ground_thermal_cond"],
-                    ground_heat_capacity=params["ground_heat_cap"],
-                    undisturbed_ground_temp=params["ground_temp"],
-                    geothermal_gradient=params["geothermal_gradient"],
-                    borehole_diameter=params["borehole_diameter"],
-                    pipe_configuration=pipe_config,
-                    pipe_outer_diameter=params["pipe_outer_diameter"],
-                    pipe_wall_thickness=params["pipe_thickness"],
-                    pipe_thermal_conductivity=params["pipe_thermal_cond"],
-                    shank_spacing=params["shank_spacing"],
-                    grout_thermal_conductivity=params["grout_thermal_cond"],
-                    fluid_thermal_conductivity=params["fluid_thermal_cond"],
-                    fluid_heat_capacity=params["fluid_heat_cap"],
-                    fluid_density=params["fluid_density"],
-                    fluid_viscosity=params["fluid_viscosity"],
-                    fluid_flow_rate=params["fluid_flow_rate"],
-                    annual_heating_demand=params["annual_heating"] / 1000,  # kWh → MWh
-                    annual_cooling_demand=params["annual_cooling"] / 1000,  # kWh → MWh
-                    peak_heating_load=params["peak_heating"],
-                    peak_cooling_load=params["peak_cooling"],
-                    heat_pump_cop=params["heat_pump_cop"],
-                    min_fluid_temperature=params["min_fluid_temp"],
-                    max_fluid_temperature=params["max_fluid_temp"],
-                    simulation_years=int(params["simulation_years"]),
-                    initial_depth=params["initial_depth"]
-                )
-                
-                self.vdi4640_result = None
-                self.status_var.set(f"✓ Berechnung erfolgreich! {self.result.required_depth:.1f}m × {num_boreholes} = {self.result.required_depth * num_boreholes:.1f}m gesamt")
+                self._set_status(f"✓ Berechnung erfolgreich! {self.result.required_depth:.1f}m × {num_boreholes} = {self.result.required_depth * num_boreholes:.1f}m gesamt")
             
-            self.current_params = params
-            self.current_params['pipe_configuration'] = self.pipe_config_var.get()
-            self.current_params['calculation_method'] = method
+            self.current_params = dict(params, pipe_configuration=display["pipe_configuration"],
+                                       calculation_method=method)
             
-            self._display_results()
-            self._plot_results()
+            self._display_results(num_boreholes, display)
+            self._plot_results(num_boreholes, display)
             
             self.notebook.select(self.results_frame)
             
@@ -1157,181 +1680,100 @@ class GeothermieGUIProfessional:
             import traceback
             traceback.print_exc()
             messagebox.showerror("Fehler", f"Fehler bei der Berechnung: {str(e)}")
-            self.status_var.set("❌ Berechnung fehlgeschlagen")
+            self._set_status("❌ Berechnung fehlgeschlagen")
     
-    def _get_pipe_positions(self, pipe_config, params):
-        """Gibt Rohrpositionen für Bohrlochwiderstand zurück."""
-        borehole_radius = params["borehole_diameter"] / 2
-        shank_spacing = params["shank_spacing"]
-        
-        if pipe_config == "single-u":
-            return [
-                (-shank_spacing / 2, 0),
-                (shank_spacing / 2, 0)
-            ]
-        elif pipe_config == "double-u":
-            offset = shank_spacing / 2
-            return [
-                (-offset, -offset),
-                (offset, -offset),
-                (-offset, offset),
-                (offset, offset)
-            ]
+    def _warmup_kernels(self):
+        """Stößt die JIT-Kompilierung der Rechenkernel im Rechen-Thread an."""
+        self._executor.submit(self.calculator.warmup)
+        self._executor.submit(self.vdi4640_calc.warmup)
+    
+    def _poll_future(self, future, on_done, interval=100):
+        """Prüft per root.after, ob ein Future fertig ist, ohne zu blockieren."""
+        if future.done():
+            on_done(future)
         else:
-            return [(0, 0), (0, 0)]
+            self.root.after(interval, self._poll_future, future, on_done, interval)
     
-    def _display_results(self):
-        """Zeigt Ergebnisse an."""
+    def _get_pipe_positions(self, pipe_config, params):
+        """Gibt Rohrpositionen für Bohrlochwiderstand als (n, 2)-Array in m zurück."""
+        unit = _PIPE_POSITIONS_UNIT.get(pipe_config, _PIPE_POSITIONS_FALLBACK)
+        return unit * params["shank_spacing"]
+    
+    def _display_results(self, num_boreholes, display):
+        """Zeigt Ergebnisse an (Eingaben aus dem Schnappschuss der Berechnung)."""
         if not self.result:
             return
         
-        num_bh = int(self.borehole_entries["num_boreholes"].get())
+        text = _format_report(
+            self.result, self.vdi4640_result, self.current_params,
+            num_boreholes, display["project_name"], display["customer_name"],
+        )
         
+        # Ein einziges replace auf dem Text-Widget
         self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete("1.0", tk.END)
-        
-        # === HEADER ===
-        text = "=" * 80 + "\n"
-        text += "ERDWÄRMESONDEN-BERECHNUNGSERGEBNIS (Professional V3.2)\n"
-        text += "=" * 80 + "\n\n"
-        
-        # Projekt Info
-        proj_name = self.project_entries["project_name"].get()
-        if proj_name:
-            text += f"📋 Projekt: {proj_name}\n"
-            text += f"👤 Kunde: {self.project_entries['customer_name'].get()}\n\n"
-        
-        # === BERECHNUNGSMETHODE ===
-        method = self.current_params.get('calculation_method', 'iterativ')
-        if method == "vdi4640" and self.vdi4640_result:
-            text += "📐 BERECHNUNGSMETHODE: VDI 4640 (Koenigsdorff)\n"
-            text += "=" * 80 + "\n\n"
-            
-            # === AUSLEGUNGSFALL ===
-            text += "🎯 AUSLEGUNGSFALL\n"
-            text += "-" * 80 + "\n"
-            if self.vdi4640_result.design_case == "heating":
-                text += "✓ HEIZEN ist auslegungsrelevant\n"
-                text += f"  Erforderliche Sondenlänge: {self.vdi4640_result.required_depth_heating:.1f} m\n"
-                text += f"  (Kühlen würde nur {self.vdi4640_result.required_depth_cooling:.1f} m benötigen)\n"
-            else:
-                text += "✓ KÜHLEN ist auslegungsrelevant (dominante Kühllast!)\n"
-                text += f"  Erforderliche Sondenlänge: {self.vdi4640_result.required_depth_cooling:.1f} m\n"
-                text += f"  (Heizen würde nur {self.vdi4640_result.required_depth_heating:.1f} m benötigen)\n"
-            text += f"\n  → Ausgelegte Sondenlänge: {self.vdi4640_result.required_depth_final:.1f} m\n"
-            text += f"  → Anzahl Bohrungen: {num_bh}\n"
-            text += f"  → Gesamtlänge: {self.vdi4640_result.required_depth_final * num_bh:.1f} m\n\n"
-            
-            # === WÄRMEPUMPENAUSTRITTSTEMPERATUREN ===
-            text += "🌡️  WÄRMEPUMPENAUSTRITTSTEMPERATUREN\n"
-            text += "-" * 80 + "\n"
-            text += f"Heizen (minimale WP-Austrittstemperatur): {self.vdi4640_result.t_wp_aus_heating_min:.2f} °C\n"
-            text += f"  Komponenten:\n"
-            text += f"    T_ungestört:            {self.current_params['ground_temp']:.2f} °C\n"
-            text += f"    - ΔT_Grundlast:        {self.vdi4640_result.delta_t_grundlast_heating:.3f} K\n"
-            text += f"    - ΔT_Periodisch:       {self.vdi4640_result.delta_t_per_heating:.3f} K\n"
-            text += f"    - ΔT_Peak:             {self.vdi4640_result.delta_t_peak_heating:.3f} K\n"
-            text += f"    - 0.5 · ΔT_Fluid:      {self.vdi4640_result.delta_t_fluid_heating / 2:.2f} K\n\n"
-            
-            text += f"Kühlen (maximale WP-Austrittstemperatur): {self.vdi4640_result.t_wp_aus_cooling_max:.2f} °C\n"
-            text += f"  Komponenten:\n"
-            text += f"    T_ungestört:            {self.current_params['ground_temp']:.2f} °C\n"
-            text += f"    + ΔT_Grundlast:        {self.vdi4640_result.delta_t_grundlast_cooling:.3f} K\n"
-            text += f"    + ΔT_Periodisch:       {self.vdi4640_result.delta_t_per_cooling:.3f} K\n"
-            text += f"    + ΔT_Peak:             {self.vdi4640_result.delta_t_peak_cooling:.3f} K\n"
-            text += f"    - 0.5 · ΔT_Fluid:      {self.vdi4640_result.delta_t_fluid_cooling / 2:.2f} K\n\n"
-            
-            # === THERMISCHE WIDERSTÄNDE ===
-            text += "♨️  THERMISCHE WIDERSTÄNDE\n"
-            text += "-" * 80 + "\n"
-            text += f"R_Grundlast (10 Jahre):     {self.vdi4640_result.r_grundlast:.6f} m·K/W  (g={self.vdi4640_result.g_grundlast:.4f})\n"
-            text += f"R_Periodisch (1 Monat):     {self.vdi4640_result.r_per:.6f} m·K/W  (g={self.vdi4640_result.g_per:.4f})\n"
-            text += f"R_Peak (6 Stunden):         {self.vdi4640_result.r_peak:.6f} m·K/W  (g={self.vdi4640_result.g_peak:.4f})\n"
-            text += f"R_Bohrloch:                 {self.vdi4640_result.r_borehole:.6f} m·K/W\n\n"
-            
-            # === LASTEN ===
-            text += "⚡ LASTDATEN\n"
-            text += "-" * 80 + "\n"
-            text += "HEIZEN:\n"
-            text += f"  Jahresenergie:         {self.current_params['annual_heating']:.0f} kWh\n"
-            text += f"  Q_Nettogrundlast:      {self.vdi4640_result.q_nettogrundlast_heating/1000:.3f} kW  (Jahresmittel)\n"
-            text += f"  Q_Periodisch:          {self.vdi4640_result.q_per_heating/1000:.3f} kW  (kritischster Monat)\n"
-            text += f"  Q_Peak:                {self.vdi4640_result.q_peak_heating/1000:.3f} kW  (Spitzenlast)\n\n"
-            
-            text += "KÜHLEN:\n"
-            text += f"  Jahresenergie:         {self.current_params['annual_cooling']:.0f} kWh\n"
-            text += f"  Q_Nettogrundlast:      {self.vdi4640_result.q_nettogrundlast_cooling/1000:.3f} kW  (Jahresmittel)\n"
-            text += f"  Q_Periodisch:          {self.vdi4640_result.q_per_cooling/1000:.3f} kW  (kritischster Monat)\n"
-            text += f"  Q_Peak:                {self.vdi4640_result.q_peak_cooling/1000:.3f} kW  (Spitzenlast)\n\n"
-            
-        else:
-            # === ITERATIVE METHODE ===
-            text += "⚙️  BERECHNUNGSMETHODE: Iterativ (Eskilson/Hellström)\n"
-            text += "=" * 80 + "\n\n"
-            
-            text += "🎯 BOHRFELD\n"
-            text += "-" * 80 + "\n"
-            text += f"Anzahl Bohrungen:      {num_bh}\n"
-            text += f"Tiefe pro Bohrung:     {self.result.required_depth:.1f} m\n"
-            text += f"Gesamtlänge:           {self.result.required_depth * num_bh:.1f} m\n\n"
-            
-            text += "🌡️  TEMPERATUREN\n"
-            text += "-" * 80 + "\n"
-            text += f"Min. Fluidtemperatur:  {self.result.fluid_temperature_min:.2f} °C\n"
-            text += f"Max. Fluidtemperatur:  {self.result.fluid_temperature_max:.2f} °C\n\n"
-            
-            text += "♨️  WIDERSTÄNDE\n"
-            text += "-" * 80 + "\n"
-            text += f"R_Bohrloch:            {self.result.borehole_resistance:.6f} m·K/W\n"
-            text += f"R_effektiv:            {self.result.effective_resistance:.6f} m·K/W\n\n"
-            
-            text += "⚡ ENTZUGSLEISTUNG\n"
-            text += "-" * 80 + "\n"
-            text += f"Spezifisch:            {self.result.heat_extraction_rate:.2f} W/m\n\n"
-        
-        text += "=" * 80 + "\n"
-        
-        self.results_text.insert("1.0", text)
+        self.results_text.replace("1.0", tk.END, text)
         self.results_text.config(state=tk.DISABLED)
     
-    def _plot_results(self):
-        """Erstellt Visualisierungen: Temperaturen, Bohrloch-Querschnitt, Bohrfeld-Layout."""
+    def _plot_results(self, num_boreholes, display):
+        """Erstellt Visualisierungen: Temperaturen, Bohrloch-Querschnitt, Bohrfeld-Layout.
+        
+        Bohrungsanzahl und Abstände stammen aus dem Schnappschuss der Berechnung.
+        """
         if not self.result:
             return
         
-        self.fig.clear()
+        self._ensure_visualization_tab()
         
         # 3 Subplots: Temperaturen links, Bohrfeld-Layout Mitte, Bohrloch-Querschnitt rechts
-        ax1 = self.fig.add_subplot(1, 3, 1)
-        ax2 = self.fig.add_subplot(1, 3, 2)
-        ax3 = self.fig.add_subplot(1, 3, 3)
+        # Temperaturen und Querschnitt aktualisieren nur die bestehenden Artists,
+        # das Bohrfeld hängt von der Bohrungsanzahl ab und wird neu gezeichnet.
+        ax1, ax2, ax3 = self.ax_temps, self.ax_field, self.ax_borehole
+        artists = self._plot_artists
         
         # Temperaturen
-        months = ["J", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D"]
-        x = np.arange(len(months))
-        
-        ax1.plot(x, self.result.monthly_temperatures, 'o-', linewidth=2.5, markersize=8, color='#1f4788')
-        ax1.axhline(y=self.result.fluid_temperature_min, color='b', linestyle='--', linewidth=2,
-                    label=f'Min: {self.result.fluid_temperature_min:.1f}°C')
-        ax1.axhline(y=self.result.fluid_temperature_max, color='r', linestyle='--', linewidth=2,
-                    label=f'Max: {self.result.fluid_temperature_max:.1f}°C')
-        ax1.set_xlabel('Monat', fontsize=11, fontweight='bold')
-        ax1.set_ylabel('Temperatur [°C]', fontsize=11, fontweight='bold')
-        ax1.set_title('Monatliche Temperaturen', fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(months)
-        ax1.grid(True, alpha=0.3)
-        ax1.legend(fontsize=9)
+        temps = self.result.monthly_temperature_array
+        t_min = self.result.fluid_temperature_min
+        t_max = self.result.fluid_temperature_max
+        artists["temps"].set_ydata(temps)
+        
+        # y-Bereich direkt aus den Daten (statt relim über alle Artists), 5 % Rand wie autoscale
+        lo = min(temps.min(), t_min)
+        hi = max(temps.max(), t_max)
+        pad = 0.05 * (hi - lo) or 1.0
+        
+        # Hat sich nur die Monatslinie geändert, genügt Blitting auf dem gesicherten Hintergrund
+        field_inputs = (num_boreholes,) + tuple(
+            display.get(k, "") for k in ("borehole_spacing", "boundary_distance", "house_distance"))
+        static_key = (t_min, t_max, lo, hi, field_inputs,
+                      self.current_params["borehole_diameter"],
+                      self.current_params["pipe_outer_diameter"])
+        if static_key == self._plot_static_key and self._temps_background is not None:
+            self.canvas.restore_region(self._temps_background)
+            ax1.draw_artist(artists["temps"])
+            self.canvas.blit(ax1.bbox)
+            return
+        self._plot_static_key = static_key
+        
+        artists["temp_min"].set_ydata([t_min, t_min])
+        artists["temp_min"].set_label(f'Min: {t_min:.1f}°C')
+        artists["temp_max"].set_ydata([t_max, t_max])
+        artists["temp_max"].set_label(f'Max: {t_max:.1f}°C')
+        ax1.set_ylim(lo - pad, hi + pad)
+        ax1.legend(handles=[artists["temp_min"], artists["temp_max"]], fontsize=9)
         
         # === 2. BOHRFELD-LAYOUT (Draufsicht) ===
+        ax2.cla()
         try:
+            from matplotlib.collections import EllipseCollection
             from matplotlib.patches import Rectangle
             
-            # Sichere Werte mit Fallback
-            num_boreholes = int(self.borehole_entries.get("num_boreholes", ttk.Entry()).get() or "1")
-            spacing = float(self.borehole_entries.get("borehole_spacing", ttk.Entry()).get() or "6.0")
-            boundary_dist = float(self.borehole_entries.get("boundary_distance", ttk.Entry()).get() or "3.0")
-            house_dist = float(self.borehole_entries.get("house_distance", ttk.Entry()).get() or "3.0")
+            # Sichere Werte mit Fallback (ohne dafür Platzhalter-Widgets anzulegen)
+            def field_value(key, default):
+                return display.get(key) or default
+            
+            spacing = float(field_value("borehole_spacing", "6.0"))
+            boundary_dist = float(field_value("boundary_distance", "3.0"))
+            house_dist = float(field_value("house_distance", "3.0"))
             
             # Grundstück zeichnen (Rechteck)
             total_width = max(20, spacing * max(1, num_boreholes - 1) + 2 * boundary_dist + 10)
@@ -1352,35 +1794,33 @@ class GeothermieGUIProfessional:
                                   label='Gebäude')
             ax2.add_patch(house_rect)
             
-            # Bohrungen anordnen (unten im Grundstück)
+            # Bohrungen anordnen (unten im Grundstück), symmetrisch um x = 0
             bh_y = -total_height/2 + boundary_dist + 3
-            if num_boreholes == 1:
-                bh_positions = [(0, bh_y)]
-            else:
-                start_x = -(num_boreholes - 1) * spacing / 2
-                bh_positions = [(start_x + i * spacing, bh_y) for i in range(num_boreholes)]
-            
-            # Bohrungen zeichnen
-            for i, (bh_x, bh_y_pos) in enumerate(bh_positions):
-                bh_circle = Circle((bh_x, bh_y_pos), 1.2, facecolor='#ff9800', 
-                                  edgecolor='#e65100', linewidth=2)
-                ax2.add_patch(bh_circle)
-                ax2.text(bh_x, bh_y_pos, str(i+1), ha='center', va='center', 
+            bh_x = (np.arange(num_boreholes) - (num_boreholes - 1) / 2) * spacing
+            
+            # Bohrungen zeichnen (eine Collection, Durchmesser in Datenkoordinaten)
+            n_bh = len(bh_x)
+            ax2.add_collection(EllipseCollection(
+                np.full(n_bh, 2.4), np.full(n_bh, 2.4), np.zeros(n_bh), units='xy',
+                offsets=np.column_stack([bh_x, np.full(n_bh, bh_y)]), offset_transform=ax2.transData,
+                facecolors='#ff9800', edgecolors='#e65100', linewidths=2), autolim=False)
+            for i, x in enumerate(bh_x.tolist()):
+                ax2.text(x, bh_y, str(i+1), ha='center', va='center', 
                         fontsize=10, fontweight='bold', color='white')
             
             # Abstände als Pfeile mit Text
             if num_boreholes > 1:
                 # Abstand zwischen Bohrungen
-                ax2.annotate('', xy=(bh_positions[1][0], bh_y-2), xytext=(bh_positions[0][0], bh_y-2),
+                ax2.annotate('', xy=(bh_x[1], bh_y-2), xytext=(bh_x[0], bh_y-2),
                            arrowprops=dict(arrowstyle='<->', color='#2196f3', lw=2))
-                ax2.text((bh_positions[0][0] + bh_positions[1][0])/2, bh_y-3, 
+                ax2.text((bh_x[0] + bh_x[1])/2, bh_y-3, 
                         f'{spacing}m', ha='center', fontsize=9, color='#1976d2', fontweight='bold',
                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#2196f3'))
             
             # Abstand zum Grundstücksrand
-            ax2.annotate('', xy=(bh_positions[0][0], -total_height/2), xytext=(bh_positions[0][0], bh_y-1.5),
+            ax2.annotate('', xy=(bh_x[0], -total_height/2), xytext=(bh_x[0], bh_y-1.5),
                        arrowprops=dict(arrowstyle='<->', color='#4caf50', lw=1.5))
-            ax2.text(bh_positions[0][0]+2, (-total_height/2 + bh_y-1.5)/2, 
+            ax2.text(bh_x[0]+2, (-total_height/2 + bh_y-1.5)/2, 
                     f'{boundary_dist}m', ha='left', fontsize=8, color='#2e7d32',
                     bbox=dict(boxstyle='round,pad=0.2', facecolor='white', edgecolor='#4caf50'))
             
@@ -1405,42 +1845,39 @@ class GeothermieGUIProfessional:
             ax2.axis('off')
         
         # === 3. BOHRLOCH-QUERSCHNITT ===
-        bh_d_mm = float(self.entries["borehole_diameter"].get())
-        pipe_d = float(self.entries["pipe_outer_diameter"].get()) / 1000.0  # mm → m
-        bh_d = bh_d_mm / 1000.0  # mm → m für Skalierung
+        # Durchmesser liegen in current_params bereits in m vor
+        bh_d = self.current_params["borehole_diameter"]
+        pipe_d = self.current_params["pipe_outer_diameter"]
         
         scale = 100
         bh_r = (bh_d / 2) * scale
-        pipe_r = (pipe_d / 2) * scale
-        
-        borehole = Circle((0, 0), bh_r, facecolor='#d9d9d9', edgecolor='black', linewidth=2)
-        ax3.add_patch(borehole)
+        pipe_r_scaled = (pipe_d / 2) * scale * 1.5
         
-        positions = [(-bh_r*0.5, bh_r*0.5), (bh_r*0.5, bh_r*0.5),
-                    (-bh_r*0.5, -bh_r*0.5), (bh_r*0.5, -bh_r*0.5)]
-        colors = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
+        artists["borehole"].set_radius(bh_r)
         
-        for i, ((x, y), color) in enumerate(zip(positions, colors)):
-            pipe = Circle((x, y), pipe_r*1.5, facecolor=color, edgecolor='black', linewidth=1, alpha=0.8)
-            ax3.add_patch(pipe)
-            ax3.text(x, y, str(i+1), ha='center', va='center', fontsize=9, fontweight='bold', color='white')
+        offsets = self._PIPE_UNIT_POSITIONS * bh_r
+        pipes = artists["pipes"]
+        pipes.set_offsets(offsets)
+        diameters = np.full(len(offsets), 2 * pipe_r_scaled)
+        pipes.set_widths(diameters)
+        pipes.set_heights(diameters)
+        for (x, y), label in zip(offsets.tolist(), artists["pipe_labels"]):
+            label.set_position((x, y))
         
         # Durchmesser-Annotation
-        ax3.plot([-bh_r, bh_r], [0, 0], 'k--', linewidth=1, alpha=0.5)
-        ax3.text(0, -bh_r*1.7, f'Ø {bh_d_mm:.0f}mm', ha='center', fontsize=11, fontweight='bold',
-                bbox=dict(boxstyle='round,pad=0.4', facecolor='#ffeb3b', edgecolor='black'))
+        artists["diameter_line"].set_xdata([-bh_r, bh_r])
+        artists["diameter_label"].set_position((0, -bh_r*1.7))
+        artists["diameter_label"].set_text(f'Ø {bh_d * 1000:.0f}mm')
         
         ax3.set_xlim(-bh_r*1.8, bh_r*1.8)
         ax3.set_ylim(-bh_r*1.9, bh_r*1.5)
-        ax3.set_aspect('equal')
-        ax3.set_title('Bohrloch-Querschnitt', fontsize=12, fontweight='bold')
-        ax3.axis('off')
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _export_pdf(self):
         """Exportiert PDF mit allen Daten."""
+        if self._pdf_future is not None and not self._pdf_future.done():
+            return
         if not self.result:
             messagebox.showwarning("Keine Daten", "Bitte zuerst Berechnung durchführen.")
             return
@@ -1454,33 +1891,52 @@ class GeothermieGUIProfessional:
             filetypes=[("PDF", "*.pdf")]
         )
         
-        if filename:
-            try:
-                self.status_var.set("📄 Erstelle PDF-Bericht...")
-                self.root.update()
-                
-                # Projektinfo
-                project_info = {key: entry.get() for key, entry in self.project_entries.items()}
-                
-                # Bohrfeld
-                borehole_config = {key: float(entry.get()) for key, entry in self.borehole_entries.items()}
-                
-                # PDF erstellen (mit optionalen Verfüllmaterial-, Hydraulik-, Bohrfeld- und VDI4640-Daten)
-                self.pdf_generator.generate_report(
-                    filename, self.result, self.current_params,
-                    project_info, borehole_config,
-                    grout_calculation=getattr(self, 'grout_calculation', None),
-                    hydraulics_result=getattr(self, 'hydraulics_result', None),
-                    borefield_result=getattr(self, 'borefield_result', None),
-                    vdi4640_result=getattr(self, 'vdi4640_result', None)
-                )
-                
-                self.status_var.set(f"✓ PDF erstellt: {os.path.basename(filename)}")
-                messagebox.showinfo("Erfolg", f"PDF-Bericht wurde erstellt!")
-                
-            except Exception as e:
-                messagebox.showerror("Fehler", f"PDF-Fehler: {str(e)}")
-                self.status_var.set("❌ PDF-Export fehlgeschlagen")
+        if not filename:
+            return
+        
+        try:
+            self._set_status("📄 Erstelle PDF-Bericht...", immediate=True)
+            self._flush_status()
+            
+            # Projektinfo
+            project_info = {key: entry.get() for key, entry in self.project_entries.items()}
+            
+            # Bohrfeld
+            borehole_config = self._parse_numeric(self.borehole_entries)
+            
+            if self.pdf_generator is None:
+                from utils import PDFReportGenerator
+                self.pdf_generator = PDFReportGenerator()
+        except Exception as e:
+            messagebox.showerror("Fehler", f"PDF-Fehler: {str(e)}")
+            self._set_status("❌ PDF-Export fehlgeschlagen")
+            return
+        
+        # PDF erstellen (mit optionalen Verfüllmaterial-, Hydraulik-, Bohrfeld- und VDI4640-Daten)
+        # im Hintergrund, damit die Oberfläche bedienbar bleibt; Button bis zum Ende sperren
+        self.pdf_button.state(['disabled'])
+        future = self._executor.submit(
+            self.pdf_generator.generate_report,
+            filename, self.result, dict(self.current_params),
+            project_info, borehole_config,
+            grout_calculation=getattr(self, 'grout_calculation', None),
+            hydraulics_result=getattr(self, 'hydraulics_result', None),
+            borefield_result=getattr(self, 'borefield_result', None),
+            vdi4640_result=getattr(self, 'vdi4640_result', None)
+        )
+        self._pdf_future = future
+        self._poll_future(future, lambda f: self._on_pdf_done(f, filename))
+    
+    def _on_pdf_done(self, future, filename):
+        """Meldet das Ergebnis des PDF-Exports im Tk-Hauptthread."""
+        self.pdf_button.state(['!disabled'])
+        try:
+            future.result()
+            self._set_status(f"✓ PDF erstellt: {os.path.basename(filename)}")
+            messagebox.showinfo("Erfolg", f"PDF-Bericht wurde erstellt!")
+        except Exception as e:
+            messagebox.showerror("Fehler", f"PDF-Fehler: {str(e)}")
+            self._set_status("❌ PDF-Export fehlgeschlagen")
     
     def _export_results(self):
         """Exportiert Text."""
@@ -1493,10 +1949,14 @@ class GeothermieGUIProfessional:
         if filename:
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(self.results_text.get("1.0", tk.END))
-            self.status_var.set(f"✓ Text exportiert")
+            self._set_status(f"✓ Text exportiert")
     
     def _create_borefield_tab(self):
         """Erstellt den Bohrfeld-Simulation Tab mit g-Funktionen."""
+        self.borefield_fig = None
+        self._borefield_plot_frame = None
+        self._borefield_artists = None
+        
         # Import hier, um OptionalDependency zu behandeln
         try:
             from calculations.borefield_gfunction import BorefieldCalculator, check_pygfunction_installation
@@ -1536,6 +1996,7 @@ class GeothermieGUIProfessional:
         
         # Eingabefelder
         self.borefield_entries = {}
+        self.borefield_vars = {}
         
         # Layout-Auswahl
         ttk.Label(left_frame, text="Layout:", font=("Arial", 10, "bold")).pack(anchor="w", pady=(10, 2))
@@ -1551,57 +2012,36 @@ class GeothermieGUIProfessional:
         
         # Anzahl Bohrungen
         ttk.Label(left_frame, text="Anzahl Bohrungen X:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['num_x'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['num_x'].insert(0, "3")
-        self.borefield_entries['num_x'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'num_x', "3")
         
         ttk.Label(left_frame, text="Anzahl Bohrungen Y:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['num_y'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['num_y'].insert(0, "2")
-        self.borefield_entries['num_y'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'num_y', "2")
         
         # Abstände
         ttk.Label(left_frame, text="Abstand X [m]:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['spacing_x'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['spacing_x'].insert(0, "6.5")
-        self.borefield_entries['spacing_x'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'spacing_x', "6.5")
         
         ttk.Label(left_frame, text="Abstand Y [m]:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['spacing_y'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['spacing_y'].insert(0, "6.5")
-        self.borefield_entries['spacing_y'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'spacing_y', "6.5")
         
         # Bohrungsparameter
         ttk.Label(left_frame, text="Bohrtiefe [m]:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['depth'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['depth'].insert(0, "120.0")
-        self.borefield_entries['depth'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'depth', "120.0")
         
         ttk.Label(left_frame, text="Bohrdurchmesser [mm]:", font=("Arial", 10)).pack(anchor="w", pady=(5, 2))
-        self.borefield_entries['diameter'] = ttk.Entry(left_frame, width=15)
         # Übernehme Wert aus Hauptmaske wenn vorhanden
         initial_diameter = self.entries.get('borehole_diameter')
-        if initial_diameter:
-            try:
-                self.borefield_entries['diameter'].insert(0, initial_diameter.get())
-            except:
-                self.borefield_entries['diameter'].insert(0, "152.0")
-        else:
-            self.borefield_entries['diameter'].insert(0, "152.0")
-        self.borefield_entries['diameter'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'diameter',
+                                  initial_diameter.get() if initial_diameter else "152.0")
         
         # Bodeneigenschaften
         ttk.Label(left_frame, text="Thermische Diffusivität [m²/s]:", 
                  font=("Arial", 10)).pack(anchor="w", pady=(10, 2))
-        self.borefield_entries['diffusivity'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['diffusivity'].insert(0, "1.0e-6")
-        self.borefield_entries['diffusivity'].pack(anchor="w", pady=(0, 5))
+        self._add_borefield_entry(left_frame, 'diffusivity', "1.0e-6")
         
         # Simulationsdauer
         ttk.Label(left_frame, text="Simulationsjahre:", font=("Arial", 10)).pack(anchor="w", pady=(10, 2))
-        self.borefield_entries['years'] = ttk.Entry(left_frame, width=15)
-        self.borefield_entries['years'].insert(0, "25")
-        self.borefield_entries['years'].pack(anchor="w", pady=(0, 10))
+        self._add_borefield_entry(left_frame, 'years', "25", pady=(0, 10))
         
         # Berechnen-Button
         ttk.Button(left_frame, text="🔄 g-Funktion berechnen", 
@@ -1619,12 +2059,26 @@ class GeothermieGUIProfessional:
         ttk.Label(right_frame, text="📊 BOHRFELD-VISUALISIERUNG", 
                  font=("Arial", 14, "bold"), foreground="#1f4788").pack(pady=(0, 15))
         
-        # Matplotlib Figure für Bohrfeld
+        # Matplotlib Figure für Bohrfeld wird erst beim ersten Öffnen des Tabs erzeugt
+        self._borefield_plot_frame = right_frame
+    
+    def _add_borefield_entry(self, parent, key, default, pady=(0, 5)):
+        """Legt ein Bohrfeld-Eingabefeld samt StringVar an."""
+        var = tk.StringVar(value=default)
+        entry = ttk.Entry(parent, width=15, textvariable=var)
+        entry.pack(anchor="w", pady=pady)
+        self.borefield_entries[key] = entry
+        self.borefield_vars[key] = var
+    
+    def _ensure_borefield_figure(self):
+        """Erstellt die Bohrfeld-Figure, falls noch nicht geschehen (und pygfunction verfügbar ist)."""
+        if self.borefield_fig is not None or self._borefield_plot_frame is None:
+            return
         from matplotlib.figure import Figure
         from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         
         self.borefield_fig = Figure(figsize=(10, 8), dpi=100)
-        self.borefield_canvas = FigureCanvasTkAgg(self.borefield_fig, right_frame)
+        self.borefield_canvas = FigureCanvasTkAgg(self.borefield_fig, self._borefield_plot_frame)
         self.borefield_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Platzhalter-Text
@@ -1652,8 +2106,8 @@ class GeothermieGUIProfessional:
             years = int(self.borefield_entries['years'].get())
             
             # Status
-            self.status_var.set("⏳ Berechne g-Funktion...")
-            self.root.update()
+            self._set_status("⏳ Berechne g-Funktion...", immediate=True)
+            self._flush_status()
             
             # Berechnung
             calc = BorefieldCalculator()
@@ -1688,8 +2142,7 @@ class GeothermieGUIProfessional:
             
             # Aktualisiere Ergebnis-Text
             self.borefield_result_text.config(state="normal")
-            self.borefield_result_text.delete("1.0", tk.END)
-            self.borefield_result_text.insert("1.0", f"""✅ BERECHNUNG ERFOLGREICH
+            self.borefield_result_text.replace("1.0", tk.END, f"""✅ BERECHNUNG ERFOLGREICH
 
 Layout: {layout.upper()}
 Bohrungen: {result['num_boreholes']}
@@ -1711,58 +2164,88 @@ und wird rechts visualisiert.""")
             # Visualisierung
             self._plot_borefield_visualization(result)
             
-            self.status_var.set(f"✅ g-Funktion berechnet: {result['num_boreholes']} Bohrungen")
+            self._set_status(f"✅ g-Funktion berechnet: {result['num_boreholes']} Bohrungen")
             
         except Exception as e:
             messagebox.showerror("Fehler", f"Fehler bei g-Funktionen-Berechnung:\n{str(e)}")
-            self.status_var.set("❌ Berechnung fehlgeschlagen")
+            self._set_status("❌ Berechnung fehlgeschlagen")
     
-    def _plot_borefield_visualization(self, result):
-        """Plottet Bohrfeld-Layout und g-Funktion."""
-        self.borefield_fig.clear()
-        
-        import numpy as np
+    def _init_borefield_artists(self):
+        """Ersetzt den Platzhalter durch die beiden Achsen und legt deren Artists einmalig an."""
+        fig = self.borefield_fig
+        fig.clear()
         
         # 2 Subplots: Bohrfeld-Layout und g-Funktion
-        ax1 = self.borefield_fig.add_subplot(121)
-        ax2 = self.borefield_fig.add_subplot(122)
+        ax1 = fig.add_subplot(121)
+        ax2 = fig.add_subplot(122)
         
         # Plot 1: Bohrfeld-Layout
-        boreField = result['boreField']
-        x_coords = [b.x for b in boreField]
-        y_coords = [b.y for b in boreField]
+        points = ax1.scatter([], [], s=200, c='#1f4788', alpha=0.6, edgecolors='black', linewidths=2)
+        ax1.set_xlabel('X-Position [m]', fontsize=11)
+        ax1.set_ylabel('Y-Position [m]', fontsize=11)
+        ax1.grid(True, alpha=0.3)
+        ax1.set_aspect('equal')
+        
+        # Plot 2: g-Funktion
+        line, = ax2.plot([], [], 'b-', linewidth=2, label='g-Funktion')
+        ax2.set_xlabel('Zeit [Jahre]', fontsize=11)
+        ax2.set_ylabel('g-Funktion [-]', fontsize=11)
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        
+        self._borefield_artists = {
+            "ax_layout": ax1,
+            "ax_gfunc": ax2,
+            "points": points,
+            "labels": [],
+            "gfunc": line,
+            "info": fig.text(0.5, 0.02, "", ha='center', fontsize=9, style='italic'),
+        }
+    
+    def _plot_borefield_visualization(self, result):
+        """Plottet Bohrfeld-Layout und g-Funktion (Achsen bleiben erhalten, nur Daten werden ersetzt)."""
+        self._ensure_borefield_figure()
+        if self._borefield_artists is None:
+            self._init_borefield_artists()
+        artists = self._borefield_artists
+        ax1, ax2 = artists["ax_layout"], artists["ax_gfunc"]
         
-        ax1.scatter(x_coords, y_coords, s=200, c='#1f4788', alpha=0.6, edgecolors='black', linewidths=2)
+        # Plot 1: Bohrfeld-Layout
+        x_coords, y_coords = result['x_coords'], result['y_coords']
+        offsets = np.column_stack([x_coords, y_coords])
+        artists["points"].set_offsets(offsets)
         
         # Nummerierung
-        for i, (x, y) in enumerate(zip(x_coords, y_coords), 1):
+        for label in artists["labels"]:
+            label.remove()
+        artists["labels"] = [
             ax1.text(x, y, str(i), ha='center', va='center', color='white', fontweight='bold', fontsize=10)
+            for i, (x, y) in enumerate(zip(x_coords.tolist(), y_coords.tolist()), 1)
+        ]
         
-        ax1.set_xlabel('X-Position [m]', fontsize=11)
-        ax1.set_ylabel('Y-Position [m]', fontsize=11)
         ax1.set_title(f'Bohrfeld-Layout: {result["layout"].upper()}\n{result["num_boreholes"]} Bohrungen', 
                      fontsize=12, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_aspect('equal')
+        ax1.ignore_existing_data_limits = True
+        ax1.update_datalim(offsets)
+        ax1.autoscale_view()
         
         # Plot 2: g-Funktion
         gFunc = result['gFunction']
         time_years = result['time'] / (365.25 * 24 * 3600)  # Sekunden → Jahre
         
-        ax2.plot(time_years, gFunc.gFunc, 'b-', linewidth=2, label='g-Funktion')
-        ax2.set_xlabel('Zeit [Jahre]', fontsize=11)
-        ax2.set_ylabel('g-Funktion [-]', fontsize=11)
+        artists["gfunc"].set_data(time_years, gFunc.gFunc)
         ax2.set_title(f'Thermische Response\n{result["simulation_years"]} Jahre Simulation', 
                      fontsize=12, fontweight='bold')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
+        ax2.relim()
+        ax2.autoscale_view()
         
         # Info-Text
-        info_text = f"Gesamttiefe: {result['total_depth']} m | Feldgröße: {result['field_area']:.1f} m²"
-        self.borefield_fig.text(0.5, 0.02, info_text, ha='center', fontsize=9, style='italic')
+        artists["info"].set_text(
+            f"Gesamttiefe: {result['total_depth']} m | Feldgröße: {result['field_area']:.1f} m²"
+        )
         
         self.borefield_fig.tight_layout()
-        self.borefield_canvas.draw()
+        self.borefield_canvas.draw_idle()
     
     def _show_about(self):
         """Zeigt Über-Dialog."""
@@ -1799,31 +2282,44 @@ In diesem Tool verfügbar über:
 - Fallback: Vorgespeicherte Daten für DE, AT, CH"""
         messagebox.showinfo("PVGIS Information", info)
     
-    def _load_default_pipes(self):
-        """Lädt Standard-Rohre."""
+    def _start_default_pipe_load(self):
+        """Startet das Einlesen der Standard-Rohre im Hintergrund."""
         pipe_file = os.path.join(os.path.dirname(__file__), "..", "Material", "pipe.txt")
-        if os.path.exists(pipe_file):
-            try:
-                self.pipes = self.pipe_parser.parse_file(pipe_file)
-                self.pipe_type_combo['values'] = [p.name for p in self.pipes]
-                # Setze PE 100 RC als Standard
-                for i, pipe in enumerate(self.pipes):
-                    if "PE 100 RC DN32" in pipe.name and "Dual" in pipe.name:
-                        self.pipe_type_combo.current(i)
-                        self._on_pipe_selected(None)
-                        break
-                self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen geladen (inkl. PE 100 RC)")
-            except Exception as e:
-                print(f"Fehler beim Laden: {e}")
+        if not os.path.exists(pipe_file):
+            return None
+        return self._io_executor.submit(self.pipe_parser.parse_file_cached, pipe_file)
+    
+    def _load_default_pipes(self, future):
+        """Übernimmt die im Hintergrund geladenen Standard-Rohre."""
+        # Zwischenzeitlich vom Benutzer geladene Rohre nicht überschreiben
+        if self.pipes:
+            return
+        try:
+            self._set_pipes(future.result())
+            # Setze PE 100 RC als Standard
+            for i, pipe in enumerate(self.pipes):
+                if "PE 100 RC DN32" in pipe.name and "Dual" in pipe.name:
+                    self.pipe_type_combo.current(i)
+                    self._on_pipe_selected(None)
+                    break
+            self._set_status(f"✓ {len(self.pipes)} Rohrtypen geladen (inkl. PE 100 RC)")
+        except Exception as e:
+            print(f"Fehler beim Laden: {e}")
+    
+    def _set_pipes(self, pipes):
+        """Übernimmt eine Rohrliste samt Namensindex und Combobox-Werten."""
+        self.pipes = pipes
+        # Bei doppelten Namen gewinnt wie bisher der erste Eintrag
+        self.pipes_by_name = {p.name: p for p in reversed(pipes)}
+        self.pipe_type_combo['values'] = tuple(p.name for p in pipes)
     
     def _load_pipe_file(self):
         """Lädt Pipe-Datei."""
         filename = filedialog.askopenfilename(filetypes=[("Text", "*.txt")])
         if filename:
             try:
-                self.pipes = self.pipe_parser.parse_file(filename)
-                self.pipe_type_combo['values'] = [p.name for p in self.pipes]
-                self.status_var.set(f"✓ {len(self.pipes)} Rohrtypen geladen")
+                self._set_pipes(self.pipe_parser.parse_file(filename))
+                self._set_status(f"✓ {len(self.pipes)} Rohrtypen geladen")
                 messagebox.showinfo("Erfolg", f"{len(self.pipes)} Rohrtypen geladen.")
             except Exception as e:
                 messagebox.showerror("Fehler", str(e))
@@ -1835,7 +2331,7 @@ In diesem Tool verfügbar über:
             try:
                 config = self.eed_parser.parse_file(filename)
                 # ... Werte übernehmen (wie vorher) ...
-                self.status_var.set(f"✓ EED-Datei geladen")
+                self._set_status(f"✓ EED-Datei geladen")
                 messagebox.showinfo("Erfolg", "EED-Konfiguration geladen.")
             except Exception as e:
                 messagebox.showerror("Fehler", str(e))
@@ -1948,14 +2444,14 @@ In diesem Tool verfügbar über:
                 climate_data=self.climate_data,
                 borefield_data=self.borefield_config,
                 results={
-                    "standard": self.result.__dict__ if self.result and hasattr(self.result, '__dict__') else None,
-                    "vdi4640": self.vdi4640_result.__dict__ if hasattr(self, 'vdi4640_result') and self.vdi4640_result else None
+                    "standard": asdict(self.result) if self.result else None,
+                    "vdi4640": asdict(self.vdi4640_result) if hasattr(self, 'vdi4640_result') and self.vdi4640_result else None
                 }
             )
             
             if success:
                 messagebox.showinfo("Erfolg", f"✅ Projekt gespeichert:\n{os.path.basename(filepath)}")
-                self.status_var.set(f"💾 Gespeichert: {os.path.basename(filepath)}")
+                self._set_status(f"💾 Gespeichert: {os.path.basename(filepath)}")
             else:
                 messagebox.showerror("Fehler", "❌ Speichern fehlgeschlagen")
         
@@ -1991,7 +2487,7 @@ In diesem Tool verfügbar über:
             self._populate_from_get_data(data)
             
             messagebox.showinfo("Erfolg", f"✅ Projekt geladen:\n{os.path.basename(filepath)}")
-            self.status_var.set(f"📥 Geladen: {os.path.basename(filepath)}")
+            self._set_status(f"📥 Geladen: {os.path.basename(filepath)}")
         
         except Exception as e:
             messagebox.showerror("Fehler", f"❌ Import-Fehler:\n{str(e)}")
@@ -2086,51 +2582,42 @@ In diesem Tool verfügbar über:
                 layout = borefield_data.get('layout', 'rectangle')
                 self.borefield_layout_var.set(layout)
             
-            # Eingabefelder füllen
-            self.borefield_entries['num_x'].delete(0, tk.END)
-            self.borefield_entries['num_x'].insert(0, str(borefield_data.get('num_boreholes_x', 3)))
+            # Eingabefelder füllen (ein Tcl-Aufruf pro Feld)
+            bf_vars = self.borefield_vars
+            bf_vars['num_x'].set(str(borefield_data.get('num_boreholes_x', 3)))
             
-            self.borefield_entries['num_y'].delete(0, tk.END)
-            self.borefield_entries['num_y'].insert(0, str(borefield_data.get('num_boreholes_y', 2)))
+            bf_vars['num_y'].set(str(borefield_data.get('num_boreholes_y', 2)))
             
-            self.borefield_entries['spacing_x'].delete(0, tk.END)
-            self.borefield_entries['spacing_x'].insert(0, str(borefield_data.get('spacing_x_m', 6.5)))
+            bf_vars['spacing_x'].set(str(borefield_data.get('spacing_x_m', 6.5)))
             
-            self.borefield_entries['spacing_y'].delete(0, tk.END)
-            self.borefield_entries['spacing_y'].insert(0, str(borefield_data.get('spacing_y_m', 6.5)))
+            bf_vars['spacing_y'].set(str(borefield_data.get('spacing_y_m', 6.5)))
             
             # Durchmesser setzen (entweder aus Daten oder aus Hauptmaske)
             if 'borehole_diameter_mm' in borefield_data:
-                self.borefield_entries['diameter'].delete(0, tk.END)
-                self.borefield_entries['diameter'].insert(0, str(borefield_data.get('borehole_diameter_mm', 152.0)))
+                bf_vars['diameter'].set(str(borefield_data.get('borehole_diameter_mm', 152.0)))
             elif 'borehole_radius_m' in borefield_data:
                 # Alte Dateien mit Radius konvertieren
                 radius_m = borefield_data.get('borehole_radius_m', 0.076)
                 diameter_mm = radius_m * 2000.0
-                self.borefield_entries['diameter'].delete(0, tk.END)
-                self.borefield_entries['diameter'].insert(0, str(diameter_mm))
+                bf_vars['diameter'].set(str(diameter_mm))
             else:
                 # Nutze Wert aus Hauptmaske
                 if 'borehole_diameter' in self.entries:
                     try:
-                        self.borefield_entries['diameter'].delete(0, tk.END)
-                        self.borefield_entries['diameter'].insert(0, self.entries['borehole_diameter'].get())
+                        bf_vars['diameter'].set(self.entries['borehole_diameter'].get())
                     except:
                         pass
             
             # Diffusivität berechnen aus Bodendaten wenn vorhanden
             diffusivity = borefield_data.get('soil_thermal_diffusivity', 1.0e-6)
-            self.borefield_entries['diffusivity'].delete(0, tk.END)
-            self.borefield_entries['diffusivity'].insert(0, str(diffusivity))
+            bf_vars['diffusivity'].set(str(diffusivity))
             
-            self.borefield_entries['years'].delete(0, tk.END)
-            self.borefield_entries['years'].insert(0, str(borefield_data.get('simulation_years', 25)))
+            bf_vars['years'].set(str(borefield_data.get('simulation_years', 25)))
             
             # Info in Ergebnis-Textfeld
             if hasattr(self, 'borefield_result_text'):
                 self.borefield_result_text.config(state="normal")
-                self.borefield_result_text.delete("1.0", tk.END)
-                self.borefield_result_text.insert("1.0", 
+                self.borefield_result_text.replace("1.0", tk.END,
                     f"📥 Bohrfeld-Konfiguration geladen!\n\n"
                     f"Layout: {borefield_data.get('layout', 'N/A').upper()}\n"
                     f"Bohrungen: {borefield_data.get('num_boreholes_x', 0)}×{borefield_data.get('num_boreholes_y', 0)}\n"
@@ -2145,19 +2632,10 @@ In diesem Tool verfügbar über:
             print(f"⚠️ Fehler beim Füllen des Bohrfeld-Tabs: {e}")
     
     def _set_entry(self, key: str, value: Any):
-        """Hilfsmethode zum Setzen von Entry-Werten."""
-        if key in self.entries:
-            self.entries[key].delete(0, tk.END)
-            self.entries[key].insert(0, str(value))
-        elif key in self.project_entries:
-            self.project_entries[key].delete(0, tk.END)
-            self.project_entries[key].insert(0, str(value))
-        elif key in self.borehole_entries:
-            self.borehole_entries[key].delete(0, tk.END)
-            self.borehole_entries[key].insert(0, str(value))
-        elif key in self.heat_pump_entries:
-            self.heat_pump_entries[key].delete(0, tk.END)
-            self.heat_pump_entries[key].insert(0, str(value))
+        """Hilfsmethode zum Setzen von Entry-Werten (ein Tcl-Aufruf pro Feld)."""
+        var = self.entry_vars.get(key)
+        if var is not None:
+            var.set(str(value))
 
 
 def main():
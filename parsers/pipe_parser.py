@@ -1,9 +1,14 @@
 """Parser für pipe.txt Dateien mit Rohrdaten."""
 
+import os
 import re
+import pickle
+import hashlib
 from dataclasses import dataclass
 from typing import List
 
+from utils.paths import CACHE_DIR
+
 
 @dataclass
 class PipeData:
@@ -91,6 +96,42 @@ class PipeParser:
         
         return pipes
     
+    @staticmethod
+    def parse_file_cached(filepath: str) -> List[PipeData]:
+        """
+        Wie parse_file, nutzt aber einen Pickle-Cache in CACHE_DIR.
+        
+        Der Cache ist an Änderungszeit und Größe der Quelldatei gebunden und
+        wird bei jeder Änderung neu erzeugt.
+        """
+        filepath = os.path.abspath(filepath)
+        stat = os.stat(filepath)
+        stamp = (stat.st_mtime, stat.st_size)
+        path_hash = hashlib.md5(filepath.encode('utf-8')).hexdigest()[:12]
+        cache_file = os.path.join(
+            CACHE_DIR, f"{os.path.basename(filepath)}.{path_hash}.pkl"
+        )
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get("stamp") == stamp:
+                return cached["pipes"]
+        except Exception:
+            pass  # Kein oder veralteter Cache: neu parsen
+        
+        pipes = PipeParser.parse_file(filepath)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({"stamp": stamp, "pipes": pipes}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Rohr-Cache konnte nicht gespeichert werden: {e}")
+        return pipes
+    
     @staticmethod
     def get_pipe_by_name(pipes: List[PipeData], name: str) -> PipeData:
         """Sucht ein Rohr nach Namen."""
@@ -1,7 +1,11 @@
 """Hilfsfunktionen und Utilities."""
 
-from .pdf_export import PDFReportGenerator
-
 __all__ = ['PDFReportGenerator']
 
 
+def __getattr__(name):
+    """Lädt den PDF-Export (ReportLab) erst beim ersten Zugriff."""
+    if name == 'PDFReportGenerator':
+        from .pdf_export import PDFReportGenerator
+        return PDFReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
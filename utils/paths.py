@@ -0,0 +1,7 @@
+"""Gemeinsame Dateipfade der Anwendung."""
+
+import os
+
+
+# Ablage für alle Caches (PVGIS-Antworten, vorgeparste Rohrdateien, Sitzung, Grafiken)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".geothermie_cache")
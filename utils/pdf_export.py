@@ -8,14 +8,127 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from datetime import datetime
+import functools
+import io
 import os
 import tempfile
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle, Circle, FancyBboxPatch
 import matplotlib.patches as mpatches
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=8)
+def _render_static_borehole_png(bh_diameter: float) -> bytes:
+    """Rendert die statische Erklärungsgrafik einer Erdsonde als PNG (Bytes).
+    
+    Die Grafik hängt nur vom Bohrloch-Durchmesser ab und wird daher pro
+    Durchmesser nur einmal gezeichnet.
+    """
+    from matplotlib.patches import Arc
+    
+    fig = Figure(figsize=(5.5, 8), facecolor='white')
+    ax = fig.add_subplot(111)
+    
+    # === SEITLICHE ANSICHT (Schnitt durch Sonde) ===
+    # Boden (braun)
+    ground = Rectangle((0, 0), 10, 15, facecolor='#8B4513', alpha=0.3)
+    ax.add_patch(ground)
+    
+    # Bohrloch (hellgrau) - EIN Bohrloch mit 4 Leitungen ENGER zusammen
+    borehole_width = 1.0
+    borehole_center = 5.0
+    borehole = Rectangle((borehole_center - borehole_width/2, 0), borehole_width, 15, 
+                        facecolor='#d9d9d9', edgecolor='black', linewidth=2)
+    ax.add_patch(borehole)
+    
+    # 4 Leitungen ENGER zusammen
+    spacing = 0.2
+    center_offset = spacing * 1.5
+    
+    # Rohr 1 & 2 (links im Bohrloch)
+    ax.plot([borehole_center - center_offset, borehole_center - center_offset], [0, 15], 
+           color='#ff6b6b', linewidth=5, solid_capstyle='round')
+    ax.plot([borehole_center - center_offset + spacing, borehole_center - center_offset + spacing], [0, 15], 
+           color='#4ecdc4', linewidth=5, solid_capstyle='round')
+    
+    # Rohr 3 & 4 (rechts im Bohrloch)
+    ax.plot([borehole_center + center_offset - spacing, borehole_center + center_offset - spacing], [0, 15], 
+           color='#ff6b6b', linewidth=5, solid_capstyle='round')
+    ax.plot([borehole_center + center_offset, borehole_center + center_offset], [0, 15], 
+           color='#4ecdc4', linewidth=5, solid_capstyle='round')
+    
+    # U-Bogen unten
+    arc1 = Arc((borehole_center - center_offset + spacing/2, 0.3), spacing*1.5, 0.4, 
+              angle=0, theta1=180, theta2=360, color='black', linewidth=2)
+    arc2 = Arc((borehole_center + center_offset - spacing/2, 0.3), spacing*1.5, 0.4, 
+              angle=0, theta1=180, theta2=360, color='black', linewidth=2)
+    ax.add_patch(arc1)
+    ax.add_patch(arc2)
+    
+    # === BESCHRIFTUNGEN ===
+    bh_left = borehole_center - borehole_width/2
+    bh_right = borehole_center + borehole_width/2
+    
+    # Durchmesser
+    ax.annotate('', xy=(bh_left, 16), xytext=(bh_right, 16),
+               arrowprops=dict(arrowstyle='<->', color='black', lw=2))
+    ax.text(borehole_center, 16.6, f'Bohrloch Ø {bh_diameter*1000:.0f}mm', ha='center', fontsize=12, 
+           fontweight='bold', bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', edgecolor='black'))
+    
+    # Tiefe
+    ax.annotate('', xy=(0.5, 0), xytext=(0.5, 15),
+               arrowprops=dict(arrowstyle='<->', color='#2196f3', lw=2))
+    ax.text(-0.3, 7.5, 'Tiefe\nbis 100m', ha='center', fontsize=11, 
+           fontweight='bold', color='#1976d2', rotation=90,
+           bbox=dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor='#2196f3'))
+    
+    # Verfüllung
+    ax.text(borehole_center, 10, 'Verfüllung\n(Zement-Bentonit)', ha='center', fontsize=10,
+           bbox=dict(boxstyle='round,pad=0.4', facecolor='#e0e0e0', edgecolor='black'))
+    
+    # Rohrmaterial
+    ax.text(7.5, 12, 'PE 100 RC\nØ 32mm', ha='left', fontsize=10,
+           bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
+    ax.annotate('', xy=(bh_right + 0.1, 12), xytext=(7.3, 12),
+               arrowprops=dict(arrowstyle='->', color='black', lw=1.5))
+    
+    # === QUERSCHNITT (größer, ohne Text - nur Nummern) ===
+    from matplotlib.transforms import Bbox
+    ax_inset = fig.add_axes([0.58, 0.52, 0.38, 0.42])
+    
+    # Bohrloch-Kreis
+    bh_circle = Circle((0, 0), 1, facecolor='#d9d9d9', edgecolor='black', linewidth=2.5)
+    ax_inset.add_patch(bh_circle)
+    
+    # 4 Rohre in QUADRAT-Anordnung
+    positions = [(-0.35, 0.35), (0.35, 0.35), (-0.35, -0.35), (0.35, -0.35)]
+    colors_pipes = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
+    
+    for i, ((x, y), color) in enumerate(zip(positions, colors_pipes)):
+        pipe_circle = Circle((x, y), 0.2, facecolor=color, edgecolor='black', linewidth=1.5)
+        ax_inset.add_patch(pipe_circle)
+        ax_inset.text(x, y, str(i+1), ha='center', va='center', 
+                     fontsize=12, fontweight='bold', color='white')
+    
+    ax_inset.set_xlim(-1.1, 1.1)
+    ax_inset.set_ylim(-1.1, 1.1)
+    ax_inset.set_aspect('equal')
+    ax_inset.axis('off')
+    
+    # Hauptgrafik-Einstellungen
+    ax.set_xlim(0, 9)
+    ax.set_ylim(-1, 18)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+    return buf.getvalue()
+
+
 class PDFReportGenerator:
     """Generiert professionelle PDF-Berichte für Erdwärmesonden-Berechnungen."""
     
@@ -423,13 +536,14 @@ class PDFReportGenerator:
     def _create_temperature_plot(self, result):
         """Erstellt das Temperatur-Diagramm."""
         try:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig = Figure(figsize=(12, 6))
+            ax = fig.add_subplot(111)
             
             months = ['Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 
                      'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez']
             x = range(len(months))
             
-            ax.plot(x, result.monthly_temperatures, 'o-', linewidth=2.5, 
+            ax.plot(x, result.monthly_temperature_array, 'o-', linewidth=2.5, 
                    markersize=8, color='#1f4788', label='Monatliche Temperatur')
             ax.axhline(y=result.fluid_temperature_min, color='blue', linestyle='--', 
                       linewidth=2, label=f'Min: {result.fluid_temperature_min:.1f}°C')
@@ -444,11 +558,10 @@ class PDFReportGenerator:
             ax.grid(True, alpha=0.3, linestyle='--')
             ax.legend(fontsize=12, loc='best')
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            fig.savefig(temp_file.name, dpi=150, bbox_inches='tight')
             
             return temp_file.name
         except Exception as e:
@@ -458,7 +571,8 @@ class PDFReportGenerator:
     def _create_detailed_borehole_plot(self, params, result):
         """Erstellt eine detaillierte Bohrloch-Grafik mit Beschriftungen."""
         try:
-            fig, ax = plt.subplots(figsize=(14, 10))
+            fig = Figure(figsize=(14, 10))
+            ax = fig.add_subplot(111)
             
             # Bohrloch-Parameter
             depth = result.required_depth
@@ -555,11 +669,10 @@ class PDFReportGenerator:
             ax.set_ylim(-bh_radius_cm*3, depth_cm*1.1)
             ax.invert_yaxis()
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            fig.savefig(temp_file.name, dpi=150, bbox_inches='tight')
             
             return temp_file.name
         except Exception as e:
@@ -569,108 +682,10 @@ class PDFReportGenerator:
     def _create_static_borehole_graphic(self, params):
         """Erstellt eine statische Erklärungsgrafik einer Erdsonde mit 4 Leitungen (wie in der GUI)."""
         try:
-            from matplotlib.patches import Arc
-            
-            fig, ax = plt.subplots(figsize=(5.5, 8), facecolor='white')
-            
-            # === SEITLICHE ANSICHT (Schnitt durch Sonde) ===
-            # Boden (braun)
-            ground = Rectangle((0, 0), 10, 15, facecolor='#8B4513', alpha=0.3)
-            ax.add_patch(ground)
+            png = _render_static_borehole_png(params.get('borehole_diameter', 0.152))
             
-            # Bohrloch (hellgrau) - EIN Bohrloch mit 4 Leitungen ENGER zusammen
-            borehole_width = 1.0
-            borehole_center = 5.0
-            borehole = Rectangle((borehole_center - borehole_width/2, 0), borehole_width, 15, 
-                                facecolor='#d9d9d9', edgecolor='black', linewidth=2)
-            ax.add_patch(borehole)
-            
-            # 4 Leitungen ENGER zusammen
-            spacing = 0.2
-            center_offset = spacing * 1.5
-            
-            # Rohr 1 & 2 (links im Bohrloch)
-            ax.plot([borehole_center - center_offset, borehole_center - center_offset], [0, 15], 
-                   color='#ff6b6b', linewidth=5, solid_capstyle='round')
-            ax.plot([borehole_center - center_offset + spacing, borehole_center - center_offset + spacing], [0, 15], 
-                   color='#4ecdc4', linewidth=5, solid_capstyle='round')
-            
-            # Rohr 3 & 4 (rechts im Bohrloch)
-            ax.plot([borehole_center + center_offset - spacing, borehole_center + center_offset - spacing], [0, 15], 
-                   color='#ff6b6b', linewidth=5, solid_capstyle='round')
-            ax.plot([borehole_center + center_offset, borehole_center + center_offset], [0, 15], 
-                   color='#4ecdc4', linewidth=5, solid_capstyle='round')
-            
-            # U-Bogen unten
-            arc1 = Arc((borehole_center - center_offset + spacing/2, 0.3), spacing*1.5, 0.4, 
-                      angle=0, theta1=180, theta2=360, color='black', linewidth=2)
-            arc2 = Arc((borehole_center + center_offset - spacing/2, 0.3), spacing*1.5, 0.4, 
-                      angle=0, theta1=180, theta2=360, color='black', linewidth=2)
-            ax.add_patch(arc1)
-            ax.add_patch(arc2)
-            
-            # === BESCHRIFTUNGEN ===
-            bh_left = borehole_center - borehole_width/2
-            bh_right = borehole_center + borehole_width/2
-            bh_diameter = params.get('borehole_diameter', 0.152)
-            
-            # Durchmesser
-            ax.annotate('', xy=(bh_left, 16), xytext=(bh_right, 16),
-                       arrowprops=dict(arrowstyle='<->', color='black', lw=2))
-            ax.text(borehole_center, 16.6, f'Bohrloch Ø {bh_diameter*1000:.0f}mm', ha='center', fontsize=12, 
-                   fontweight='bold', bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', edgecolor='black'))
-            
-            # Tiefe
-            ax.annotate('', xy=(0.5, 0), xytext=(0.5, 15),
-                       arrowprops=dict(arrowstyle='<->', color='#2196f3', lw=2))
-            ax.text(-0.3, 7.5, 'Tiefe\nbis 100m', ha='center', fontsize=11, 
-                   fontweight='bold', color='#1976d2', rotation=90,
-                   bbox=dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor='#2196f3'))
-            
-            # Verfüllung
-            ax.text(borehole_center, 10, 'Verfüllung\n(Zement-Bentonit)', ha='center', fontsize=10,
-                   bbox=dict(boxstyle='round,pad=0.4', facecolor='#e0e0e0', edgecolor='black'))
-            
-            # Rohrmaterial
-            ax.text(7.5, 12, 'PE 100 RC\nØ 32mm', ha='left', fontsize=10,
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='black'))
-            ax.annotate('', xy=(bh_right + 0.1, 12), xytext=(7.3, 12),
-                       arrowprops=dict(arrowstyle='->', color='black', lw=1.5))
-            
-            # === QUERSCHNITT (größer, ohne Text - nur Nummern) ===
-            from matplotlib.transforms import Bbox
-            ax_inset = fig.add_axes([0.58, 0.52, 0.38, 0.42])
-            
-            # Bohrloch-Kreis
-            bh_circle = Circle((0, 0), 1, facecolor='#d9d9d9', edgecolor='black', linewidth=2.5)
-            ax_inset.add_patch(bh_circle)
-            
-            # 4 Rohre in QUADRAT-Anordnung
-            positions = [(-0.35, 0.35), (0.35, 0.35), (-0.35, -0.35), (0.35, -0.35)]
-            colors_pipes = ['#ff6b6b', '#4ecdc4', '#ff6b6b', '#4ecdc4']
-            
-            for i, ((x, y), color) in enumerate(zip(positions, colors_pipes)):
-                pipe_circle = Circle((x, y), 0.2, facecolor=color, edgecolor='black', linewidth=1.5)
-                ax_inset.add_patch(pipe_circle)
-                ax_inset.text(x, y, str(i+1), ha='center', va='center', 
-                             fontsize=12, fontweight='bold', color='white')
-            
-            ax_inset.set_xlim(-1.1, 1.1)
-            ax_inset.set_ylim(-1.1, 1.1)
-            ax_inset.set_aspect('equal')
-            ax_inset.axis('off')
-            
-            # Hauptgrafik-Einstellungen
-            ax.set_xlim(0, 9)
-            ax.set_ylim(-1, 18)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            
-            fig.tight_layout()
-            
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
+                temp_file.write(png)
             
             return temp_file.name
         except Exception as e:
@@ -682,15 +697,19 @@ class PDFReportGenerator:
         try:
             import numpy as np
             
-            fig, ax = plt.subplots(figsize=(10, 8))
+            fig = Figure(figsize=(10, 8))
+            ax = fig.add_subplot(111)
             
             # Extrahiere Bohrfeld-Daten
             boreField = borefield_result.get('boreField')
             if not boreField:
                 return None
             
-            x_coords = [b.x for b in boreField]
-            y_coords = [b.y for b in boreField]
+            x_coords = borefield_result.get('x_coords')
+            y_coords = borefield_result.get('y_coords')
+            if x_coords is None or y_coords is None:
+                x_coords = np.array([b.x for b in boreField])
+                y_coords = np.array([b.y for b in boreField])
             
             # Plotte Bohrungen
             ax.scatter(x_coords, y_coords, s=300, c='#1f4788', alpha=0.7, 
@@ -703,11 +722,13 @@ class PDFReportGenerator:
             
             # Verbindungslinien (nur für Visualisierung der Abstände)
             if len(x_coords) > 1:
-                # Horizontale Linien
-                for i in range(len(x_coords)-1):
-                    if abs(y_coords[i] - y_coords[i+1]) < 0.1:  # Gleiche Y-Position
-                        ax.plot([x_coords[i], x_coords[i+1]], [y_coords[i], y_coords[i+1]], 
-                               'k--', alpha=0.3, linewidth=1, zorder=1)
+                # Horizontale Linien zwischen Nachbarn mit gleicher Y-Position, als eine Collection
+                from matplotlib.collections import LineCollection
+                points = np.column_stack([x_coords, y_coords])
+                same_row = np.abs(np.diff(y_coords)) < 0.1
+                segments = np.stack([points[:-1][same_row], points[1:][same_row]], axis=1)
+                ax.add_collection(LineCollection(segments, colors='k', linestyles='--',
+                                                 alpha=0.3, linewidths=1, zorder=1))
             
             ax.set_xlabel('X-Position [m]', fontsize=12, fontweight='bold')
             ax.set_ylabel('Y-Position [m]', fontsize=12, fontweight='bold')
@@ -730,12 +751,11 @@ class PDFReportGenerator:
                    fontsize=10, verticalalignment='top',
                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Speichere in temporäre Datei
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            fig.savefig(temp_file.name, dpi=150, bbox_inches='tight')
             
             return temp_file.name
         except Exception as e:
@@ -747,7 +767,8 @@ class PDFReportGenerator:
         try:
             import numpy as np
             
-            fig, ax = plt.subplots(figsize=(12, 7))
+            fig = Figure(figsize=(12, 7))
+            ax = fig.add_subplot(111)
             
             # Extrahiere g-Funktions-Daten
             gFunc = borefield_result.get('gFunction')
@@ -791,12 +812,11 @@ class PDFReportGenerator:
                    fontsize=10, verticalalignment='top',
                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Speichere in temporäre Datei
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-            plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-            plt.close(fig)
+            fig.savefig(temp_file.name, dpi=150, bbox_inches='tight')
             
             return temp_file.name
         except Exception as e:
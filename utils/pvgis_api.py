@@ -8,25 +8,104 @@ https://joint-research-centre.ec.europa.eu/photovoltaic-geographical-information
 
 import requests
 import json
+import os
+import threading
 from typing import Dict, Optional, Tuple
 
+from .paths import CACHE_DIR
+
+
+# Persistenter Cache für PVGIS-Antworten (Schlüssel: gerundete Koordinaten)
+CACHE_FILE = os.path.join(CACHE_DIR, "pvgis.json")
+# Maximale Anzahl Einträge; bei Überlauf fällt der am längsten unbenutzte weg
+CACHE_MAX_ENTRIES = 256
+
 
 class PVGISClient:
     """Client für PVGIS API um Klimadaten abzurufen."""
     
     BASE_URL = "https://re.jrc.ec.europa.eu/api/v5_2"
     
+    # Gemeinsame HTTP-Session (Connection-Pooling über mehrere Abfragen)
+    _session: Optional[requests.Session] = None
+    
+    # Im Speicher gehaltener Inhalt von CACHE_FILE (lazy geladen)
+    _cache: Optional[Dict[str, Dict]] = None
+    _cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _cache_key(latitude: float, longitude: float) -> str:
+        """Cache-Schlüssel aus auf 3 Nachkommastellen gerundeten Koordinaten (~100 m)."""
+        return f"{round(latitude, 3):.3f},{round(longitude, 3):.3f}"
+    
+    @staticmethod
+    def _address_key(address: str) -> str:
+        """Cache-Schlüssel für Geocoding-Ergebnisse (normalisierte Adresse)."""
+        return "addr:" + " ".join(address.lower().split())
+    
+    @classmethod
+    def _lookup_cache(cls, key: str):
+        """Liest einen Cache-Eintrag und markiert ihn als zuletzt benutzt."""
+        with cls._cache_lock:
+            cache = cls._load_cache()
+            value = cache.pop(key, None)
+            if value is not None:
+                cache[key] = value
+            return value
+    
+    @classmethod
+    def _load_cache(cls) -> Dict[str, Dict]:
+        """Lädt den Cache beim ersten Zugriff von der Festplatte."""
+        if cls._cache is None:
+            try:
+                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cls._cache = json.load(f)
+            except (OSError, ValueError):
+                cls._cache = {}
+        return cls._cache
+    
+    @classmethod
+    def _store_in_cache(cls, key: str, data) -> None:
+        """Legt eine Antwort im Cache ab und schreibt die Cache-Datei neu."""
+        with cls._cache_lock:
+            cache = cls._load_cache()
+            cache.pop(key, None)
+            cache[key] = data
+            # Dicts behalten die Einfügereihenfolge: vorne steht der älteste Eintrag
+            while len(cache) > CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp_file = CACHE_FILE + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_file, CACHE_FILE)
+            except OSError as e:
+                print(f"PVGIS-Cache konnte nicht gespeichert werden: {e}")
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Gibt die wiederverwendbare HTTP-Session zurück."""
+        if cls._session is None:
+            cls._session = requests.Session()
+        return cls._session
+    
     @staticmethod
     def get_monthly_temperature_data(
         latitude: float,
-        longitude: float
+        longitude: float,
+        use_cache: bool = True
     ) -> Optional[Dict]:
         """
         Holt monatliche Temperaturdaten von PVGIS.
         
+        Bereits abgefragte Standorte werden aus dem lokalen Cache
+        (CACHE_FILE) beantwortet, ohne erneute Netzwerkanfrage.
+        
         Args:
             latitude: Breitengrad (z.B. 51.5 für Deutschland)
             longitude: Längengrad (z.B. 10.0 für Deutschland)
+            use_cache: Lokalen Cache verwenden
             
         Returns:
             Dictionary mit Klimadaten oder None bei Fehler
@@ -35,6 +114,23 @@ class PVGISClient:
             PVGIS bietet primär Solardaten. Für detaillierte Temperaturdaten
             sollten zusätzlich nationale Wetterdienste verwendet werden.
         """
+        key = PVGISClient._cache_key(latitude, longitude)
+        if use_cache:
+            cached = PVGISClient._lookup_cache(key)
+            if cached is not None:
+                print(f"PVGIS-Daten für {key} aus Cache")
+                return dict(cached)
+        
+        data = PVGISClient._fetch_monthly_temperature_data(latitude, longitude)
+        if data is not None:
+            print(f"PVGIS-Daten für {key} von PVGIS geladen")
+            if use_cache:
+                PVGISClient._store_in_cache(key, data)
+        return data
+    
+    @staticmethod
+    def _fetch_monthly_temperature_data(latitude: float, longitude: float) -> Optional[Dict]:
+        """Fragt die TMY-Daten per HTTP bei PVGIS ab (ohne Cache)."""
         try:
             # TMY (Typical Meteorological Year) Daten abrufen
             url = f"{PVGISClient.BASE_URL}/tmy"
@@ -46,7 +142,7 @@ class PVGISClient:
                 'browser': '0'
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = PVGISClient._get_session().get(url, params=params, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -115,19 +211,36 @@ class PVGISClient:
             return None
     
     @staticmethod
-    def get_location_from_address(address: str) -> Optional[Tuple[float, float]]:
+    def get_location_from_address(address: str, use_cache: bool = True) -> Optional[Tuple[float, float]]:
         """
         Konvertiert eine Adresse in Koordinaten (Geocoding).
         
+        Bereits aufgelöste Adressen werden aus dem lokalen Cache beantwortet.
+        
         Hinweis: Dies erfordert einen Geocoding-Service wie OpenStreetMap Nominatim.
         Für Produktionsumgebungen sollte ein dedizierter Service verwendet werden.
         
         Args:
             address: Adresse als String
+            use_cache: Lokalen Cache verwenden
             
         Returns:
             Tuple (latitude, longitude) oder None
         """
+        key = PVGISClient._address_key(address)
+        if use_cache:
+            cached = PVGISClient._lookup_cache(key)
+            if cached is not None:
+                return tuple(cached)
+        
+        coords = PVGISClient._geocode(address)
+        if coords is not None and use_cache:
+            PVGISClient._store_in_cache(key, list(coords))
+        return coords
+    
+    @staticmethod
+    def _geocode(address: str) -> Optional[Tuple[float, float]]:
+        """Löst eine Adresse per Nominatim auf (ohne Cache)."""
         try:
             # OpenStreetMap Nominatim für Geocoding
             url = "https://nominatim.openstreetmap.org/search"
@@ -142,7 +255,7 @@ class PVGISClient:
                 'User-Agent': 'GeothermieErdsonden-Tool/2.0'
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = PVGISClient._get_session().get(url, params=params, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 results = response.json()
@@ -213,6 +326,9 @@ FALLBACK_CLIMATE_DATA = {
     }
 }
 
+# Regionsnamen für Auswahllisten (einmalig beim Import ermittelt)
+FALLBACK_CLIMATE_KEYS = tuple(FALLBACK_CLIMATE_DATA)
+
 
 def get_climate_data(latitude: float, longitude: float) -> Optional[Dict]:
     """